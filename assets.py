@@ -0,0 +1,152 @@
+"""
+compiles the image assets into small text artifacts next to the images, so that elaborating
+the design only needs PIL and the per pixel image work when an image actually changed
+
+    python assets.py jp2smol_indexed.png     # compile (or recompile) by hand, and report the rom and mux sizes
+
+the artifact is a $readmemh compatible .mem file, the header comments hold the format version,
+the sha256 of the source image, the size and the palette, followed by one line of hex palette
+indexes per row of the sprite. the palette in the artifact is already optimized for the 3 bit per
+channel output, see optimize_palette
+"""
+import hashlib
+import os
+
+FORMAT_VERSION = 2
+
+
+class Sprite:
+    def __init__(self, width, height, pixels, palette):
+        self.width = width
+        self.height = height
+        # pixels[y][x] is a palette index, 0 is transparent
+        self.pixels = pixels
+        # palette[i] is the 3 bit per channel (r, g, b) of index i, entry 0 is unused
+        self.palette = palette
+
+
+def compile_sprite(path, optimize=True):
+    from PIL import Image
+
+    with Image.open(path) as image:
+        bbox = image.getbbox()
+        width = bbox[2] - bbox[0]
+        height = bbox[3] - bbox[1]
+        rgb = image.getpalette("RGB")
+
+        # only indexes 1 to 30 have a colour, anything else is drawn as transparent
+        palette = [(0, 0, 0)] + [(rgb[i * 3] >> 5, rgb[i * 3 + 1] >> 5, rgb[i * 3 + 2] >> 5) for i in range(1, 31)]
+        pixels = []
+        for y in range(height):
+            row = []
+            for x in range(width):
+                data = image.getpixel((bbox[0] + x, bbox[1] + y))
+                row.append(data if data < len(palette) else 0)
+            pixels.append(row)
+
+    sprite = Sprite(width, height, pixels, palette)
+    return optimize_palette(sprite) if optimize else sprite
+
+
+def optimize_palette(sprite: Sprite):
+    """
+    merges the palette entries that are the same colour at 3 bits per channel and drops the ones
+    no pixel uses, so the index is as narrow as it can be. the entries keep their order, so a
+    palette that can't be made smaller comes out unchanged. 0 stays transparent
+    """
+    used = {data for row in sprite.pixels for data in row}
+    palette = [sprite.palette[0]]
+    remap = {0: 0}
+    for index, colour in enumerate(sprite.palette):
+        if index == 0 or index not in used:
+            continue
+        if colour not in palette[1:]:
+            palette.append(colour)
+        remap[index] = palette.index(colour, 1)
+    pixels = [[remap[data] for data in row] for row in sprite.pixels]
+    return Sprite(sprite.width, sprite.height, pixels, palette)
+
+
+def write_sprite(path, sprite: Sprite, source_hash):
+    with open(path, "w") as file:
+        file.write(f"// sprite {FORMAT_VERSION} {source_hash}\n")
+        file.write(f"// size {sprite.width} {sprite.height}\n")
+        file.write("// palette " + " ".join(f"{r}{g}{b}" for r, g, b in sprite.palette) + "\n")
+        for row in sprite.pixels:
+            file.write(" ".join(f"{data:02x}" for data in row) + "\n")
+
+
+def read_sprite(path):
+    """
+    returns the (format version, source hash, sprite) stored in an artifact,
+    raises ValueError if the file isn't a sprite artifact
+    """
+    with open(path) as file:
+        lines = file.read().splitlines()
+    try:
+        _, kind, version, source_hash = lines[0].split()
+        _, _, width, height = lines[1].split()
+        palette = [tuple(int(channel) for channel in entry) for entry in lines[2].split()[2:]]
+        pixels = [[int(data, 16) for data in line.split()] for line in lines[3:]]
+    except (IndexError, ValueError):
+        raise ValueError(f"{path} is not a sprite artifact")
+    if kind != "sprite":
+        raise ValueError(f"{path} is not a sprite artifact")
+    return int(version), source_hash, Sprite(int(width), int(height), pixels, palette)
+
+
+def artifact_path(path):
+    return os.path.splitext(path)[0] + ".mem"
+
+
+_sprites = {}
+
+def load_sprite(path):
+    """
+    load a sprite from the artifact next to the image, compiling it first if the artifact
+    is missing, from another format version or from a different image.
+    sprites are also kept in memory by content hash, so elaborating the design again is free
+    """
+    with open(path, "rb") as file:
+        source_hash = hashlib.sha256(file.read()).hexdigest()
+    if source_hash in _sprites:
+        return _sprites[source_hash]
+
+    sprite = None
+    try:
+        version, artifact_hash, cached = read_sprite(artifact_path(path))
+        if version == FORMAT_VERSION and artifact_hash == source_hash:
+            sprite = cached
+    except (OSError, ValueError):
+        pass
+
+    if sprite is None:
+        sprite = compile_sprite(path)
+        write_sprite(artifact_path(path), sprite, source_hash)
+
+    _sprites[source_hash] = sprite
+    return sprite
+
+
+if __name__ == "__main__":
+    import sys
+
+    from main import encode_runs
+
+    def sizes(sprite):
+        """the index width, rom bits and palette mux cases of main.SpriteRom and main.VGAOutput"""
+        row_starts, runs = encode_runs(sprite.pixels)
+        index_width = (len(sprite.palette) - 1).bit_length()
+        length_width = max(length for _, length, _ in runs).bit_length()
+        rom_bits = len(runs) * (index_width + length_width + 1) + len(row_starts) * (len(runs) - 1).bit_length()
+        return index_width, rom_bits, len(sprite.palette) - 1
+
+    for path in sys.argv[1:]:
+        with open(path, "rb") as file:
+            source_hash = hashlib.sha256(file.read()).hexdigest()
+        sprite = compile_sprite(path)
+        write_sprite(artifact_path(path), sprite, source_hash)
+        print(f"{path} -> {artifact_path(path)} ({sprite.width}x{sprite.height}, {len(sprite.palette)} colours)")
+        before = sizes(compile_sprite(path, optimize=False))
+        after = sizes(sprite)
+        print(f"  index {before[0]} -> {after[0]} bits, rom {before[1]} -> {after[1]} bits, palette mux {before[2]} -> {after[2]} cases")
@@ -0,0 +1,131 @@
+"""
+measures how long it takes to elaborate and convert every design to verilog, how much memory
+that needs at its peak and how big the verilog comes out, and writes the numbers to a json file
+
+    python bench.py                                 # every design, results in bench.json
+    python bench.py ray_march.Top(32,32)            # only some designs
+    python bench.py --output new.json --compare bench.json
+
+the time is the best of --repeat runs, the peak memory is what tracemalloc sees of the python
+heap on a run of its own, since tracing slows everything down a lot. the yosys that turns rtlil
+into verilog keeps its memory outside of that
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import amaranth
+from amaranth.back.verilog import convert
+
+import main
+import ray_march
+
+
+def _main_top(sprite):
+    mod = main.Top(sprite=sprite)
+    return mod, [mod.o_r, mod.o_g, mod.o_b, mod.o_hsync, mod.o_vsync, mod.i_move_up, mod.i_move_down, mod.i_player_two_up, mod.i_player_two_down, mod.i_player_two_active]
+
+
+def _ray_march_top(x_res, y_res):
+    mod = ray_march.Top(x_res, y_res)
+    return mod, [mod.o_r, mod.o_g, mod.o_b, mod.o_hsync, mod.o_vsync]
+
+
+def _cordic():
+    mod = ray_march.Cordic()
+    return mod, [mod.i_value, mod.i_start, mod.o_cos, mod.o_sin, mod.o_done]
+
+
+# every design is built from scratch for every run, so that nothing elaborated is shared between runs
+DESIGNS = {
+    "main.Top": lambda: _main_top("rle"),
+    "main.Top(sprite=switch)": lambda: _main_top("switch"),
+    "ray_march.Top(4,4)": lambda: _ray_march_top(4, 4),
+    "ray_march.Top(8,8)": lambda: _ray_march_top(8, 8),
+    "ray_march.Top(16,16)": lambda: _ray_march_top(16, 16),
+    "ray_march.Top(32,32)": lambda: _ray_march_top(32, 32),
+    "ray_march.Cordic": _cordic,
+}
+
+
+def _convert(design):
+    mod, ports = DESIGNS[design]()
+    return convert(mod, name="top", ports=ports, emit_src=False)
+
+
+def measure(design, repeat=1):
+    """returns a dict with the convert time in seconds, the peak traced memory in bytes and the size of the verilog"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        verilog = _convert(design)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    gc.collect()
+    tracemalloc.start()
+    _convert(design)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "convert_seconds": best,
+        "peak_memory_bytes": peak,
+        "verilog_bytes": len(verilog),
+        "verilog_lines": verilog.count("\n"),
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    print(f"{'':<26}{'convert':>10}{'peak':>10}{'verilog':>10}")
+    for design, result in results.items():
+        line = (f"{design:<26}{result['convert_seconds']:>9.2f}s{result['peak_memory_bytes'] / 2**20:>8.1f}MB"
+            f"{result['verilog_bytes'] / 1024:>8.0f}KB")
+        old = (baseline or {}).get(design)
+        if old is not None:
+            changes = [(result[key] - old[key]) / old[key] for key in ("convert_seconds", "peak_memory_bytes", "verilog_bytes")]
+            line += "   " + " ".join(f"{change:+.0%}" for change in changes)
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("designs", nargs="*", metavar="DESIGN", help=f"designs to measure, out of {', '.join(DESIGNS)}")
+    parser.add_argument("--output", default="bench.json", help="json file to write the results to")
+    parser.add_argument("--repeat", type=int, default=1, help="take the fastest of this many conversions")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results to print the changes against")
+    args = parser.parse_args()
+
+    for design in args.designs:
+        if design not in DESIGNS:
+            parser.error(f"unknown design {design}, pick from {', '.join(DESIGNS)}")
+
+    results = {}
+    for design in args.designs or DESIGNS:
+        results[design] = measure(design, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+    print_results(results, baseline)
+
+    with open(args.output, "w") as file:
+        json.dump({
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "amaranth": amaranth.__version__,
+            "results": results,
+        }, file, indent=2)
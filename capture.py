@@ -0,0 +1,138 @@
+"""
+rebuilds the frames a design draws from its vga outputs while it is being simulated, and
+streams every finished frame to png files or to a .npy stack without keeping more than one
+frame in memory
+
+    python main.py --frames 5 --capture frames/pong_{:04}.png
+    python ray_march.py --frames 5 --capture frames.npy
+
+the position of the beam is recovered from the falling edges of hsync and vsync, so nothing
+is drawn until the first vsync, and the partial frame that is being drawn when the
+simulation stops is dropped. every read from the simulator costs more than a clock of the
+design, so capturing makes the simulation a few times slower, but unlike a vcd the output
+doesn't grow with anything but the number of frames
+"""
+import os
+
+import numpy as np
+
+from amaranth import Cat
+
+
+class PngWriter:
+    """writes every frame to its own png, the path is formatted with the frame number"""
+    def __init__(self, pattern):
+        from PIL import Image
+
+        self._image = Image
+        self.pattern = pattern if "{" in pattern else "{:04}".join(os.path.splitext(pattern))
+        self.count = 0
+
+    def write(self, frame):
+        # scale the 3 bit channels up to the full 8 bits
+        pixels = (frame.astype(np.uint16) * 255 // 7).astype(np.uint8)
+        self._image.fromarray(pixels, "RGB").save(self.pattern.format(self.count))
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+class NpyWriter:
+    """
+    appends every frame to a (n, height, width, 3) uint8 .npy file. the header is written with a fixed
+    length up front and rewritten with the final count and size when the writer is closed
+    """
+    HEADER_LENGTH = 128
+
+    def __init__(self, path):
+        self._file = open(path, "wb")
+        self.count = 0
+        self.shape = (0, 0, 3)
+        self._file.write(self._header())
+
+    def _header(self):
+        height, width, _ = self.shape
+        header = f"{{'descr': '|u1', 'fortran_order': False, 'shape': ({self.count}, {height}, {width}, 3), }}"
+        header = header.ljust(self.HEADER_LENGTH - 10 - 1) + "\n"
+        return b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1")
+
+    def write(self, frame):
+        self.shape = frame.shape
+        self._file.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        self.count += 1
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+
+
+def open_writer(path):
+    if path.endswith(".npy"):
+        return NpyWriter(path)
+    return PngWriter(path)
+
+
+class FrameCapture:
+    """
+    samples o_r, o_g, o_b, o_hsync and o_vsync of mod and hands every complete frame to writer.
+    the timing comes from the VGAOutput that drives the outputs
+    """
+    def __init__(self, mod, vga, writer):
+        self.mod = mod
+        self.writer = writer
+        self.line_length = vga.line_length
+        self.screen_length = vga.screen_length
+        self.hsync_start = vga.hsync_start
+        self.vsync_start = vga.vsync_start
+        self.width = vga.mode.width
+        self.height = vga.mode.height
+        # the syncs are read as active low, whatever the mode has them as
+        self.sync_flip = 0b11 if vga.mode.sync_high else 0
+
+        self.frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def process(self):
+        """a sync process for the pix domain, add it with sim.simulate(..., processes=[capture.process])"""
+        colour = Cat(self.mod.o_r, self.mod.o_g, self.mod.o_b)
+        syncs = Cat(self.mod.o_hsync, self.mod.o_vsync)
+        frame = self.frame
+
+        while True:
+            # find the beam from the falling edges of the syncs, this needs them every clock
+            x = None
+            prev_syncs = 0b11
+            while True:
+                value = (yield syncs) ^ self.sync_flip
+                if prev_syncs & 1 and not value & 1:
+                    x = self.hsync_start
+                if prev_syncs & 2 and not value & 2 and x is not None:
+                    break
+                prev_syncs = value
+                if x is not None:
+                    x = (x + 1) % self.line_length
+                yield
+            y = self.vsync_start
+            complete = False
+
+            # after that the timing is known, so only the colours of the visible pixels and the syncs
+            # once per line are read, every read costs about as much as simulating a clock
+            while True:
+                if x < self.width and y < self.height:
+                    value = yield colour
+                    frame[y, x] = (value & 7, value >> 3 & 7, value >> 6 & 7)
+                elif x == self.hsync_start:
+                    value = (yield syncs) ^ self.sync_flip
+                    if value & 1 or (y == self.vsync_start and value & 2) or (y == 0 and not value & 2):
+                        # out of step with the design, drop the frame and look for the syncs again
+                        break
+                elif x == 0 and y == self.height and complete:
+                    self.writer.write(frame)
+                if x == 0 and y == 0:
+                    complete = True
+                yield
+                x += 1
+                if x == self.line_length:
+                    x = 0
+                    y = 0 if y == self.screen_length - 1 else y + 1
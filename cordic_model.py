@@ -0,0 +1,265 @@
+"""
+a bit exact numpy model of ray_march.Cordic and ray_march.PipelinedCordic, which work out the same
+numbers, and of ray_march.SineTable, evaluated for every one of the 2^19 input angles at once
+
+    python cordic_model.py                                  # sweep the iterations and the datapath width
+    python cordic_model.py --iterations 12 14 16 --fraction 16 18 --table 6 8
+    python cordic_model.py --check 2000                     # compare random angles against the amaranth simulation
+    python cordic_model.py --check 2000 --table 8 --interpolate
+
+the sweep shows the max and rms error of o_sin and o_cos against math.sin/cos in units of 2^-16,
+the clocks per pixel of the iterative cordic and how many angles get a different 3 bit colour in
+ray_march.Top, against the colour of the exact sin/cos and against the colour the default
+cordic makes. the angles past 2pi are left out of the errors, Top never asks for them. the
+SineTables are swept the same way, each with and without interpolation
+
+most of the max error is x, which is unsigned in the gateware, wrapping when it swings below zero
+on the way to the angles close to pi/2 and 3pi/2. the model keeps that, it is what the hardware does
+"""
+import numpy as np
+
+try:
+    from .trig_tables import HALF_PI, PI, TWO_PI, atan_table, cordic_gain, sine_table as table_entries
+except ImportError:
+    from trig_tables import HALF_PI, PI, TWO_PI, atan_table, cordic_gain, sine_table as table_entries
+
+ANGLES = 1 << 19
+
+
+def _wrap(values, width, signed=False):
+    values = values & ((1 << width) - 1)
+    if signed:
+        values = np.where(values >> (width - 1) != 0, values - (1 << width), values)
+    return values
+
+
+def _fold(values):
+    """ray_march.fold_quadrant, the folded angles and whether sin and cos are positive. the subtractions can go negative past 2pi"""
+    post_sin_fix = np.where(values >= PI, TWO_PI - values, values)
+    final_fixed = np.where(post_sin_fix >= HALF_PI, PI - post_sin_fix, post_sin_fix)
+    return final_fixed, ~(values > PI), ~(post_sin_fix > HALF_PI)
+
+
+def cordic(values=None, iterations=19, fraction=18):
+    """
+    returns (sin, cos) int64 arrays with what o_sin and o_cos are for the 3.16 angles in values,
+    all 2^19 of them by default. every step is done at the widths of the gateware, so the
+    wrapping and the truncation come out the same
+    """
+    if values is None:
+        values = np.arange(ANGLES, dtype=np.int64)
+    values = np.asarray(values, dtype=np.int64)
+
+    final_fixed, sin_pos, cos_pos = _fold(values)
+    if fraction >= 16:
+        intermediate = _wrap(final_fixed << (fraction - 16), fraction + 1)
+    else:
+        intermediate = _wrap(final_fixed >> (16 - fraction), fraction + 1)
+
+    theta = np.zeros_like(values)
+    x = np.full_like(values, 1 << fraction)
+    y = np.zeros_like(values)
+    for i, lut_val in enumerate(atan_table(iterations, fraction)):
+        sigma = np.where(theta < intermediate, 1, -1)
+        theta, x, y = (
+            _wrap(theta + sigma * lut_val, fraction + 2, signed=True),
+            _wrap(x - ((sigma * y) >> i), fraction + 1),
+            _wrap(y + ((sigma * x) >> i), fraction + 2, signed=True),
+        )
+
+    gain = cordic_gain(iterations)
+    cos = _wrap(((x * gain) >> (fraction - 8)) * np.where(cos_pos, 1, -1), 18, signed=True)
+    sin = _wrap(((y * gain) >> (fraction - 8)) * np.where(sin_pos, 1, -1), 18, signed=True)
+    return sin, cos
+
+
+def sine_table(values=None, shift=8, interpolate=False):
+    """returns (sin, cos) int64 arrays with what o_sin and o_cos of a SineTable are, only for angles up to 2pi"""
+    if values is None:
+        values = np.arange(TWO_PI + 1, dtype=np.int64)
+    values = np.asarray(values, dtype=np.int64)
+    entries = table_entries(shift)
+    table = np.array(entries, dtype=np.int64)
+    next_table = np.array(entries[1:] + entries[-1:], dtype=np.int64)
+
+    final_fixed, sin_pos, cos_pos = _fold(values)
+    sin_angle = final_fixed
+    cos_angle = np.where(final_fixed > HALF_PI, 0, HALF_PI - final_fixed)
+
+    def lookup(angle):
+        index = angle >> shift
+        if not interpolate or shift == 0:
+            return table[index]
+        step = _wrap(next_table[index] - table[index], 18, signed=True)
+        return table[index] + ((step * (angle & ((1 << shift) - 1))) >> shift)
+
+    sin = _wrap(lookup(sin_angle) * np.where(sin_pos, 1, -1), 18, signed=True)
+    cos = _wrap(lookup(cos_angle) * np.where(cos_pos, 1, -1), 18, signed=True)
+    return sin, cos
+
+
+def colour(values):
+    """the 3 bit channel ray_march.Top makes of an o_sin or o_cos"""
+    return (_wrap((values >> 1) + 2**15, 18) >> 14) & 7
+
+
+def exact(values=None):
+    """(sin, cos) of the angles in units of 2^-16 as float arrays"""
+    if values is None:
+        values = np.arange(ANGLES, dtype=np.int64)
+    angles = np.asarray(values, dtype=np.float64) / 2**16
+    return np.sin(angles) * 2**16, np.cos(angles) * 2**16
+
+
+def sweep(iterations_list, fraction_list, shifts=()):
+    """
+    returns a dict per (iterations, fraction) pair and per SineTable shift and interpolation with
+    the errors and colour mismatches of the visible angles
+    """
+    angles = np.arange(TWO_PI + 1, dtype=np.int64)
+    exact_sin, exact_cos = exact(angles)
+    ideal = colour(np.round(exact_sin).astype(np.int64)), colour(np.round(exact_cos).astype(np.int64))
+    default = [colour(values) for values in cordic(angles)]
+
+    def result(sin, cos, **config):
+        errors = np.concatenate([sin - exact_sin, cos - exact_cos])
+        colours = colour(sin), colour(cos)
+        return {
+            **config,
+            "max_error": float(np.abs(errors).max()),
+            "rms_error": float(np.sqrt(np.mean(errors**2))),
+            "ideal_mismatches": int(sum(np.count_nonzero(a != b) for a, b in zip(colours, ideal))),
+            "default_mismatches": int(sum(np.count_nonzero(a != b) for a, b in zip(colours, default))),
+        }
+
+    results = []
+    for fraction in fraction_list:
+        for iterations in iterations_list:
+            if not 1 <= iterations <= fraction + 1:
+                continue
+            results.append(result(*cordic(angles, iterations, fraction), iterations=iterations, fraction=fraction, clocks=iterations + 2))
+    for shift in shifts:
+        for interpolate in (False, True):
+            results.append(result(*sine_table(angles, shift, interpolate), shift=shift, interpolate=interpolate,
+                                  entries=(HALF_PI >> shift) + 2, clocks=1))
+    return results
+
+
+def check_against_simulation(count, iterations=19, fraction=18, seed=0, pipeline=None, shift=None, interpolate=False):
+    """
+    runs random angles, some of them past 2pi, through the gateware in the amaranth simulator and
+    returns the (angle, expected, actual) triples that differ from the model. with pipeline a
+    PipelinedCordic with that many stages is fed an angle every clock instead, and with shift a
+    SineTable is, only with angles up to 2pi
+    """
+    from amaranth.sim import Simulator
+    import ray_march
+
+    rng = np.random.default_rng(seed)
+    if shift is None:
+        values = rng.integers(0, ANGLES, count)
+        expected = cordic(values, iterations, fraction)
+    else:
+        values = rng.integers(0, TWO_PI + 1, count)
+        expected = sine_table(values, shift, interpolate)
+    expected = list(zip(*(array.tolist() for array in expected)))
+    if shift is not None:
+        mod = ray_march.SineTable(shift, interpolate)
+    elif pipeline is None:
+        mod = ray_march.Cordic(iterations, fraction)
+    else:
+        mod = ray_march.PipelinedCordic(pipeline, iterations, fraction)
+    mismatches = []
+
+    def compare(angle, wanted):
+        actual = ((yield mod.o_sin), (yield mod.o_cos))
+        if actual != wanted:
+            mismatches.append((angle, wanted, actual))
+
+    def iterative():
+        for angle, wanted in zip(values.tolist(), expected):
+            yield mod.i_value.eq(angle)
+            yield mod.i_start.eq(1)
+            yield
+            yield mod.i_start.eq(0)
+            yield
+            while not (yield mod.o_done):
+                yield
+            yield from compare(angle, wanted)
+
+    def pipelined():
+        # a sync process sees the values from before the edge, so an angle is read latency + 1 yields after it went in
+        angles = values.tolist()
+        for clock in range(count + mod.latency):
+            if clock < count:
+                yield mod.i_value.eq(angles[clock])
+                yield mod.i_start.eq(1)
+            else:
+                yield mod.i_start.eq(0)
+            yield
+            done = clock - mod.latency
+            if done >= 0:
+                yield from compare(angles[done], expected[done])
+
+    sim = Simulator(mod)
+    sim.add_clock(1e-6, domain="pix")
+    sim.add_sync_process(iterative if pipeline is None and shift is None else pipelined, domain="pix")
+    sim.run()
+    return mismatches
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, nargs="+", default=list(range(10, 20)), help="rotations to sweep")
+    parser.add_argument("--fraction", type=int, nargs="+", default=[14, 16, 18, 20], help="fractional bits of the datapath to sweep")
+    parser.add_argument("--check", type=int, default=0, metavar="ANGLES", help="compare this many random angles against the amaranth simulation instead")
+    parser.add_argument("--pipeline", type=int, metavar="STAGES", help="check a PipelinedCordic with this many stages")
+    parser.add_argument("--table", type=int, nargs="*", metavar="SHIFT", help="SineTables to sweep, 4 6 8 10 12 by default, or to check instead of the cordics")
+    parser.add_argument("--interpolate", action="store_true", help="check the SineTables with interpolation")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random angles")
+    args = parser.parse_args()
+
+    if args.check and args.table:
+        for shift in args.table:
+            mismatches = check_against_simulation(args.check, seed=args.seed, shift=shift, interpolate=args.interpolate)
+            for angle, expected, actual in mismatches[:10]:
+                print(f"angle {angle}: expected (sin, cos) {expected}, got {actual}")
+            print(f"table shift {shift}{', interpolated' if args.interpolate else ''}: {args.check} angles checked, {len(mismatches)} mismatches")
+            if mismatches:
+                raise SystemExit(1)
+        raise SystemExit(0)
+
+    if args.check:
+        for fraction in args.fraction:
+            for iterations in args.iterations:
+                if not 1 <= iterations <= fraction + 1:
+                    continue
+                mismatches = check_against_simulation(args.check, iterations, fraction, args.seed, args.pipeline)
+                for angle, expected, actual in mismatches[:10]:
+                    print(f"angle {angle}: expected (sin, cos) {expected}, got {actual}")
+                print(f"{iterations} iterations, {fraction} fractional bits: {args.check} angles checked, {len(mismatches)} mismatches")
+                if mismatches:
+                    raise SystemExit(1)
+        raise SystemExit(0)
+
+    start = time.perf_counter()
+    if args.table is None:
+        args.table = [4, 6, 8, 10, 12]
+    results = sweep(args.iterations, args.fraction, args.table)
+    elapsed = time.perf_counter() - start
+    print(f"{'iters':>5} {'frac':>4} {'clocks':>6} {'max err':>8} {'rms err':>8} {'vs exact':>9} {'vs 19/18':>9}")
+    for result in results:
+        if "iterations" in result:
+            print(f"{result['iterations']:>5} {result['fraction']:>4} {result['clocks']:>6} {result['max_error']:>8.2f} {result['rms_error']:>8.2f} "
+                  f"{result['ideal_mismatches']:>9} {result['default_mismatches']:>9}")
+    if args.table:
+        print()
+        print(f"{'shift':>5} {'interp':>6} {'entries':>7} {'clocks':>6} {'max err':>8} {'rms err':>8} {'vs exact':>9} {'vs 19/18':>9}")
+    for result in results:
+        if "shift" in result:
+            print(f"{result['shift']:>5} {'yes' if result['interpolate'] else 'no':>6} {result['entries']:>7} {result['clocks']:>6} "
+                  f"{result['max_error']:>8.2f} {result['rms_error']:>8.2f} {result['ideal_mismatches']:>9} {result['default_mismatches']:>9}")
+    print(f"{len(results)} configurations of {TWO_PI + 1} angles in {elapsed:.2f}s, the colour columns count (angle, channel) pairs")
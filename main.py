@@ -1,8 +1,21 @@
+import os
 from amaranth import *
-from PIL import Image
+from amaranth.lib.cdc import FFSynchronizer
+
+try:
+    from .assets import Sprite, load_sprite
+    from .modes import DEFAULT_MODE
+except ImportError:
+    from assets import Sprite, load_sprite
+    from modes import DEFAULT_MODE
 
 class Top(Elaboratable):
-    def __init__(self):
+    # clocks from the start of vsync until every register holds the new state, one per step
+    UPDATE_CLOCKS = 15
+    # clocks between two samples of the debounced buttons, 2.6ms at 25MHz is longer than a button bounces
+    DEBOUNCE_CLOCKS = 2**16
+
+    def __init__(self, sprite="rle", mode=DEFAULT_MODE):
         self.o_r = Signal(3)
         self.o_g = Signal(3)
         self.o_b = Signal(3)
@@ -16,87 +29,271 @@ class Top(Elaboratable):
         self.i_player_two_down = Signal()
         self.i_player_two_active = Signal()
 
+        # high for one clock once an update is done and every register holds the new state
+        self.o_updated = Signal()
+
+        width = mode.width
+        height = mode.height
+
+        # the game state, made here and not in elaborate so that the telemetry can read it in any order
+        self.pope_location = Signal(22, reset=((height//2 - 20) << 12) + (width//2 - 17)) # reset at (320-20),(240-17) on 640x480 which is the middle of the screen when accounting for the dimensions of the pope
+        self.pope_h_velocity = Signal(1, reset=0)
+        self.pope_v_velocity = Signal(signed(7), reset=-1)
+
+        self.paddle_location = Signal(10, reset=height//2-75)
+        self.enemy_paddle_location = Signal(10, reset=height//2-75)
+
+        self.time_until_start = Signal(range(180), reset=179)
+
+        self.player_score = Signal(3)
+        self.enemy_score = Signal(3)
+
+        self.lfsr = Signal(16, reset=1)
+        # the lfsr on the clock vsync began on and the inputs the last update used
+        self.random = Signal(16)
+        self.taken = Signal(5)
+
+        self.mode = mode
+        self.vga = VGAOutput(mode, sprite=sprite)
+        self.buttons = InputCapture(5, self.DEBOUNCE_CLOCKS)
+
     def elaborate(self, platform):
         m = Module()
-        m.submodules.vga = self.vga = VGAOutput(16, 96, 48, 10, 2, 33)
+        m.submodules.vga = self.vga
+        m.submodules.buttons = self.buttons
         
 
         m.d.comb += self.vga.i_enable.eq(1)
 
+        width = self.mode.width
+        height = self.mode.height
+
         prev_vsync = Signal(1)
         m.d.pix += prev_vsync.eq(self.vga.o_vsync)
-
-        pope_location = Signal(22, reset=((240 - 20) << 12) + (320 - 17)) # reset at (320-20),(240-17) which is the middle of the screen when accounting for the dimensions of the pope
-        pope_h_velocity = Signal(1, reset=0)
-        pope_v_velocity = Signal(signed(7), reset=-1)
-        
-        paddle_location = Signal(10, reset=240-75)
-        enemy_paddle_location = Signal(10, reset=240-75)
-
-        time_until_start = Signal(range(180), reset=179)
-
-        player_score = Signal(3)
-        enemy_score = Signal(3)
-
-
-        lfsr = Signal(16, reset=1)
+        if self.mode.sync_high:
+            vsync_started = ~prev_vsync & self.vga.o_vsync
+        else:
+            vsync_started = prev_vsync & ~self.vga.o_vsync
+
+        pope_location = self.pope_location
+        pope_h_velocity = self.pope_h_velocity
+        pope_v_velocity = self.pope_v_velocity
+        paddle_location = self.paddle_location
+        enemy_paddle_location = self.enemy_paddle_location
+        time_until_start = self.time_until_start
+        player_score = self.player_score
+        enemy_score = self.enemy_score
+
+        lfsr = self.lfsr
         m.d.pix += lfsr.eq(Cat(lfsr[10] ^ lfsr[12] ^ lfsr[13] ^ lfsr[15], lfsr[0:15]))
 
 
-        with m.If(prev_vsync & ~self.vga.o_vsync): # we just entered vsync, do all logic now
-            with m.If(time_until_start > 0):
-                m.d.pix += time_until_start.eq(time_until_start - 1)
-                m.d.pix += pope_v_velocity.eq(lfsr[0:4].as_signed())
-            with m.Else():
-                with m.If(pope_h_velocity):
-                    m.d.pix += pope_location[0:10].eq(pope_location[0:10] + 3)
-                with m.Else():
-                    m.d.pix += pope_location[0:10].eq(pope_location[0:10] - 3)
-                m.d.pix += pope_location[10:22].eq(pope_location[10:22] + 3 * pope_v_velocity)
-                
-                with m.If(pope_location[12:22] <= 20):
-                    m.d.pix += pope_v_velocity.eq(Mux(pope_v_velocity > 0, pope_v_velocity, -pope_v_velocity))
-                with m.If(pope_location[12:22] >= 480 - 40):
-                    m.d.pix += pope_v_velocity.eq(Mux(pope_v_velocity < 0, pope_v_velocity, -pope_v_velocity))
-
-                with m.If((pope_h_velocity == 0) & (pope_location[0:10] < 50) & ((pope_location[12:22] > paddle_location - 40) & (pope_location[12:22] <= paddle_location + 150))):
+        # the game logic runs as a sequence of small steps that all share one adder, starting the
+        # clock after vsync begins. every step works on the values from before the update, like a
+        # single big update would, and the random bits are kept from the clock vsync began on. the
+        # sequence is done long before the end of vblank, see UPDATE_CLOCKS
+        pope_x = pope_location[0:10]
+        pope_y = pope_location[12:22]
+
+        add_a = Signal(signed(12))
+        add_b = Signal(signed(12))
+        add_sum = Signal(signed(12))
+        m.d.comb += add_sum.eq(add_a + add_b)
+
+        # what one step leaves for the next ones
+        acc = Signal(signed(12))
+        angle = Signal(signed(7))
+        # the whole lfsr is kept for the telemetry, the update only uses the low bits
+        random = self.random
+        hit_player = Signal()
+        hit_enemy = Signal()
+        enemy_follow_down = Signal()
+        enemy_follow_up = Signal()
+        bounce_top = Signal()
+        bounce_bottom = Signal()
+        enemy_scored = Signal()
+        player_scored = Signal()
+        paddle_step = Signal(signed(3))
+        enemy_step = Signal(signed(3))
+
+        # the buttons pressed since the last update, taken on the clock vsync began on
+        m.d.comb += self.buttons.i_buttons.eq(Cat(self.i_move_up, self.i_move_down, self.i_player_two_up, self.i_player_two_down, self.i_player_two_active))
+        taken = self.taken
+        move_up = taken[0]
+        move_down = taken[1]
+        player_two_up = taken[2]
+        player_two_down = taken[3]
+        player_two_active = taken[4]
+
+        m.d.pix += self.o_updated.eq(0)
+
+        with m.FSM(domain="pix"):
+            with m.State("idle"):
+                with m.If(vsync_started):
+                    m.d.comb += self.buttons.i_take.eq(1)
                     m.d.pix += [
-                        pope_h_velocity.eq(1),
-                        pope_v_velocity.eq(((pope_location[12:22] - paddle_location - 55) >> 3) + lfsr[0:3].as_signed())
+                        random.eq(lfsr),
+                        taken[0:4].eq(self.buttons.o_pressed[0:4]),
+                        # whether player two plays is a switch, so it is the level and not a press
+                        player_two_active.eq(self.buttons.o_level[4]),
+                    ]
+                    m.next = "start"
+
+            with m.State("start"):
+                with m.If(time_until_start > 0):
+                    m.d.comb += [
+                        add_a.eq(time_until_start),
+                        add_b.eq(-1),
                     ]
-                    
-                with m.If((pope_h_velocity == 1) & (pope_location[0:10] >= 640 - 50 - 34) & ((pope_location[12:22] > enemy_paddle_location - 40) & (pope_location[12:22] <= enemy_paddle_location + 150))):
                     m.d.pix += [
-                        pope_h_velocity.eq(0),
-                        pope_v_velocity.eq(((pope_location[12:22] - enemy_paddle_location - 55) >> 3) + lfsr[0:3].as_signed())
+                        time_until_start.eq(add_sum),
+                        pope_v_velocity.eq(random[0:4].as_signed()),
+                        self.o_updated.eq(1),
+                    ]
+                    m.next = "idle"
+                with m.Else():
+                    m.d.comb += [
+                        add_a.eq(paddle_location),
+                        add_b.eq(-pope_y),
                     ]
-
-                with m.If(self.i_move_up & (paddle_location >= 3)):
-                    m.d.pix += paddle_location.eq(paddle_location - 3)
-                with m.If(self.i_move_down & (paddle_location < (480-150-3))):
-                    m.d.pix += paddle_location.eq(paddle_location + 3)
-
-                with m.If((pope_location[12:22] > enemy_paddle_location + 75 - 20) & (enemy_paddle_location < 480-150-20) & (self.i_player_two_active == 0)):
-                    m.d.pix += enemy_paddle_location.eq(enemy_paddle_location + 2)
-                with m.If((pope_location[12:22] < enemy_paddle_location + 75 - 20) & (enemy_paddle_location > 20) & (self.i_player_two_active == 0)):
-                    m.d.pix += enemy_paddle_location.eq(enemy_paddle_location - 2)
-
-                with m.If(self.i_player_two_up & (enemy_paddle_location >= 3) & (self.i_player_two_active)):
-                    m.d.pix += enemy_paddle_location.eq(enemy_paddle_location - 3)
-                with m.If(self.i_player_two_down & (enemy_paddle_location < (480-150-3)) & (self.i_player_two_active)):
-                    m.d.pix += enemy_paddle_location.eq(enemy_paddle_location + 3)
-
-                with m.If(pope_location[0:10] <= 6):
                     m.d.pix += [
-                        pope_location.eq(pope_location.reset),
-                        pope_h_velocity.eq(pope_h_velocity.reset),
-                        pope_v_velocity.eq(pope_v_velocity.reset),
-                        paddle_location.eq(paddle_location.reset),
-                        enemy_paddle_location.eq(enemy_paddle_location.reset),
-                        time_until_start.eq(time_until_start.reset),
-                        enemy_score.eq(enemy_score + 1),
+                        acc.eq(add_sum),
+                        bounce_top.eq(pope_y <= 20),
+                        bounce_bottom.eq(pope_y >= height - 40),
+                        enemy_scored.eq(pope_x <= 6),
+                        player_scored.eq(pope_x >= width - 34),
+                    ]
+                    m.next = "player_hit"
+
+            # acc is paddle - y, the pope hits when paddle - 40 < y <= paddle + 150
+            with m.State("player_hit"):
+                m.d.pix += hit_player.eq((pope_h_velocity == 0) & (pope_x < 50) & (acc < 40) & (acc >= -150))
+                # y - paddle - 55
+                m.d.comb += [
+                    add_a.eq(~acc),
+                    add_b.eq(-54),
+                ]
+                m.d.pix += acc.eq(add_sum)
+                m.next = "player_angle"
+
+            with m.State("player_angle"):
+                m.d.comb += [
+                    add_a.eq(acc >> 3),
+                    add_b.eq(random[0:3].as_signed()),
+                ]
+                m.d.pix += angle.eq(add_sum)
+                m.next = "enemy_distance"
+
+            with m.State("enemy_distance"):
+                m.d.comb += [
+                    add_a.eq(enemy_paddle_location),
+                    add_b.eq(-pope_y),
+                ]
+                m.d.pix += acc.eq(add_sum)
+                m.next = "enemy_hit"
+
+            # acc is enemy paddle - y
+            with m.State("enemy_hit"):
+                m.d.pix += [
+                    hit_enemy.eq((pope_h_velocity == 1) & (pope_x >= width - 50 - 34) & (acc < 40) & (acc >= -150)),
+                    # follow the pope when it's more than 75 - 20 below or above the top of the paddle
+                    enemy_follow_down.eq(acc < -(75 - 20)),
+                    enemy_follow_up.eq(acc > -(75 - 20)),
+                ]
+                m.d.comb += [
+                    add_a.eq(~acc),
+                    add_b.eq(-54),
+                ]
+                m.d.pix += acc.eq(add_sum)
+                m.next = "enemy_angle"
+
+            with m.State("enemy_angle"):
+                m.d.comb += [
+                    add_a.eq(acc >> 3),
+                    add_b.eq(random[0:3].as_signed()),
+                ]
+                with m.If(hit_enemy):
+                    m.d.pix += angle.eq(add_sum)
+                m.next = "triple_velocity"
+
+            with m.State("triple_velocity"):
+                m.d.comb += [
+                    add_a.eq(pope_v_velocity << 1),
+                    add_b.eq(pope_v_velocity),
+                ]
+                m.d.pix += acc.eq(add_sum)
+                m.next = "move_vertical"
+
+            with m.State("move_vertical"):
+                m.d.comb += [
+                    add_a.eq(pope_location[10:22]),
+                    add_b.eq(acc),
+                ]
+                m.d.pix += pope_location[10:22].eq(add_sum)
+                m.next = "negate_velocity"
+
+            with m.State("negate_velocity"):
+                m.d.comb += [
+                    add_a.eq(~pope_v_velocity),
+                    add_b.eq(1),
+                ]
+                m.d.pix += acc.eq(add_sum)
+                m.next = "bounce"
+
+            # acc is -pope_v_velocity
+            with m.State("bounce"):
+                with m.If(bounce_top):
+                    m.d.pix += pope_v_velocity.eq(Mux(pope_v_velocity > 0, pope_v_velocity, acc))
+                with m.If(bounce_bottom):
+                    m.d.pix += pope_v_velocity.eq(Mux(pope_v_velocity < 0, pope_v_velocity, acc))
+                with m.If(hit_player | hit_enemy):
+                    m.d.pix += pope_v_velocity.eq(angle)
+                m.next = "paddle_steps"
+
+            # the steps are kept so the adds don't wait on the checks
+            with m.State("paddle_steps"):
+                m.d.pix += paddle_step.eq(0)
+                with m.If(move_up & (paddle_location >= 3)):
+                    m.d.pix += paddle_step.eq(-3)
+                with m.If(move_down & (paddle_location < (height-150-3))):
+                    m.d.pix += paddle_step.eq(3)
+
+                m.d.pix += enemy_step.eq(0)
+                with m.If(~player_two_active):
+                    with m.If(enemy_follow_down & (enemy_paddle_location < height-150-20)):
+                        m.d.pix += enemy_step.eq(2)
+                    with m.If(enemy_follow_up & (enemy_paddle_location > 20)):
+                        m.d.pix += enemy_step.eq(-2)
+                with m.Else():
+                    with m.If(player_two_up & (enemy_paddle_location >= 3)):
+                        m.d.pix += enemy_step.eq(-3)
+                    with m.If(player_two_down & (enemy_paddle_location < (height-150-3))):
+                        m.d.pix += enemy_step.eq(3)
+                m.next = "move_paddle"
+
+            with m.State("move_paddle"):
+                m.d.comb += [
+                    add_a.eq(paddle_location),
+                    add_b.eq(paddle_step),
+                ]
+                m.d.pix += paddle_location.eq(add_sum)
+                m.next = "move_enemy_paddle"
+
+            with m.State("move_enemy_paddle"):
+                m.d.comb += [
+                    add_a.eq(enemy_paddle_location),
+                    add_b.eq(enemy_step),
+                ]
+                m.d.pix += enemy_paddle_location.eq(add_sum)
+                m.next = "score"
+
+            # the pope only moves sideways if nobody scores, it goes back to the middle otherwise
+            with m.State("score"):
+                with m.If(enemy_scored | player_scored):
+                    m.d.comb += [
+                        add_a.eq(Mux(enemy_scored, enemy_score, player_score)),
+                        add_b.eq(1),
                     ]
-                with m.If(pope_location[0:10] >= 640 - 34):
                     m.d.pix += [
                         pope_location.eq(pope_location.reset),
                         pope_h_velocity.eq(pope_h_velocity.reset),
@@ -104,8 +301,23 @@ class Top(Elaboratable):
                         paddle_location.eq(paddle_location.reset),
                         enemy_paddle_location.eq(enemy_paddle_location.reset),
                         time_until_start.eq(time_until_start.reset),
-                        player_score.eq(player_score + 1),
                     ]
+                    with m.If(enemy_scored):
+                        m.d.pix += enemy_score.eq(add_sum)
+                    with m.Else():
+                        m.d.pix += player_score.eq(add_sum)
+                with m.Else():
+                    m.d.comb += [
+                        add_a.eq(pope_x),
+                        add_b.eq(Mux(pope_h_velocity, 3, -3)),
+                    ]
+                    m.d.pix += pope_x.eq(add_sum)
+                    with m.If(hit_player):
+                        m.d.pix += pope_h_velocity.eq(1)
+                    with m.If(hit_enemy):
+                        m.d.pix += pope_h_velocity.eq(0)
+                m.d.pix += self.o_updated.eq(1)
+                m.next = "idle"
 
         m.d.comb += [
             self.vga.i_pope_location.eq(Cat(pope_location[0:10], pope_location[12:22])),
@@ -123,16 +335,58 @@ class Top(Elaboratable):
         return m
 
 
+class InputCapture(Elaboratable):
+    """
+    brings the buttons into the pix domain and keeps every press until the game logic takes it,
+    so a press that starts and ends between two updates still moves the paddle once.
+
+    each button goes through two flops, and the synchronised level is then only looked at every
+    tick clocks. a bounce is shorter than a tick, so the sampled level changes at most once per
+    press. o_pressed is high for a button that was down at any point since the last clock
+    i_take was high, a button that is held stays pressed for every update
+    """
+    def __init__(self, count, tick):
+        self.i_buttons = Signal(count)
+        self.i_take = Signal()
+        self.o_pressed = Signal(count)
+        self.o_level = Signal(count)
+
+        self.tick = tick
+
+    def elaborate(self, platform):
+        m = Module()
+
+        synced = Signal(len(self.i_buttons))
+        m.submodules.sync = FFSynchronizer(self.i_buttons, synced, o_domain="pix")
+
+        prescaler = Signal(range(self.tick))
+        with m.If(prescaler == self.tick - 1):
+            m.d.pix += [
+                prescaler.eq(0),
+                self.o_level.eq(synced),
+            ]
+        with m.Else():
+            m.d.pix += prescaler.eq(prescaler + 1)
+
+        # the presses from before the current clock, the level on it is added in comb
+        seen = Signal(len(self.i_buttons))
+        m.d.comb += self.o_pressed.eq(seen | self.o_level)
+        with m.If(self.i_take):
+            m.d.pix += seen.eq(0)
+        with m.Else():
+            m.d.pix += seen.eq(self.o_pressed)
+        return m
 
 
 class VGAOutput(Elaboratable):
-    def __init__(self, hfront, hsync, hback, vfront, vsync, vback):
-        self._hfront = hfront
-        self._hsync = hsync
-        self._hback = hback
-        self._vfront = vfront
-        self._vsync = vsync
-        self._vback = vback
+    def __init__(self, mode=DEFAULT_MODE, sprite="rle"):
+        self.mode = mode
+        self._sprite = sprite
+
+        self.line_length = mode.line_length
+        self.screen_length = mode.screen_length
+        self.hsync_start = mode.hsync_start
+        self.vsync_start = mode.vsync_start
 
         self.i_enable = Signal()
         self.i_pope_location = Signal(20)
@@ -151,31 +405,56 @@ class VGAOutput(Elaboratable):
     def elaborate(self, platform):
         m = Module()
 
-        line_length = 640 + self._hfront + self._hsync + self._hback
-        screen_length = 480 + self._vfront + self._vsync + self._vback
+        line_length = self.line_length
+        screen_length = self.screen_length
+        width = self.mode.width
+        height = self.mode.height
 
         clock = Signal(22)
-        with m.If(self.i_enable):
-            m.d.pix += clock[0:11].eq(clock[0:11] + 1)
-        with m.If(clock[0:11] == line_length - 1):
-            m.d.pix += [
-                clock[0:11].eq(0),
-                clock[11:22].eq(clock[11:22] + 1)
-            ]
-            with m.If(clock[11:22] == screen_length - 1):
-                m.d.pix += clock[11:22].eq(0)
-        
-
+        end_of_line = clock[0:11] == line_length - 1
+        end_of_screen = clock[11:22] == screen_length - 1
+        next_x = Signal(11)
+        next_y = Signal(11)
         m.d.comb += [
-            self.o_hsync.eq(1),
-            self.o_vsync.eq(1),
+            next_x.eq(Mux(end_of_line, 0, Mux(self.i_enable, clock[0:11] + 1, clock[0:11]))),
+            next_y.eq(Mux(end_of_line, Mux(end_of_screen, 0, clock[11:22] + 1), clock[11:22])),
         ]
+        m.d.pix += clock.eq(Cat(next_x, next_y))
+
+        # every rectangle is a span on each axis, the spans follow the beam so that nothing has to
+        # compare the position against the edges, see Span
+        def span(name, next_position, start, end):
+            m.submodules[name] = span = Span(start, end)
+            m.d.comb += span.i_next.eq(next_position)
+            return span.o_inside
+
+        player_score_x = span("player_score_x", next_x, 100, 125)
+        enemy_score_x = span("enemy_score_x", next_x, width-125, width-100)
+        score_y = span("score_y", next_y, 50, 75)
+        timer_x = span("timer_x", next_x, width//2-100, width//2+100)
+        timer_y = span("timer_y", next_y, 100, 200)
+        paddle_x = span("paddle_x", next_x, 25, 50)
+        paddle_y = span("paddle_y", next_y, self.i_paddle_location, self.i_paddle_location + 150)
+        enemy_paddle_x = span("enemy_paddle_x", next_x, width-50, width-25)
+        enemy_paddle_y = span("enemy_paddle_y", next_y, self.i_enemy_paddle_location, self.i_enemy_paddle_location + 150)
+        visible_x = span("visible_x", next_x, 0, width)
+        visible_y = span("visible_y", next_y, 0, height)
+        hsync = span("hsync", next_x, self.hsync_start, self.hsync_start + self.mode.hsync)
+        vsync = span("vsync", next_y, self.vsync_start, self.vsync_start + self.mode.vsync)
+
+        if self.mode.sync_high:
+            m.d.comb += [
+                self.o_hsync.eq(hsync),
+                self.o_vsync.eq(vsync),
+            ]
+        else:
+            m.d.comb += [
+                self.o_hsync.eq(~hsync),
+                self.o_vsync.eq(~vsync),
+            ]
 
         #player score
-        with m.If((clock[0:11] >= 100) & 
-                  (clock[0:11] < 125) & 
-                  (clock[11:22] >= 50) & 
-                  (clock[11:22] < 75)):
+        with m.If(player_score_x & score_y):
             m.d.comb += [
                 self.o_r.eq(7),
                 self.o_b.eq(~self.i_player_score),
@@ -183,10 +462,7 @@ class VGAOutput(Elaboratable):
             ]
 
         #enemy score
-        with m.If((clock[0:11] >= 640-125) & 
-                  (clock[0:11] < 640-100) & 
-                  (clock[11:22] >= 50) & 
-                  (clock[11:22] < 75)):
+        with m.If(enemy_score_x & score_y):
             m.d.comb += [
                 self.o_r.eq(7),
                 self.o_b.eq(~self.i_enemy_score),
@@ -194,111 +470,302 @@ class VGAOutput(Elaboratable):
             ]
 
         #timer count down
-        with m.If((clock[0:11] >= 220) & 
-                  (clock[0:11] < 420) & 
-                  (clock[11:22] >= 100) & 
-                  (clock[11:22] < 200)):
+        with m.If(timer_x & timer_y):
             m.d.comb += [
                 self.o_r.eq((self.i_timer > 120).replicate(3)),
                 self.o_b.eq(((self.i_timer > 60) & (self.i_timer <= 120)).replicate(3)),
                 self.o_g.eq(((self.i_timer <= 60) & (self.i_timer != 0)).replicate(3)),
             ]
 
-        with Image.open("jp2smol_indexed.png") as image:
-            bbox = image.getbbox()
-            width = bbox[2] - bbox[0]
-            height = bbox[3] - bbox[1]
-            palette = image.getpalette("RGB")
-            
-            palette_index = Signal(range(30))
+        sprite = load_sprite(os.path.join(os.path.dirname(__file__), "jp2smol_indexed.png"))
+        palette_index = Signal(range(len(sprite.palette)))
 
+        if self._sprite == "rle":
+            m.submodules.sprite = sprite_rom = SpriteRom(sprite, line_length, screen_length)
+            m.d.comb += [
+                sprite_rom.i_enable.eq(self.i_enable),
+                sprite_rom.i_clock.eq(clock),
+                sprite_rom.i_location.eq(self.i_pope_location),
+                palette_index.eq(sprite_rom.o_index),
+            ]
+        else:
             with m.Switch(clock[0:11] - self.i_pope_location[0:10]):
-                for x in range(width):
+                for x in range(sprite.width):
                     with m.Case(x):
                         with m.Switch(clock[11:22] - self.i_pope_location[10:20]):
-                            for y in range(height):
-                                data = image.getpixel((bbox[0] + x, bbox[1] + y))
+                            for y in range(sprite.height):
+                                data = sprite.pixels[y][x]
                                 if data == 0:
                                     continue
                                 with m.Case(y):
                                     m.d.comb += [
                                         palette_index.eq(data),
                                     ]
-            with m.Switch(palette_index):
-                for palette_item in range(1,31):
-                    with m.Case(palette_item):
-                        m.d.comb += [
-                            self.o_r.eq(palette[palette_item * 3] >> 5),
-                            self.o_g.eq(palette[palette_item * 3 + 1] >> 5),
-                            self.o_b.eq(palette[palette_item * 3 + 2] >> 5),
-                        ]
-
-        with m.If(
-            (clock[11:22] >= self.i_paddle_location) &
-            (clock[11:22] < self.i_paddle_location + 150) &
-            (clock[0:11] >= 25) &
-            (clock[0:11] < 50)
-        ):
+
+        with m.Switch(palette_index):
+            for palette_item, (r, g, b) in enumerate(sprite.palette):
+                if palette_item == 0:
+                    continue
+                with m.Case(palette_item):
+                    m.d.comb += [
+                        self.o_r.eq(r),
+                        self.o_g.eq(g),
+                        self.o_b.eq(b),
+                    ]
+
+        with m.If(paddle_x & paddle_y):
             m.d.comb += [
                 self.o_r.eq(7),
                 self.o_g.eq(7),
                 self.o_b.eq(7),
             ]
-        with m.If(
-            (clock[11:22] >= self.i_enemy_paddle_location) &
-            (clock[11:22] < self.i_enemy_paddle_location + 150) &
-            (clock[0:11] < 640-25) &
-            (clock[0:11] >= 640-50)
-        ):
+        with m.If(enemy_paddle_x & enemy_paddle_y):
             m.d.comb += [
                 self.o_r.eq(7),
                 self.o_g.eq(7),
                 self.o_b.eq(7),
             ]
 
-        with m.If((clock[0:11] >= 640) | (clock[11:22] >= 480)):
+        with m.If(~visible_x | ~visible_y):
             m.d.comb += [
                 self.o_r.eq(0),
                 self.o_g.eq(0),
                 self.o_b.eq(0),
             ]
-        with m.If((clock[0:11] >= 640 + self._hfront) & (clock[0:11] < line_length - self._hback)):
-            m.d.comb += self.o_hsync.eq(0)
-        with m.If((clock[11:22] >= 480 + self._vfront) & (clock[11:22] < screen_length - self._vback)):
-            m.d.comb += self.o_vsync.eq(0)
 
         return m
-        
 
-if __name__ == "__main__":
-    from amaranth.sim import *
-    from amaranth.back.verilog import convert
 
-    print("starting work")
-    mod =Top()
-    result = (convert(mod, name="sphn_vga_top", ports=[mod.o_r, mod.o_r, mod.o_g, mod.o_b, mod.o_hsync, mod.o_vsync, mod.i_move_up, mod.i_move_down, mod.i_player_two_up, mod.i_player_two_down, mod.i_player_two_active],
-        emit_src=False, strip_internal_attrs=True))
-    print("verilog generated")
+class Span(Elaboratable):
+    """
+    o_inside is set while a beam coordinate is in [start, end), without comparing magnitudes. it
+    only looks at i_next, the coordinate the beam moves to on the next clock, turns on when that is
+    start and off when it is end, and starts over when the beam wraps around to 0. start and end
+    can be signals, as long as they don't change while the beam is between them.
+    like the beam counter, o_inside is registered and describes the pixel the clock is currently on
+    """
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
 
-    with open("src/vga.v", "w") as file:
-        file.write(result)
-    print("file written")
+        self.i_next = Signal(11)
+        # the beam counter resets to 0, a signal start is taken to be somewhere else
+        self.o_inside = Signal(reset=isinstance(start, int) and start == 0 < end)
 
-    def test():
-        yield mod.i_enable.eq(1)
+    def elaborate(self, platform):
+        m = Module()
 
-        for _ in range(1000000):
-            yield
+        with m.If(self.i_next == 0):
+            m.d.pix += self.o_inside.eq(self.start == 0)
+        with m.Elif(self.i_next == self.start):
+            m.d.pix += self.o_inside.eq(1)
+        with m.Elif(self.i_next == self.end):
+            m.d.pix += self.o_inside.eq(0)
 
-        print("done")
+        return m
 
 
-    sim = Simulator(mod)
-    sim.add_clock(2e-12, domain="pix")
-    sim.add_sync_process(test, domain="pix")
+def encode_runs(pixels):
+    """
+    run length encode every row of the sprite, runs go from the left edge up to the last
+    non transparent pixel of the row, a row with nothing in it becomes a single transparent run.
+    returns the index of the first run of every row and a list of (palette index, length, last) runs
+    """
+    row_starts = []
+    runs = []
+    for row in pixels:
+        row_starts.append(len(runs))
+        end = max((x + 1 for x, data in enumerate(row) if data != 0), default=1)
+        x = 0
+        while x < end:
+            length = 1
+            while x + length < end and row[x + length] == row[x]:
+                length += 1
+            runs.append([row[x], length, False])
+            x += length
+        runs[-1][2] = True
+    return row_starts, [tuple(run) for run in runs]
+
+
+class SpriteRom(Elaboratable):
+    """
+    draws a sprite from a run length encoded rom, one row table entry per line of the sprite
+    and one rom entry per run, a small decoder walks the runs as the beam moves along the line.
+    all of the state is registered and describes the pixel the clock is currently on
+    """
+    def __init__(self, sprite: Sprite, line_length, screen_length):
+        self.sprite = sprite
+        self._line_length = line_length
+        self._screen_length = screen_length
 
-    with sim.write_vcd("test.vcd", "test.gtkw"):
-        sim.run()
+        self.i_enable = Signal()
+        self.i_clock = Signal(22)
+        self.i_location = Signal(20)
 
-    print("hii")
+        self.o_index = Signal(range(len(sprite.palette)))
 
+    def elaborate(self, platform):
+        m = Module()
+
+        row_starts, runs = encode_runs(self.sprite.pixels)
+        index_width = len(self.o_index)
+        length_width = max(length for _, length, _ in runs).bit_length()
+
+        m.submodules.run_rom = run_rom = Memory(
+            width=index_width + length_width + 1, depth=len(runs),
+            init=[index | ((length - 1) << index_width) | (last << (index_width + length_width)) for index, length, last in runs]
+        ).read_port(domain="comb")
+        m.submodules.row_rom = row_rom = Memory(
+            width=len(run_rom.addr), depth=len(row_starts), init=row_starts
+        ).read_port(domain="comb")
+
+        run_index = run_rom.data[0:index_width]
+        run_length = run_rom.data[index_width:index_width + length_width]
+        run_last = run_rom.data[-1]
+
+        clock_x = self.i_clock[0:11]
+        clock_y = self.i_clock[11:22]
+        location_x = self.i_location[0:10]
+        location_y = self.i_location[10:20]
+
+        # mirror the clock in VGAOutput so that we know where the beam goes next
+        end_of_line = clock_x == self._line_length - 1
+        end_of_screen = clock_y == self._screen_length - 1
+        next_x = Mux(end_of_line, 0, clock_x + 1)
+        next_y = Mux(end_of_screen, 0, clock_y + 1)
+
+        row_active = Signal()
+        row = Signal(range(self.sprite.height))
+        next_row_active = Signal()
+        next_row = Signal.like(row)
+        m.d.comb += [
+            next_row_active.eq(row_active),
+            next_row.eq(row),
+        ]
+        with m.If(end_of_line):
+            with m.If(next_y == location_y):
+                m.d.comb += [
+                    next_row_active.eq(1),
+                    next_row.eq(0),
+                ]
+            with m.Elif(end_of_screen | (row == self.sprite.height - 1)):
+                m.d.comb += next_row_active.eq(0)
+            with m.Else():
+                m.d.comb += next_row.eq(row + 1)
+        m.d.pix += [
+            row_active.eq(next_row_active),
+            row.eq(next_row),
+        ]
+
+        active = Signal()
+        run_count = Signal(length_width)
+        m.d.comb += row_rom.addr.eq(next_row)
+
+        with m.If(self.i_enable | end_of_line):
+            with m.If(next_row_active & (next_x == location_x)):
+                m.d.pix += [
+                    active.eq(1),
+                    run_rom.addr.eq(row_rom.data),
+                    run_count.eq(0),
+                ]
+            with m.Elif(end_of_line):
+                m.d.pix += active.eq(0)
+            with m.Elif(active):
+                with m.If(run_count == run_length):
+                    m.d.pix += [
+                        run_rom.addr.eq(run_rom.addr + 1),
+                        run_count.eq(0),
+                    ]
+                    with m.If(run_last):
+                        m.d.pix += active.eq(0)
+                with m.Else():
+                    m.d.pix += run_count.eq(run_count + 1)
+
+        m.d.comb += self.o_index.eq(Mux(active, run_index, 0))
+
+        return m
+
+
+class LatencyProbe:
+    """
+    a simulation process that measures the pixel clocks from a button going down to the paddle
+    it moves moving. player two is only measured while player two is active, and a press that
+    hadn't moved its paddle by the time the button goes down again, say in the countdown or
+    against the edge of the screen, is counted as dropped
+    """
+    def __init__(self, top):
+        self.top = top
+        self.names = ("move_up", "move_down", "player_two_up", "player_two_down")
+        self.latencies = {name: [] for name in self.names}
+        self.dropped = {name: 0 for name in self.names}
+
+    def process(self):
+        top = self.top
+        paddles = (top.paddle_location, top.paddle_location, top.enemy_paddle_location, top.enemy_paddle_location)
+        buttons = [getattr(top, f"i_{name}") for name in self.names]
+        last_level = [0] * len(buttons)
+        last_paddle = []
+        for paddle in paddles:
+            last_paddle.append((yield paddle))
+        pressed_at = [None] * len(buttons)
+        clock = 0
+        while True:
+            active = yield top.i_player_two_active
+            for index, (name, button, paddle) in enumerate(zip(self.names, buttons, paddles)):
+                level = yield button
+                location = yield paddle
+                if pressed_at[index] is not None and location != last_paddle[index]:
+                    self.latencies[name].append(clock - pressed_at[index])
+                    pressed_at[index] = None
+                if level and not last_level[index] and (index < 2 or active):
+                    if pressed_at[index] is not None:
+                        self.dropped[name] += 1
+                    pressed_at[index] = clock
+                last_level[index] = level
+                last_paddle[index] = location
+            clock += 1
+            yield
+
+    def report(self, pixel_clock):
+        for name in self.names:
+            latencies = self.latencies[name]
+            if not latencies and not self.dropped[name]:
+                continue
+            line = f"{name}: {len(latencies)} presses"
+            if latencies:
+                mean = sum(latencies) / len(latencies)
+                line += (f", latency {min(latencies)}/{mean:.0f}/{max(latencies)} clocks min/mean/max"
+                    f" ({max(latencies) / pixel_clock * 1e3:.2f}ms worst)")
+            if self.dropped[name]:
+                line += f", {self.dropped[name]} dropped"
+            print(line)
+
+
+if __name__ == "__main__":
+    import argparse
+    from amaranth.back.verilog import convert
+    from modes import MODES, add_mode_argument
+    import sim
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--no-verilog", action="store_true", help="don't regenerate src/vga.v")
+    parser.add_argument("--latency", action="store_true", help="measure the pixel clocks from a button press to the paddle moving")
+    add_mode_argument(parser)
+    sim.add_arguments(parser)
+    args = parser.parse_args()
+
+    mod = Top(mode=MODES[args.mode])
+    # the tile is clocked for the default mode, so src/vga.v is only written for that one
+    if not args.no_verilog and mod.mode is DEFAULT_MODE:
+        result = (convert(mod, name="sphn_vga_top", ports=[mod.o_r, mod.o_r, mod.o_g, mod.o_b, mod.o_hsync, mod.o_vsync, mod.i_move_up, mod.i_move_down, mod.i_player_two_up, mod.i_player_two_down, mod.i_player_two_active],
+            emit_src=False, strip_internal_attrs=True))
+        with open("src/vga.v", "w") as file:
+            file.write(result)
+        print("src/vga.v written")
+    elif not args.no_verilog:
+        print(f"src/vga.v not written for {args.mode}")
+
+    probe = LatencyProbe(mod)
+    sim.run_from_args(mod, args, [probe.process] if args.latency else [])
+    if args.latency:
+        probe.report(mod.mode.pixel_clock)
@@ -0,0 +1,305 @@
+"""
+a bit exact python model of the once per frame game logic in main.Top
+
+    python model.py --frames 1000000            # soak the model with random inputs
+    python model.py --check 5 --skip 200        # compare 5 frames after the first 200 against the amaranth simulation
+
+every call to Game.step() is one vsync update, the lfsr is jumped ahead by the number of pixel
+clocks between updates instead of being stepped once per clock. a Game plays in a video mode
+from modes.py, like main.Top, the default is 640x480@60
+"""
+import copy
+import functools
+import time
+
+try:
+    from .modes import DEFAULT_MODE
+except ImportError:
+    from modes import DEFAULT_MODE
+
+TIMER_RESET = 179
+
+
+def first_update_clock(mode):
+    # the update happens on the first clock of vsync, which starts after the visible lines and the front porch
+    return mode.vsync_start * mode.line_length
+
+
+def lfsr_step(lfsr):
+    feedback = ((lfsr >> 10) ^ (lfsr >> 12) ^ (lfsr >> 13) ^ (lfsr >> 15)) & 1
+    return ((lfsr << 1) & 0xffff) | feedback
+
+
+def _apply(jump, value):
+    result = 0
+    for bit in range(16):
+        if value >> bit & 1:
+            result ^= jump[bit]
+    return result
+
+
+def lfsr_jump(steps):
+    """
+    the lfsr is linear, so stepping it n times is a 16x16 matrix over GF(2), stored here as the
+    image of every bit. the matrix for n steps is built by repeated squaring
+    """
+    result = [1 << bit for bit in range(16)]
+    power = [lfsr_step(1 << bit) for bit in range(16)]
+    while steps:
+        if steps & 1:
+            result = [_apply(power, column) for column in result]
+        power = [_apply(power, column) for column in power]
+        steps >>= 1
+    return result
+
+
+@functools.lru_cache
+def _jumps(mode):
+    """the lfsr jumps to the first update and from one update to the next"""
+    return lfsr_jump(first_update_clock(mode)), lfsr_jump(mode.frame_clocks)
+
+
+def _signed(value, width):
+    value &= (1 << width) - 1
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+class Game:
+    def __init__(self, mode=DEFAULT_MODE):
+        self.mode = mode
+        self.width = mode.width
+        self.height = mode.height
+        self._first_jump, self._frame_jump = _jumps(mode)
+
+        self.pope_x = self.width // 2 - 17
+        # the vertical position has 2 fractional bits, like pope_location[10:22]
+        self.pope_y_fixed = (self.height // 2 - 20) << 2
+        self.pope_h_velocity = 0
+        self.pope_v_velocity = -1
+        self.paddle_location = self.height // 2 - 75
+        self.enemy_paddle_location = self.height // 2 - 75
+        self.time_until_start = TIMER_RESET
+        self.player_score = 0
+        self.enemy_score = 0
+        # the value of the lfsr on the clock of the last update, or its reset value before the first one
+        self.lfsr = 1
+        self.frame = 0
+
+    @property
+    def pope_y(self):
+        return self.pope_y_fixed >> 2
+
+    def registers(self):
+        """the state in the same form as the registers of main.Top"""
+        return {
+            "pope_location": self.pope_x | (self.pope_y_fixed << 10),
+            "pope_h_velocity": self.pope_h_velocity,
+            "pope_v_velocity": self.pope_v_velocity,
+            "paddle_location": self.paddle_location,
+            "enemy_paddle_location": self.enemy_paddle_location,
+            "time_until_start": self.time_until_start,
+            "player_score": self.player_score,
+            "enemy_score": self.enemy_score,
+            "lfsr": self.lfsr,
+        }
+
+    def vga_inputs(self):
+        """the values main.Top feeds into its VGAOutput, in the form render.render_batch takes"""
+        return {
+            "pope_location": self.pope_x | (self.pope_y << 10),
+            "paddle_location": self.paddle_location,
+            "enemy_paddle_location": self.enemy_paddle_location,
+            "player_score": self.player_score,
+            "enemy_score": self.enemy_score,
+            "timer": self.time_until_start,
+        }
+
+    def step(self, move_up=False, move_down=False, player_two_up=False, player_two_down=False, player_two_active=False):
+        self.lfsr = _apply(self._first_jump if self.frame == 0 else self._frame_jump, self.lfsr)
+        self.frame += 1
+        lfsr = self.lfsr
+
+        if self.time_until_start > 0:
+            self.time_until_start -= 1
+            self.pope_v_velocity = _signed(lfsr, 4)
+            return
+
+        # every condition looks at the values from before the update, like the hardware does
+        x = self.pope_x
+        y = self.pope_y
+        h_velocity = self.pope_h_velocity
+        v_velocity = self.pope_v_velocity
+        paddle = self.paddle_location
+        enemy = self.enemy_paddle_location
+        width = self.width
+        height = self.height
+
+        if h_velocity:
+            self.pope_x = (x + 3) & 0x3ff
+        else:
+            self.pope_x = (x - 3) & 0x3ff
+        self.pope_y_fixed = (self.pope_y_fixed + 3 * v_velocity) & 0xfff
+
+        if y <= 20:
+            self.pope_v_velocity = _signed(v_velocity if v_velocity > 0 else -v_velocity, 7)
+        if y >= height - 40:
+            self.pope_v_velocity = _signed(v_velocity if v_velocity < 0 else -v_velocity, 7)
+
+        if h_velocity == 0 and x < 50 and paddle - 40 < y <= paddle + 150:
+            self.pope_h_velocity = 1
+            self.pope_v_velocity = _signed(((y - paddle - 55) >> 3) + _signed(lfsr, 3), 7)
+        if h_velocity == 1 and x >= width - 50 - 34 and enemy - 40 < y <= enemy + 150:
+            self.pope_h_velocity = 0
+            self.pope_v_velocity = _signed(((y - enemy - 55) >> 3) + _signed(lfsr, 3), 7)
+
+        if move_up and paddle >= 3:
+            self.paddle_location = paddle - 3
+        if move_down and paddle < height - 150 - 3:
+            self.paddle_location = paddle + 3
+
+        if y > enemy + 75 - 20 and enemy < height - 150 - 20 and not player_two_active:
+            self.enemy_paddle_location = enemy + 2
+        if y < enemy + 75 - 20 and enemy > 20 and not player_two_active:
+            self.enemy_paddle_location = enemy - 2
+
+        if player_two_up and enemy >= 3 and player_two_active:
+            self.enemy_paddle_location = enemy - 3
+        if player_two_down and enemy < height - 150 - 3 and player_two_active:
+            self.enemy_paddle_location = enemy + 3
+
+        if x <= 6:
+            self._serve()
+            self.enemy_score = (self.enemy_score + 1) & 0x7
+        if x >= width - 34:
+            self._serve()
+            self.player_score = (self.player_score + 1) & 0x7
+
+    def _serve(self):
+        self.pope_x = self.width // 2 - 17
+        self.pope_y_fixed = (self.height // 2 - 20) << 2
+        self.pope_h_velocity = 0
+        self.pope_v_velocity = -1
+        self.paddle_location = self.height // 2 - 75
+        self.enemy_paddle_location = self.height // 2 - 75
+        self.time_until_start = TIMER_RESET
+
+
+INPUT_NAMES = ("move_up", "move_down", "player_two_up", "player_two_down", "player_two_active")
+
+
+def random_inputs(seed=0):
+    """returns a function of frame number to a dict of random inputs, the same frame always gets the same inputs"""
+    def inputs(frame):
+        bits = ((frame + 1) * 0x9e3779b1 + seed * 0x85ebca77) & 0xffffffff
+        bits = ((bits ^ (bits >> 16)) * 0x45d9f3b) & 0xffffffff
+        bits ^= bits >> 16
+        return {name: bool(bits >> index & 1) for index, name in enumerate(INPUT_NAMES)}
+    return inputs
+
+
+def check_against_simulation(frames, inputs=None, game=None):
+    """
+    run main.Top in the amaranth simulator for some frames and compare its registers with
+    the model after every update, returns a list of (frame, expected, actual) mismatches.
+    if a game is given its state is loaded into the registers first, so that the check can start
+    in the middle of a rally instead of at the start of the countdown
+    """
+    from amaranth.sim import Simulator
+    import main
+
+    inputs = inputs or (lambda frame: {})
+    game = copy.copy(game) if game is not None else Game()
+    game.frame = 0
+    mode = game.mode
+    mod = main.Top(mode=mode)
+    mismatches = []
+
+    ports = {
+        "move_up": mod.i_move_up,
+        "move_down": mod.i_move_down,
+        "player_two_up": mod.i_player_two_up,
+        "player_two_down": mod.i_player_two_down,
+        "player_two_active": mod.i_player_two_active,
+    }
+
+    def load_state():
+        # a plain process runs before the first clock edge, writes from a sync process would race the registers
+        for name, value in game.registers().items():
+            yield getattr(mod, name).eq(value)
+
+    def wait_until(clock, until):
+        for _ in range(until - clock):
+            yield
+        return until
+
+    def process():
+        clock = 0
+        for frame in range(frames):
+            # the buttons are pushed at the top of the frame and let go halfway down, the switch stays
+            # where it is. both are long past the debouncing by the update
+            frame_start = frame * mode.frame_clocks
+            update_clock = first_update_clock(mode) + frame_start
+            frame_inputs = inputs(frame)
+            clock = yield from wait_until(clock, frame_start)
+            for name, port in ports.items():
+                yield port.eq(frame_inputs.get(name, False))
+            clock = yield from wait_until(clock, frame_start + mode.height // 2 * mode.line_length)
+            for name, port in ports.items():
+                if name != "player_two_active":
+                    yield port.eq(0)
+            clock = yield from wait_until(clock, update_clock + mod.UPDATE_CLOCKS)
+
+            game.step(**frame_inputs)
+            expected = game.registers()
+            # the registers are read once the update is done, the lfsr has moved on by then
+            for _ in range(mod.UPDATE_CLOCKS):
+                expected["lfsr"] = lfsr_step(expected["lfsr"])
+            actual = {}
+            for name in expected:
+                actual[name] = yield getattr(mod, name)
+            if actual != expected:
+                mismatches.append((frame, expected, actual))
+
+    sim = Simulator(mod)
+    sim.add_clock(1 / mode.pixel_clock, domain="pix")
+    sim.add_process(load_state)
+    sim.add_sync_process(process, domain="pix")
+    sim.run()
+    return mismatches
+
+
+if __name__ == "__main__":
+    import argparse
+    from modes import MODES, add_mode_argument
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=100000, help="frames to run the model for")
+    parser.add_argument("--check", type=int, default=0, metavar="FRAMES", help="also compare this many frames against the amaranth simulation")
+    parser.add_argument("--skip", type=int, default=180, metavar="FRAMES", help="frames to run the model for before the comparison starts, the default skips the first countdown")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random inputs")
+    add_mode_argument(parser)
+    args = parser.parse_args()
+
+    mode = MODES[args.mode]
+    inputs = random_inputs(args.seed)
+    game = Game(mode)
+    rallies = 0
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        was_serving = game.time_until_start > 0
+        game.step(**inputs(frame))
+        rallies += was_serving and game.time_until_start == 0
+    elapsed = time.perf_counter() - start
+    print(f"{args.frames} frames, {rallies} rallies in {elapsed:.2f}s ({args.frames / elapsed:.0f} frames/s)")
+    print(f"score {game.player_score}:{game.enemy_score} (mod 8)")
+
+    if args.check:
+        start_game = Game(mode)
+        for frame in range(args.skip):
+            start_game.step(**inputs(frame))
+        mismatches = check_against_simulation(args.check, lambda frame: inputs(args.skip + frame), start_game)
+        for frame, expected, actual in mismatches:
+            print(f"frame {args.skip + frame}: expected {expected}, got {actual}")
+        print(f"{args.check} frames checked, {len(mismatches)} mismatches")
+        if mismatches:
+            raise SystemExit(1)
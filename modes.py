@@ -0,0 +1,53 @@
+"""
+the video modes the vga generators can run in, each one is the standard (VESA) timing for its
+resolution and refresh rate. the generators, the game and the tools around them work out all of
+their constants from the mode, so a board only has to pick one its PLL can make
+
+    python main.py --mode 640x480@75 --frames 2
+    python ray_march.py --mode 800x600@60 --frames 1
+
+the game logic still steps once per frame, so it runs faster at a higher refresh rate
+"""
+
+
+class VideoMode:
+    def __init__(self, pixel_clock, width, hfront, hsync, hback, height, vfront, vsync, vback, sync_high=False):
+        # the positions are 10 bit in the game logic and 11 bit in the beam counter
+        if width >= 1024 or height >= 1024:
+            raise ValueError(f"{width}x{height} doesn't fit in the 10 bit positions")
+        self.pixel_clock = pixel_clock
+        self.width = width
+        self.height = height
+        self.hfront = hfront
+        self.hsync = hsync
+        self.hback = hback
+        self.vfront = vfront
+        self.vsync = vsync
+        self.vback = vback
+        # the syncs are active low unless this is set
+        self.sync_high = sync_high
+
+        self.line_length = width + hfront + hsync + hback
+        self.screen_length = height + vfront + vsync + vback
+        self.hsync_start = width + hfront
+        self.vsync_start = height + vfront
+        self.frame_clocks = self.line_length * self.screen_length
+        self.refresh = pixel_clock / self.frame_clocks
+
+    def __repr__(self):
+        return f"VideoMode({self.width}x{self.height}@{self.refresh:.2f}Hz, {self.pixel_clock / 1e6:g}MHz)"
+
+
+MODES = {
+    "640x480@60": VideoMode(25175000, 640, 16, 96, 48, 480, 10, 2, 33),
+    "640x480@72": VideoMode(31500000, 640, 24, 40, 128, 480, 9, 3, 28),
+    "640x480@75": VideoMode(31500000, 640, 16, 64, 120, 480, 1, 3, 16),
+    "800x600@60": VideoMode(40000000, 800, 40, 128, 88, 600, 1, 4, 23, sync_high=True),
+    "800x600@72": VideoMode(50000000, 800, 56, 120, 64, 600, 37, 6, 23, sync_high=True),
+}
+
+DEFAULT_MODE = MODES["640x480@60"]
+
+
+def add_mode_argument(parser):
+    parser.add_argument("--mode", choices=MODES, default="640x480@60", help="video mode to generate, see modes.py")
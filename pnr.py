@@ -0,0 +1,183 @@
+"""
+synthesises and places the designs for an fpga with yosys and nextpnr, and keeps the area and
+the fmax of every commit so that changes can be compared against a baseline
+
+    python pnr.py                                   # ice40, results in pnr_results/<commit>-ice40.json
+    python pnr.py --family ecp5 --design ray_march
+    python pnr.py --baseline 4db7b50                # also compare against an earlier commit
+    python pnr.py --baseline HEAD~3
+
+the results are named by the short hash of the commit, with -dirty after it when the tracked files
+had changes, which no --baseline ever finds.
+
+sphn_vga_top is read from src/project.v and src/vga.v, so regenerate those with main.py first.
+yosys is taken from $YOSYS and nextpnr from $NEXTPNR_ICE40 or $NEXTPNR_ECP5, or from the path.
+the exit status is 1 if any design doesn't make the 25.175MHz pixel clock
+"""
+import argparse
+import json
+import os
+import subprocess
+
+from amaranth.back.verilog import convert
+
+from synth import run_in_build_dir, parse_stat
+
+PIXEL_CLOCK_MHZ = 25.175
+
+FAMILIES = {
+    "ice40": {
+        "synth": "synth_ice40",
+        "nextpnr": "nextpnr-ice40",
+        "device": ["--hx8k", "--package", "ct256"],
+        "lut": ("SB_LUT4",),
+        "ff": ("SB_DFF",),
+    },
+    "ecp5": {
+        "synth": "synth_ecp5",
+        "nextpnr": "nextpnr-ecp5",
+        "device": ["--25k", "--package", "CABGA256"],
+        "lut": ("LUT4",),
+        "ff": ("TRELLIS_FF",),
+    },
+}
+
+
+def sphn_vga_top_sources():
+    sources = {}
+    for name in ("project.v", "vga.v"):
+        with open(os.path.join(os.path.dirname(__file__) or ".", "src", name)) as file:
+            sources[name] = file.read()
+    return sources, "project.v", "tt_um_spacecat_chan_john_pong_the_second"
+
+
+def ray_march_sources(x_res=64, y_res=48):
+    import ray_march
+
+    mod = ray_march.Top(x_res, y_res)
+    verilog = convert(mod, name="ray_march", ports=[mod.o_r, mod.o_g, mod.o_b, mod.o_hsync, mod.o_vsync],
+        emit_src=False, strip_internal_attrs=True)
+    return {"ray_march.v": verilog}, "ray_march.v", "ray_march"
+
+
+DESIGNS = {
+    "sphn_vga_top": sphn_vga_top_sources,
+    "ray_march": ray_march_sources,
+}
+
+
+def implement(sources, top_file, top, family):
+    """
+    synthesise and place and route a design, returns a dict with the cells after synthesis,
+    the lut and ff totals, the utilization nextpnr reports, the fmax of every clock and the
+    critical path of the slowest clock
+    """
+    flow = FAMILIES[family]
+    yosys = os.environ.get("YOSYS", "yosys")
+    nextpnr = os.environ.get(f"NEXTPNR_{family.upper()}", flow["nextpnr"])
+
+    # the statistics go to a file of their own, so that yosys can run quietly
+    _, (netlist, stat) = run_in_build_dir(
+        [yosys, "-q", "-p", f"read_verilog {top_file}; {flow['synth']} -top {top} -json design.json; tee -o stat.txt stat"],
+        sources, outputs=["design.json", "stat.txt"])
+    cells = parse_stat(stat)
+
+    _, (report,) = run_in_build_dir(
+        [nextpnr, *flow["device"], "--json", "design.json", "--freq", str(PIXEL_CLOCK_MHZ), "--report", "report.json", "--quiet"],
+        {"design.json": netlist}, outputs=["report.json"])
+    report = json.loads(report)
+
+    fmax = {clock: timing["achieved"] for clock, timing in report["fmax"].items()}
+    critical_path = None
+    if report["critical_paths"]:
+        slowest = min(fmax, key=fmax.get)
+        path = next((path for path in report["critical_paths"] if slowest in path["from"]), report["critical_paths"][0])
+        critical_path = {
+            "from": path["path"][0]["from"]["cell"],
+            "to": path["path"][-1]["to"]["cell"],
+            "delay_ns": sum(step["delay"] for step in path["path"]),
+            "steps": len(path["path"]),
+        }
+
+    return {
+        "cells": cells,
+        "luts": sum(count for cell, count in cells.items() if cell.startswith(flow["lut"])),
+        "ffs": sum(count for cell, count in cells.items() if cell.startswith(flow["ff"])),
+        "utilization": {name: usage["used"] for name, usage in report["utilization"].items() if usage["used"]},
+        "fmax": fmax,
+        "critical_path": critical_path,
+    }
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=os.path.dirname(__file__) or ".",
+        capture_output=True, text=True, check=True).stdout.strip()
+
+
+def short_commit(rev):
+    """the short hash of any name git knows for a commit, so that a tag or a longer hash finds the same file"""
+    try:
+        return _git("rev-parse", "--short", f"{rev}^{{commit}}")
+    except (OSError, subprocess.CalledProcessError):
+        return rev
+
+
+def commit_name():
+    """the short hash of HEAD, with -dirty after it when the tracked files have changes"""
+    try:
+        commit = _git("rev-parse", "--short", "HEAD")
+        dirty = _git("status", "--porcelain", "--untracked-files=no") != ""
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def _change(new, before):
+    return f" ({new - before:+.4g})" if before is not None else ""
+
+
+def print_results(results, baseline=None):
+    for design, result in results.items():
+        old = (baseline or {}).get(design)
+        print(design)
+        print(f"  luts {result['luts']}{_change(result['luts'], old and old['luts'])}"
+            f"  ffs {result['ffs']}{_change(result['ffs'], old and old['ffs'])}"
+            f"  cells {result['cells']['cells']}{_change(result['cells']['cells'], old and old['cells']['cells'])}")
+        for clock, achieved in result["fmax"].items():
+            before = old["fmax"].get(clock) if old else None
+            verdict = "ok" if achieved >= PIXEL_CLOCK_MHZ else "FAILS"
+            print(f"  fmax {achieved:.2f}MHz{_change(achieved, before)} {verdict} on {clock}")
+        path = result["critical_path"]
+        if path:
+            print(f"  critical path {path['delay_ns']:.2f}ns over {path['steps']} steps, {path['from']} -> {path['to']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--family", choices=FAMILIES, default="ice40")
+    parser.add_argument("--design", choices=DESIGNS, action="append", help="design to implement, can be given more than once, all of them by default")
+    parser.add_argument("--results", default="pnr_results", metavar="DIR", help="directory that keeps a json file per commit")
+    parser.add_argument("--baseline", metavar="COMMIT", help="compare against the results stored for this commit")
+    args = parser.parse_args()
+
+    # the baseline is looked up first, so that a missing one doesn't waste a whole run
+    baseline = None
+    if args.baseline:
+        path = os.path.join(args.results, f"{short_commit(args.baseline)}-{args.family}.json")
+        if not os.path.exists(path):
+            raise SystemExit(f"no results for {args.baseline} in {path}, run pnr.py on that commit first")
+        with open(path) as file:
+            baseline = json.load(file)["results"]
+
+    results = {}
+    for design in args.design or DESIGNS:
+        results[design] = implement(*DESIGNS[design](), args.family)
+    print_results(results, baseline)
+
+    os.makedirs(args.results, exist_ok=True)
+    commit = commit_name()
+    with open(os.path.join(args.results, f"{commit}-{args.family}.json"), "w") as file:
+        json.dump({"commit": commit, "family": args.family, "results": results}, file, indent=2)
+
+    if any(achieved < PIXEL_CLOCK_MHZ for result in results.values() for achieved in result["fmax"].values()):
+        raise SystemExit(1)
@@ -1,9 +1,46 @@
-from math import atan2, radians
 from typing import List
 from amaranth import *
+from amaranth.lib.fifo import AsyncFIFO
+
+try:
+    from .modes import DEFAULT_MODE
+    from .trig_tables import HALF_PI, PI, TWO_PI, atan_table, cordic_gain, sine_table
+except ImportError:
+    from modes import DEFAULT_MODE
+    from trig_tables import HALF_PI, PI, TWO_PI, atan_table, cordic_gain, sine_table
 
 class Top(Elaboratable):
-    def __init__(self, x_res, y_res):
+    def __init__(self, x_res, y_res, pipeline=None, lanes=1, mode=DEFAULT_MODE, stream=False, double_buffer=True, iterations=19, fraction=18,
+                 table=None, interpolate=False):
+        """
+        pipeline is the number of stages of a PipelinedCordic to stream the pixels through, None uses
+        the iterative Cordic. lanes is the number of iterative Cordics that work on the frame at the
+        same time, lane k does every row y with y % lanes == k. with stream the pixels aren't computed
+        at all, they are written by the host through self.stream, see PixelStream.
+
+        with double_buffer a frame is computed into the back buffer while the front one is shown, and
+        they swap at the vsync after the frame is done. so the compute has the whole frame instead of
+        the blanking, and a frame that takes longer is shown a frame late instead of torn. the host
+        draws straight onto the screen, so a streamed Top only has the one buffer
+
+        iterations and fraction are the rotations and the fractional bits of the datapath of the
+        cordics, fewer of either is smaller and the iterative one takes iterations + 2 clocks a pixel.
+        python cordic_model.py shows what they cost in error and in wrong colours
+
+        table swaps the cordics for a SineTable with its entries 2**table apart, which answers the
+        clock after it is asked, so the pixels stream through it like through a PipelinedCordic.
+        only 3 bits of every sin and cos reach the screen, so a small table is plenty
+        """
+        if lanes < 1:
+            raise ValueError(f"a Top needs at least one lane, not {lanes}")
+        if pipeline is not None and lanes != 1:
+            # the pipeline already finishes a pixel every clock, which is all the write port of the PixelBlock takes
+            raise ValueError("lanes only work with the iterative Cordic")
+        if table is not None and (pipeline is not None or lanes != 1):
+            raise ValueError("a SineTable already takes a pixel every clock, it has no stages or lanes")
+        if stream and (pipeline is not None or lanes != 1 or table is not None):
+            raise ValueError("a streamed Top doesn't compute any pixels")
+
         self.o_r = Signal(3)
         self.o_g = Signal(3)
         self.o_b = Signal(3)
@@ -12,16 +49,54 @@ class Top(Elaboratable):
 
         self.x_res = x_res
         self.y_res = y_res
+        self.pipeline = pipeline
+        self.lanes = lanes
+        self.iterations = iterations
+        self.fraction = fraction
+        self.table = table
+        self.interpolate = interpolate
+
+        self.double_buffer = double_buffer and not stream
+        self.pixels = PixelBlock(x_res, y_res, double=self.double_buffer)
+        self.mode = mode
+        self.vga = VGAOutput(self.pixels, mode)
+        self.stream = PixelStream(self.pixels) if stream else None
     
     def elaborate(self, platform):
         m = Module()
 
-        m.submodules.pixels = pixels = PixelBlock(self.x_res, self.y_res)
-        m.submodules.cordic = cordic = Cordic()
-        m.submodules.vga = vga = VGAOutput(pixels, 16, 96, 48, 10, 2, 33)
+        m.submodules.pixels = pixels = self.pixels
+        m.submodules.vga = vga = self.vga
+        m.d.comb += [
+            self.o_r.eq(vga.o_r),
+            self.o_g.eq(vga.o_g),
+            self.o_b.eq(vga.o_b),
+            self.o_hsync.eq(vga.o_hsync),
+            self.o_vsync.eq(vga.o_vsync),
+            vga.i_enable.eq(1),
+        ]
+
+        if self.stream is not None:
+            m.submodules.stream = self.stream
+            return m
+
+        if self.table is not None:
+            cordics = [SineTable(self.table, self.interpolate)]
+        elif self.pipeline is None:
+            cordics = [Cordic(self.iterations, self.fraction) for _ in range(self.lanes)]
+        else:
+            cordics = [PipelinedCordic(self.pipeline, self.iterations, self.fraction)]
+        for lane, cordic in enumerate(cordics):
+            m.submodules["cordic" if lane == 0 else f"cordic_{lane}"] = cordic
 
         prev_vsync = Signal()
         m.d.pix += prev_vsync.eq(vga.o_vsync)
+        if self.mode.sync_high:
+            vsync_started = ~prev_vsync & vga.o_vsync
+        else:
+            vsync_started = prev_vsync & ~vga.o_vsync
+        # the nearest whole refresh rate, so that the step doesn't change with the 59.94Hz of 640x480@60
+        time_step = PI // (2 * round(self.mode.refresh))
 
         x_counter = Signal(range(self.x_res))
         y_counter = Signal(range(self.y_res))
@@ -29,62 +104,184 @@ class Top(Elaboratable):
         # 3.16
         time_counter = Signal(19)
 
-        with m.FSM(domain="pix"):
-            with m.State("vsync"):
-                with m.If(prev_vsync & ~vga.o_vsync):
-                    m.next = "start_sin"
+        x_factor = PI // self.x_res
+        y_factor = PI // self.y_res
+
+        def wrap(angle):
+            return Mux(angle > TWO_PI, angle - TWO_PI, angle)
+
+        # the angle of the pixel at the counters, time + x * x_factor + y * y_factor, and of the first
+        # pixel of its row, stepped along with the counters instead of multiplied out for every pixel.
+        # the x and y parts are each less than pi, so the whole sum is less than 4pi and wrapping it
+        # after every step comes out the same as wrapping it once
+        angle = Signal(19)
+        row_angle = Signal(19)
+        frame_angle = wrap(time_counter + time_step)
+
+        def start_frame():
+            return [
+                x_counter.eq(0),
+                y_counter.eq(0),
+                time_counter.eq(frame_angle), # 90 degrees per second
+                row_angle.eq(frame_angle),
+                angle.eq(frame_angle),
+            ]
+
+        def next_row(rows):
+            return [
+                row_angle.eq(wrap(row_angle + rows * y_factor)),
+                angle.eq(wrap(row_angle + rows * y_factor)),
+            ]
+
+        def lane_angle(lane):
+            return angle if lane == 0 else wrap(angle + lane * y_factor)
+
+        def colour(cordic):
+            return Cat((((cordic.o_cos >> 1) + 2**15).as_unsigned() >> 14)[0:3], C(0, 3), (((cordic.o_sin >> 1) + 2**15).as_unsigned() >> 14)[0:3])
+
+        if self.pipeline is None and self.table is None:
+            # all lanes start together and the Cordic always takes the same number of clocks, so they also
+            # finish together. lane 0 writes straight away, the others wait in a register for their turn
+            # at the write port while the next pixels are being computed. the drain takes lanes - 1 clocks,
+            # so unless there are more lanes than the Cordic takes clocks it is over before the next results
+            # come out, and a frame takes x_res * ceil(y_res / lanes) * (latency + 1) clocks
+            held = [Signal(9, name=f"held_{lane}") for lane in range(1, self.lanes)]
+            held_valid = [Signal(name=f"held_valid_{lane}") for lane in range(1, self.lanes)]
+            held_x = Signal.like(x_counter)
+            held_y = Signal.like(y_counter)
+            drain = Signal(range(self.lanes))
+
+            if self.lanes > 1:
+                with m.If(drain != 0):
                     m.d.pix += [
-                        x_counter.eq(0),
-                        y_counter.eq(0),
-                        time_counter.eq(time_counter + int(radians(90 / 60) * 2**16)) # 90 degrees per second
+                        pixels.i_write_val.eq(Array(held)[drain - 1]),
+                        pixels.i_write.eq(Array(held_valid)[drain - 1]),
+                        pixels.i_wx.eq(held_x),
+                        pixels.i_wy.eq(held_y + drain),
+                        drain.eq(Mux(drain == self.lanes - 1, 0, drain + 1)),
                     ]
 
-            with m.State("start_sin"):
-                next_time_counter = Signal(19)
-                m.d.comb += next_time_counter.eq(time_counter)
-                with m.If(time_counter > int(radians(360) * 2**16)):
-                    m.d.comb += next_time_counter.eq(time_counter - int(radians(360) * 2**16))
-                    m.d.pix += time_counter.eq(next_time_counter)
+            with m.FSM(domain="pix"):
+                with m.State("vsync"):
+                    # the held pixels of the last row have to be in the back buffer before it is shown
+                    with m.If(vsync_started & (drain == 0)):
+                        m.d.comb += pixels.i_swap.eq(1)
+                        m.next = "start_sin"
+                        m.d.pix += start_frame()
+
+                with m.State("start_sin"):
+                    # the results of the last pixels all have to be written before new ones can come out
+                    with m.If((drain == 0) if self.lanes - 1 > cordics[0].latency else 1):
+                        for lane, cordic in enumerate(cordics):
+                            m.d.comb += cordic.i_value.eq(lane_angle(lane))
+                            m.d.comb += cordic.i_start.eq(1)
+                        m.next = "sin_wait"
                 
-                x_factor = int((radians(180) * 2**16)/self.x_res)
-                y_factor = int((radians(180) * 2**16)/self.y_res)
-
-                angle = next_time_counter + x_counter * x_factor + y_counter * y_factor
-                final_angle = Mux(angle > int(radians(360) * 2**16), angle - int(radians(360) * 2**16), angle)
-                m.d.comb += cordic.i_value.eq(final_angle)
-                m.d.comb += cordic.i_start.eq(1)
-                m.next = "sin_wait"
-            
-            with m.State("sin_wait"):
-                with m.If(cordic.o_done):
-                    m.d.pix += [
-                        pixels.i_write_val.eq(Cat((((cordic.o_cos >> 1) + 2**15).as_unsigned() >> 14)[0:3], C(0, 3), (((cordic.o_sin >> 1) + 2**15).as_unsigned() >> 14)[0:3])),
-                        pixels.i_write.eq(1),
-                        pixels.i_wx.eq(x_counter),
-                        pixels.i_wy.eq(y_counter),
-                    ]
+                with m.State("sin_wait"):
+                    with m.If(cordics[0].o_done):
+                        m.d.pix += [
+                            pixels.i_write_val.eq(colour(cordics[0])),
+                            pixels.i_write.eq(1),
+                            pixels.i_wx.eq(x_counter),
+                            pixels.i_wy.eq(y_counter),
+                        ]
+                        if self.lanes > 1:
+                            m.d.pix += [
+                                held_x.eq(x_counter),
+                                held_y.eq(y_counter),
+                                drain.eq(1),
+                            ]
+                            for lane, cordic in enumerate(cordics[1:], 1):
+                                m.d.pix += [
+                                    held[lane - 1].eq(colour(cordic)),
+                                    held_valid[lane - 1].eq(y_counter + lane < self.y_res),
+                                ]
+                        m.d.pix += x_counter.eq(x_counter + 1)
+                        m.d.pix += angle.eq(wrap(angle + x_factor))
+                        m.next = "start_sin"
+                        with m.If(x_counter == self.x_res - 1):
+                            m.d.pix += x_counter.eq(0)
+                            m.d.pix += y_counter.eq(y_counter + self.lanes)
+                            m.d.pix += next_row(self.lanes)
+                            with m.If(y_counter >= self.y_res - self.lanes):
+                                m.d.pix += y_counter.eq(0)
+                                m.next = "vsync"
+        else:
+            cordic = cordics[0]
+            write_x = Signal(range(self.x_res))
+            write_y = Signal(range(self.y_res))
+            last_write = cordic.o_done & (write_x == self.x_res - 1) & (write_y == self.y_res - 1)
+
+            # a new angle goes into the pipeline every clock, the results come out in the same order
+            # a few clocks later, so the write side keeps its own pair of counters
+            with m.FSM(domain="pix"):
+                with m.State("vsync"):
+                    with m.If(vsync_started):
+                        m.d.comb += pixels.i_swap.eq(1)
+                        m.next = "stream"
+                        m.d.pix += start_frame()
+
+                with m.State("stream"):
+                    m.d.comb += cordic.i_value.eq(angle)
+                    m.d.comb += cordic.i_start.eq(1)
                     m.d.pix += x_counter.eq(x_counter + 1)
-                    m.next = "start_sin"
+                    m.d.pix += angle.eq(wrap(angle + x_factor))
                     with m.If(x_counter == self.x_res - 1):
                         m.d.pix += x_counter.eq(0)
                         m.d.pix += y_counter.eq(y_counter + 1)
+                        m.d.pix += next_row(1)
                         with m.If(y_counter == self.y_res - 1):
                             m.d.pix += y_counter.eq(0)
-                            m.next = "vsync"
+                            m.next = "drain"
 
-        m.d.comb += [
-            self.o_r.eq(vga.o_r),
-            self.o_g.eq(vga.o_g),
-            self.o_b.eq(vga.o_b),
-            self.o_hsync.eq(vga.o_hsync),
-            self.o_vsync.eq(vga.o_vsync),
-            vga.i_enable.eq(1),
-        ]
+                # the last pixels are still in the pipeline, the buffers can't swap before they are written
+                with m.State("drain"):
+                    with m.If(last_write):
+                        m.next = "vsync"
+
+            m.d.pix += pixels.i_write.eq(cordic.o_done)
+            with m.If(cordic.o_done):
+                m.d.pix += [
+                    pixels.i_write_val.eq(colour(cordic)),
+                    pixels.i_wx.eq(write_x),
+                    pixels.i_wy.eq(write_y),
+                    write_x.eq(write_x + 1),
+                ]
+                with m.If(write_x == self.x_res - 1):
+                    m.d.pix += write_x.eq(0)
+                    m.d.pix += write_y.eq(write_y + 1)
+                    with m.If(write_y == self.y_res - 1):
+                        m.d.pix += write_y.eq(0)
 
         return m
 
+def fold_quadrant(value):
+    """
+    folds a 3.16 angle from 0 to 2pi into the first quadrant for Cordic, PipelinedCordic and
+    SineTable, returns the folded angle, which can land one past pi/2, and whether sin and cos are
+    positive. the same fold as _fold in cordic_model.py
+    """
+    post_sin_fix = Mux(value >= PI, TWO_PI - value, value)
+    final_fixed = Mux(post_sin_fix >= HALF_PI, PI - post_sin_fix, post_sin_fix)
+    return final_fixed, ~(value > PI), ~(post_sin_fix > HALF_PI)
+
 class Cordic(Elaboratable):
-    def __init__(self):
+    """
+    sin and cos of a 3.16 angle in radians, from 0 to 2pi. the angle is folded into the first
+    quadrant and then rotated to in iterations steps, one per clock, with a datapath of fraction
+    fractional bits, o_done is high iterations + 1 clocks after the one i_start was on.
+    cordic_model.py has a bit exact model of it to pick the two with
+    """
+    def __init__(self, iterations=19, fraction=18):
+        # past fraction + 1 the rotations are shifted away to nothing
+        if not 1 <= iterations <= fraction + 1:
+            raise ValueError(f"a Cordic with {fraction} fractional bits can do between 1 and {fraction + 1} iterations, not {iterations}")
+        if fraction < 8:
+            raise ValueError(f"a Cordic needs at least 8 fractional bits, not {fraction}")
+        self.iterations = iterations
+        self.fraction = fraction
+        self.latency = iterations + 1
+
         # 3.16 precision
         self.i_value = Signal(19)
         self.i_start = Signal()
@@ -96,36 +293,29 @@ class Cordic(Elaboratable):
     
     def elaborate(self, platform):
         m = Module()
-    
-        intermediate = Signal(19)
+
+        fraction = self.fraction
+        intermediate = Signal(fraction + 1)
 
         sin_pos = Signal()
         cos_pos = Signal()
 
-        theta = Signal(signed(20))
-        x = Signal(19)
-        y = Signal(signed(20))
-        iters = Signal(range(20))
+        theta = Signal(signed(fraction + 2))
+        x = Signal(fraction + 1)
+        y = Signal(signed(fraction + 2))
+        iters = Signal(range(self.iterations + 1))
 
-        atan_lut = [atan2(1, 2**i) for i in range(20)]
-        print(atan_lut, sum(atan_lut))
+        atan_lut = atan_table(self.iterations + 1, fraction)
 
         with m.FSM(domain="pix"):
             with m.State("waiting"):
                 with m.If(self.i_start):
-                    with m.If(self.i_value > int(radians(180) * 2**16)):
-                        m.d.pix += sin_pos.eq(0)
-                    with m.Else():
-                        m.d.pix += sin_pos.eq(1)
-                    post_sin_fix = Mux(self.i_value >= int(radians(180) * 2**16), int(radians(360) * 2**16) - self.i_value, self.i_value)
-                    with m.If(post_sin_fix > int(radians(90) * 2**16)):
-                        m.d.pix += cos_pos.eq(0)
-                    with m.Else():
-                        m.d.pix += cos_pos.eq(1)
-                    final_fixed = Mux(post_sin_fix >= int(radians(90) * 2**16), int(radians(180) * 2**16) - post_sin_fix, post_sin_fix)
+                    final_fixed, next_sin_pos, next_cos_pos = fold_quadrant(self.i_value)
                     m.d.pix += [
-                        intermediate.eq(final_fixed << 2),
-                        x.eq(0x40000),
+                        sin_pos.eq(next_sin_pos),
+                        cos_pos.eq(next_cos_pos),
+                        intermediate.eq(final_fixed << (fraction - 16) if fraction >= 16 else final_fixed >> (16 - fraction)),
+                        x.eq(1 << fraction),
                         y.eq(0),
                         iters.eq(0),
                         theta.eq(0)
@@ -135,73 +325,385 @@ class Cordic(Elaboratable):
             with m.State("calc"):
                 sigma = Signal(signed(2))
                 m.d.comb += sigma.eq(Mux(theta < intermediate, 1, -1))
-                lut_val = Signal(18)
-                for i in range(20):
+                lut_val = Signal(fraction)
+                for i in range(self.iterations + 1):
                     with m.If(iters == i):
-                        m.d.comb += lut_val.eq(int(atan_lut[i] * 2**18))
+                        m.d.comb += lut_val.eq(atan_lut[i])
                 m.d.pix += [
                     theta.eq(theta + sigma * lut_val),
                     x.eq(x - ((sigma * y) >> iters)),
                     y.eq(y + ((sigma * x) >> iters)),
                     iters.eq(iters + 1)
                 ]
-                with m.If(iters == 19):
-                    m.d.comb += self.o_cos.eq(((x * 155) >> 10) * Mux(cos_pos, 1, -1))
-                    m.d.comb += self.o_sin.eq(((y * 155) >> 10) * Mux(sin_pos, 1, -1))
+                # the outputs are from before the update on this clock, so after iterations rotations
+                with m.If(iters == self.iterations):
+                    gain = cordic_gain(self.iterations)
+                    m.d.comb += self.o_cos.eq(((x * gain) >> (fraction - 8)) * Mux(cos_pos, 1, -1))
+                    m.d.comb += self.o_sin.eq(((y * gain) >> (fraction - 8)) * Mux(sin_pos, 1, -1))
                     m.d.comb += self.o_done.eq(1)
                     m.next = "waiting"
 
         return m
 
 
+class PipelinedCordic(Elaboratable):
+    """
+    the same rotations as Cordic unrolled into a pipeline that takes a new angle every clock.
+    the quadrant fold is one stage, the rotations that reach the output are split as evenly as
+    possible over the given number of stages, so o_done follows i_start by latency = stages + 1 clocks.
+    stages defaults to one per rotation
+    """
+    def __init__(self, stages=None, iterations=19, fraction=18):
+        # past fraction + 1 the rotations are shifted away to nothing
+        if not 1 <= iterations <= fraction + 1:
+            raise ValueError(f"a PipelinedCordic with {fraction} fractional bits can do between 1 and {fraction + 1} iterations, not {iterations}")
+        if fraction < 8:
+            raise ValueError(f"a PipelinedCordic needs at least 8 fractional bits, not {fraction}")
+        stages = iterations if stages is None else stages
+        if not 1 <= stages <= iterations:
+            raise ValueError(f"a PipelinedCordic has between 1 and {iterations} stages, not {stages}")
+        self.stages = stages
+        self.iterations = iterations
+        self.fraction = fraction
+        self.latency = stages + 1
+
+        # 3.16 precision
+        self.i_value = Signal(19)
+        self.i_start = Signal()
+
+        # signed 1.16 precision
+        self.o_cos = Signal(signed(18))
+        self.o_sin = Signal(signed(18))
+        self.o_done = Signal()
+
+    def elaborate(self, platform):
+        m = Module()
+
+        fraction = self.fraction
+        atan_lut = atan_table(self.iterations, fraction)
+
+        # the fold into the first quadrant is registered as the first stage, like the waiting state of Cordic does
+        valid = Signal()
+        sin_pos = Signal()
+        cos_pos = Signal()
+        intermediate = Signal(fraction + 1)
+        final_fixed, folded_sin_pos, folded_cos_pos = fold_quadrant(self.i_value)
+        m.d.pix += [
+            valid.eq(self.i_start),
+            sin_pos.eq(folded_sin_pos),
+            cos_pos.eq(folded_cos_pos),
+            intermediate.eq(final_fixed << (fraction - 16) if fraction >= 16 else final_fixed >> (16 - fraction)),
+        ]
+
+        theta = C(0, signed(fraction + 2))
+        x = C(1 << fraction, fraction + 1)
+        y = C(0, signed(fraction + 2))
+
+        # stage boundaries, the earlier stages get the extra rotations
+        per_stage, extra = divmod(self.iterations, self.stages)
+        ends = []
+        end = 0
+        for stage in range(self.stages):
+            end += per_stage + (stage < extra)
+            ends.append(end)
+
+        for i in range(self.iterations):
+            sigma = Signal(signed(2), name=f"sigma_{i}")
+            m.d.comb += sigma.eq(Mux(theta < intermediate, 1, -1))
+            lut_val = C(atan_lut[i], fraction)
+            next_theta = Signal(signed(fraction + 2), name=f"theta_{i}")
+            next_x = Signal(fraction + 1, name=f"x_{i}")
+            next_y = Signal(signed(fraction + 2), name=f"y_{i}")
+            domain = m.d.pix if i + 1 in ends else m.d.comb
+            domain += [
+                next_theta.eq(theta + sigma * lut_val),
+                next_x.eq(x - ((sigma * y) >> i)),
+                next_y.eq(y + ((sigma * x) >> i)),
+            ]
+            theta, x, y = next_theta, next_x, next_y
+
+            if i + 1 in ends:
+                # everything else that the later stages need moves along with the rotation
+                next_valid = Signal(name=f"valid_{i}")
+                next_sin_pos = Signal(name=f"sin_pos_{i}")
+                next_cos_pos = Signal(name=f"cos_pos_{i}")
+                next_intermediate = Signal(fraction + 1, name=f"intermediate_{i}")
+                m.d.pix += [
+                    next_valid.eq(valid),
+                    next_sin_pos.eq(sin_pos),
+                    next_cos_pos.eq(cos_pos),
+                    next_intermediate.eq(intermediate),
+                ]
+                valid, sin_pos, cos_pos, intermediate = next_valid, next_sin_pos, next_cos_pos, next_intermediate
+
+        gain = cordic_gain(self.iterations)
+        m.d.comb += [
+            self.o_cos.eq(((x * gain) >> (fraction - 8)) * Mux(cos_pos, 1, -1)),
+            self.o_sin.eq(((y * gain) >> (fraction - 8)) * Mux(sin_pos, 1, -1)),
+            self.o_done.eq(valid),
+        ]
+
+        return m
+
+
+class SineTable(Elaboratable):
+    """
+    sin and cos with the same ports as Cordic from a quarter wave table, the answer is there the clock
+    after i_start and a new angle can go in every clock, so latency = 1 like a PipelinedCordic.
+    the angle is folded into the first quadrant like Cordic does it, sin is the table at the folded
+    angle and cos the table at pi/2 minus it. the entries are 2**shift apart in the 3.16 angle, with
+    interpolate the low shift bits of the angle go between two entries instead of being dropped.
+    the angles past 2pi give nonsense, Top never asks for them
+    """
+    latency = 1
+
+    def __init__(self, shift=8, interpolate=False):
+        if not 0 <= shift <= 16:
+            raise ValueError(f"a SineTable has its entries between 2**0 and 2**16 apart, not 2**{shift}")
+        self.shift = shift
+        self.interpolate = interpolate
+
+        # 3.16 precision
+        self.i_value = Signal(19)
+        self.i_start = Signal()
+
+        # signed 1.16 precision
+        self.o_cos = Signal(signed(18))
+        self.o_sin = Signal(signed(18))
+        self.o_done = Signal()
+
+    def elaborate(self, platform):
+        m = Module()
+
+        table = sine_table(self.shift)
+
+        final_fixed, sin_pos, cos_pos = fold_quadrant(self.i_value)
+        # the fold can land one past pi/2
+        sin_angle = final_fixed.as_unsigned()[0:17]
+        cos_angle = Mux(final_fixed > HALF_PI, 0, HALF_PI - final_fixed).as_unsigned()[0:17]
+
+        def lookup(name, angle):
+            index = angle >> self.shift
+            port = Memory(width=17, depth=len(table), init=table).read_port(domain="comb")
+            m.submodules[f"{name}_rom"] = port
+            m.d.comb += port.addr.eq(index)
+            if not self.interpolate or self.shift == 0:
+                return port.data
+            next_port = Memory(width=17, depth=len(table), init=table[1:] + [table[-1]]).read_port(domain="comb")
+            m.submodules[f"{name}_next_rom"] = next_port
+            m.d.comb += next_port.addr.eq(index)
+            # the table goes down past pi/2, so the step can be negative
+            step = Signal(signed(18), name=f"{name}_step")
+            m.d.comb += step.eq(next_port.data - port.data)
+            return port.data + ((step * angle[0:self.shift]) >> self.shift)
+
+        m.d.pix += self.o_done.eq(self.i_start)
+        with m.If(self.i_start):
+            m.d.pix += [
+                self.o_sin.eq(lookup("sin", sin_angle) * Mux(sin_pos, 1, -1)),
+                self.o_cos.eq(lookup("cos", cos_angle) * Mux(cos_pos, 1, -1)),
+            ]
+
+        return m
+
+
 class PixelBlock(Elaboratable):
-    def __init__(self, x_res, y_res):
+    """
+    the framebuffer, one 9 bit colour per pixel in a memory with a write port and a read port,
+    both in the pix domain. o_val is the pixel at (i_x, i_y) one clock later, a write to the same
+    pixel on that clock isn't seen until the clock after.
+    rows are a power of two apart in the memory so that the address is just Cat(x, y).
+    a double PixelBlock has a front buffer that is read and a back buffer that is written, i_swap
+    swaps them on the next clock. the buffer is the lowest bit of the address, so the memory is only
+    twice as big
+    """
+    def __init__(self, x_res, y_res, double=False):
         self.i_x = Signal(range(x_res))
         self.i_y = Signal(range(y_res))
         self.i_write = Signal()
         self.i_wx = Signal(range(x_res))
         self.i_wy = Signal(range(y_res))
         self.i_write_val = Signal(9)
+        self.i_swap = Signal()
 
         self.o_val = Signal(9)
 
-        self.pixels = [[Signal(9) for _ in range(y_res)] for _ in range(x_res)]
         self.x_res = x_res
         self.y_res = y_res
+        self.double = double
+
+        self.memory = Memory(width=9, depth=(1 << len(self.i_x)) * y_res * (2 if double else 1))
 
     def elaborate(self, platform):
         m = Module()
 
-        with m.If(self.i_write):
-            for x in range(self.x_res):
-                with m.If(self.i_wx == x):
-                    for y in range(self.y_res):
-                        with m.If(self.i_wy == y):
-                            m.d.pix += self.pixels[x][y].eq(self.i_write_val)
-
-        with m.Switch(self.i_x):
-            for x in range(self.x_res):
-                with m.Case(x):
-                    intermediate = Signal(9)
-                    m.d.pix += self.o_val.eq(intermediate)
-                    with m.Switch(self.i_y):
-                        for y in range(self.y_res):
-                            with m.Case(y):
-                                m.d.comb += intermediate.eq(self.pixels[x][y])
+        m.submodules.write = write = self.memory.write_port(domain="pix")
+        m.submodules.read = read = self.memory.read_port(domain="pix", transparent=False)
+
+        if self.double:
+            front = Signal()
+            with m.If(self.i_swap):
+                m.d.pix += front.eq(~front)
+            write_addr = Cat(~front, self.i_wx, self.i_wy)
+            read_addr = Cat(front, self.i_x, self.i_y)
+        else:
+            write_addr = Cat(self.i_wx, self.i_wy)
+            read_addr = Cat(self.i_x, self.i_y)
+
+        m.d.comb += [
+            write.addr.eq(write_addr),
+            write.data.eq(self.i_write_val),
+            write.en.eq(self.i_write),
+            read.addr.eq(read_addr),
+            self.o_val.eq(read.data),
+        ]
+
+        return m
+
+class PixelStream(Elaboratable):
+    """
+    writes pixels from a byte stream into a PixelBlock, the bytes are written into the fifo in the
+    w_domain. the stream is made of runs, a run is the x, y and count - 1 of up to 256 pixels
+    followed by every pixel as 2 bytes, little endian, see encode_pixels. the pixels of a run go
+    along the row and wrap onto the next one, and the last row wraps onto the first.
+    a byte is taken every clock, so the stream can go as fast as half the pixel clock in pixels
+    """
+    def __init__(self, pixels: PixelBlock, depth=64, w_domain="sync"):
+        if pixels.x_res > 256 or pixels.y_res > 256:
+            raise ValueError(f"the coordinates of a {pixels.x_res}x{pixels.y_res} PixelBlock don't fit in a byte")
+        self.pixels = pixels
+        self.fifo = AsyncFIFO(width=8, depth=depth, r_domain="pix", w_domain=w_domain)
+
+        self.w_data = self.fifo.w_data
+        self.w_rdy = self.fifo.w_rdy
+        self.w_en = self.fifo.w_en
+
+    def elaborate(self, platform):
+        m = Module()
+        m.submodules.fifo = fifo = self.fifo
+        pixels = self.pixels
+
+        x = Signal.like(pixels.i_wx)
+        y = Signal.like(pixels.i_wy)
+        left = Signal(8)
+        low = Signal(8)
+        data = fifo.r_data
+
+        m.d.comb += fifo.r_en.eq(1)
+        m.d.pix += pixels.i_write.eq(0)
+        with m.FSM(domain="pix"):
+            with m.State("x"):
+                with m.If(fifo.r_rdy):
+                    m.d.pix += x.eq(data)
+                    m.next = "y"
+
+            with m.State("y"):
+                with m.If(fifo.r_rdy):
+                    m.d.pix += y.eq(data)
+                    m.next = "count"
+
+            with m.State("count"):
+                with m.If(fifo.r_rdy):
+                    m.d.pix += left.eq(data)
+                    m.next = "low"
+
+            with m.State("low"):
+                with m.If(fifo.r_rdy):
+                    m.d.pix += low.eq(data)
+                    m.next = "high"
+
+            with m.State("high"):
+                with m.If(fifo.r_rdy):
+                    m.d.pix += [
+                        pixels.i_write.eq(1),
+                        pixels.i_wx.eq(x),
+                        pixels.i_wy.eq(y),
+                        pixels.i_write_val.eq(Cat(low, data[0])),
+                        x.eq(x + 1),
+                        left.eq(left - 1),
+                    ]
+                    with m.If(x == pixels.x_res - 1):
+                        m.d.pix += [
+                            x.eq(0),
+                            y.eq(Mux(y == pixels.y_res - 1, 0, y + 1)),
+                        ]
+                    m.next = "low"
+                    with m.If(left == 0):
+                        m.next = "x"
+
+        return m
+
+
+def encode_pixels(x, y, values, x_res, y_res):
+    """the bytes for PixelStream that write the 9 bit values from (x, y) on, along the rows"""
+    data = bytearray()
+    values = list(values)
+    for start in range(0, len(values), 256):
+        run = values[start:start + 256]
+        data += bytes((x, y, len(run) - 1))
+        for value in run:
+            data += bytes((value & 0xff, value >> 8 & 1))
+        x += len(run)
+        y = (y + x // x_res) % y_res
+        x %= x_res
+    return bytes(data)
+
+
+class Scaler(Elaboratable):
+    """
+    maps a beam position counting up from 0 onto a coordinate of a smaller resolution, o_coord is
+    the largest c below the resolution with (screen_res * c) // res < the beam position, or 0.
+    instead of comparing the position against every boundary it keeps the coordinate and how far
+    the beam is from the next boundary, err = position * res - screen_res * (coord + 1), in registers
+    that move along with the beam, so the cost doesn't depend on the resolution.
+    i_step and i_restart have to be driven with the same conditions that move the beam counter,
+    restart wins over step
+    """
+    def __init__(self, res, screen_res):
+        if not 1 <= res <= screen_res:
+            raise ValueError(f"can't scale {screen_res} down to {res}")
+        self.res = res
+        self.screen_res = screen_res
+
+        self.i_step = Signal()
+        self.i_restart = Signal()
+
+        self.o_coord = Signal(range(res))
+
+    def elaborate(self, platform):
+        m = Module()
+
+        # the beam only moves by one, and res <= screen_res, so the coordinate never has to move by more than one
+        err = Signal(range(-self.screen_res, self.res + 1), reset=-self.screen_res)
+        stepped = err + self.res
+
+        with m.If(self.i_restart):
+            m.d.pix += [
+                self.o_coord.eq(0),
+                err.eq(err.reset),
+            ]
+        with m.Elif(self.i_step & (self.o_coord != self.res - 1)):
+            with m.If(stepped > 0):
+                m.d.pix += [
+                    self.o_coord.eq(self.o_coord + 1),
+                    err.eq(stepped - self.screen_res),
+                ]
+            with m.Else():
+                m.d.pix += err.eq(stepped)
 
         return m
 
-class VGAOutput(Elaboratable):
-    def __init__(self, pixels: PixelBlock, hfront, hsync, hback, vfront, vsync, vback):
-        self._hfront = hfront
-        self._hsync = hsync
-        self._hback = hback
-        self._vfront = vfront
-        self._vsync = vsync
-        self._vback = vback
 
+class VGAOutput(Elaboratable):
+    def __init__(self, pixels: PixelBlock, mode=DEFAULT_MODE):
+        self.mode = mode
         self.pixels = pixels
 
+        self.line_length = mode.line_length
+        self.screen_length = mode.screen_length
+        self.hsync_start = mode.hsync_start
+        self.vsync_start = mode.vsync_start
+
         self.i_enable = Signal()
 
         self.o_r = Signal(3)
@@ -213,8 +715,12 @@ class VGAOutput(Elaboratable):
     def elaborate(self, platform):
         m = Module()
 
-        line_length = 640 + self._hfront + self._hsync + self._hback
-        screen_length = 480 + self._vfront + self._vsync + self._vback
+        line_length = self.line_length
+        screen_length = self.screen_length
+        width = self.mode.width
+        height = self.mode.height
+        # the level of the syncs during the sync pulses
+        sync_active = int(self.mode.sync_high)
 
         clock = Signal(22)
         with m.If(self.i_enable):
@@ -227,54 +733,58 @@ class VGAOutput(Elaboratable):
             with m.If(clock[11:22] == screen_length - 1):
                 m.d.pix += clock[11:22].eq(0)
         
-        for x in range(self.pixels.x_res):
-            with m.If(clock[0:11] > ((640 * x) // self.pixels.x_res)):
-                m.d.comb += self.pixels.i_x.eq(x)
-        for y in range(self.pixels.y_res):
-            with m.If(clock[11:22] > ((480 * y) // self.pixels.y_res)):
-                m.d.comb += self.pixels.i_y.eq(y)
+        # the framebuffer coordinates follow the beam, see Scaler
+        m.submodules.x_scaler = x_scaler = Scaler(self.pixels.x_res, width)
+        m.submodules.y_scaler = y_scaler = Scaler(self.pixels.y_res, height)
+        m.d.comb += [
+            x_scaler.i_restart.eq(clock[0:11] == line_length - 1),
+            x_scaler.i_step.eq(self.i_enable),
+            y_scaler.i_restart.eq((clock[0:11] == line_length - 1) & (clock[11:22] == screen_length - 1)),
+            y_scaler.i_step.eq(clock[0:11] == line_length - 1),
+            self.pixels.i_x.eq(x_scaler.o_coord),
+            self.pixels.i_y.eq(y_scaler.o_coord),
+        ]
 
         m.d.comb += Cat(self.o_r, self.o_g, self.o_b).eq(self.pixels.o_val)
 
         m.d.comb += [
-            self.o_hsync.eq(1),
-            self.o_vsync.eq(1),
+            self.o_hsync.eq(1 - sync_active),
+            self.o_vsync.eq(1 - sync_active),
         ]
 
-        with m.If((clock[0:11] >= 640) | (clock[11:22] >= 480)):
+        with m.If((clock[0:11] >= width) | (clock[11:22] >= height)):
             m.d.comb += [
                 self.o_r.eq(0),
                 self.o_g.eq(0),
                 self.o_b.eq(0),
             ]
-        with m.If((clock[0:11] >= 640 + self._hfront) & (clock[0:11] < line_length - self._hback)):
-            m.d.comb += self.o_hsync.eq(0)
-        with m.If((clock[11:22] >= 480 + self._vfront) & (clock[11:22] < screen_length - self._vback)):
-            m.d.comb += self.o_vsync.eq(0)
+        with m.If((clock[0:11] >= self.hsync_start) & (clock[0:11] < self.hsync_start + self.mode.hsync)):
+            m.d.comb += self.o_hsync.eq(sync_active)
+        with m.If((clock[11:22] >= self.vsync_start) & (clock[11:22] < self.vsync_start + self.mode.vsync)):
+            m.d.comb += self.o_vsync.eq(sync_active)
 
         return m
 
 
 
 if __name__ == "__main__":
-    from amaranth.sim import *
-    from amaranth.back.verilog import convert
-
-    mod = Top(4,4)
-
-    def test():
-        for _ in range(420010 * 2):
-            yield
-
-        print("done")
-
-
-    sim = Simulator(mod)
-    sim.add_clock(2e-12, domain="pix")
-    sim.add_sync_process(test, domain="pix")
-
-    with sim.write_vcd("test.vcd", "test.gtkw"):
-        sim.run()
-
-    print("hii")
-
+    import argparse
+    from modes import MODES, add_mode_argument
+    import sim
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resolution", type=int, nargs=2, default=[4, 4], metavar=("X", "Y"), help="size of the pixel block")
+    parser.add_argument("--pipeline", type=int, metavar="STAGES", help="stream the pixels through a PipelinedCordic with this many stages")
+    parser.add_argument("--lanes", type=int, default=1, help="number of iterative Cordics computing the frame together")
+    parser.add_argument("--iterations", type=int, default=19, help="rotations in the cordics")
+    parser.add_argument("--fraction", type=int, default=18, help="fractional bits in the datapath of the cordics")
+    parser.add_argument("--table", type=int, metavar="SHIFT", help="use a SineTable with its entries 2**SHIFT apart instead of the cordics")
+    parser.add_argument("--interpolate", action="store_true", help="interpolate between the entries of the SineTable")
+    parser.add_argument("--single-buffer", action="store_true", help="compute into the buffer that is shown, like before the double buffering")
+    add_mode_argument(parser)
+    sim.add_arguments(parser)
+    args = parser.parse_args()
+
+    mod = Top(*args.resolution, pipeline=args.pipeline, lanes=args.lanes, mode=MODES[args.mode], double_buffer=not args.single_buffer,
+              iterations=args.iterations, fraction=args.fraction, table=args.table, interpolate=args.interpolate)
+    sim.run_from_args(mod, args)
@@ -1,24 +1,39 @@
 import logging
 import asyncio
+import time
 from amaranth import *
 
 from ....gateware.pll import *
 
 from ... import *
 
-from ..ray_march import Top
+from ..ray_march import Top, encode_pixels
+from ..modes import MODES, add_mode_argument
+
+X_RES = 64
+Y_RES = 48
 
 class BoilerplateSubtarget(Elaboratable):
-    def __init__(self, pads, in_fifo, out_fifo):
+    def __init__(self, pads, in_fifo, out_fifo, mode, stream=False):
         self.pads     = pads
         self.in_fifo  = in_fifo
         self.out_fifo = out_fifo
+        self.mode     = mode
+        self.stream   = stream
 
     def elaborate(self, platform):
         m = Module()
         m.domains.pix = cd_pix = ClockDomain(reset_less=True)
-        m.submodules += PLL(f_in=platform.default_clk_frequency, f_out=25175000, odomain="pix")
-        m.submodules.vga = self.vga = Top(16, 16)
+        m.submodules += PLL(f_in=platform.default_clk_frequency, f_out=self.mode.pixel_clock, odomain="pix")
+        m.submodules.vga = self.vga = Top(X_RES, Y_RES, mode=self.mode, stream=self.stream)
+
+        if self.stream:
+            # the host draws the pixels, see ray_march.PixelStream
+            m.d.comb += [
+                self.vga.stream.w_data.eq(self.out_fifo.r_data),
+                self.vga.stream.w_en.eq(self.out_fifo.r_rdy),
+                self.out_fifo.r_en.eq(self.vga.stream.w_rdy),
+            ]
 
         m.d.comb += [
             self.pads.r0_t.o.eq(self.vga.o_r[0]),
@@ -72,6 +87,8 @@ class RayApplet(GlasgowApplet):
 
         for pin in cls.__pins:
             access.add_pin_argument(parser, pin, default=True)
+        add_mode_argument(parser)
+        parser.add_argument("--stream", action="store_true", help="show pixels sent by the host instead of computing them")
 
     def build(self, target, args):
         self.mux_interface = iface = target.multiplexer.claim_interface(self, args)
@@ -79,6 +96,8 @@ class RayApplet(GlasgowApplet):
             pads=iface.get_pads(args, pins=self.__pins),
             in_fifo=iface.get_in_fifo(),
             out_fifo=iface.get_out_fifo(),
+            mode=MODES[args.mode],
+            stream=args.stream,
         ))
 
     @classmethod
@@ -90,10 +109,50 @@ class RayApplet(GlasgowApplet):
 
     @classmethod
     def add_interact_arguments(cls, parser):
-        pass
+        # with --stream
+        parser.add_argument("--image", metavar="FILE", help="show an image, scaled to the pixel block, instead of a moving test pattern")
+        parser.add_argument("--frames", type=int, metavar="FRAMES", help="stop after sending this many frames")
 
     async def interact(self, device, args, iface):
-        pass
+        if not args.stream:
+            return
+        if args.image:
+            frames = [image_pixels(args.image)]
+        else:
+            frames = [pattern_pixels(step) for step in range(X_RES)]
+
+        sent = 0
+        start = time.perf_counter()
+        reported = start
+        # the writes are queued and glasgow only holds them up when its buffers are full, so the
+        # next frame is encoded while the last one is still going out
+        while args.frames is None or sent < args.frames:
+            await iface.write(encode_pixels(0, 0, frames[sent % len(frames)], X_RES, Y_RES))
+            sent += 1
+            now = time.perf_counter()
+            if now - reported >= 1:
+                self.logger.info("%d frames, %.0f pixels/s", sent, sent * X_RES * Y_RES / (now - start))
+                reported = now
+        await iface.flush()
+        elapsed = time.perf_counter() - start
+        self.logger.info("%d frames in %.1fs, %.0f pixels/s", sent, elapsed, sent * X_RES * Y_RES / elapsed)
+
+
+def pattern_pixels(step):
+    """a colour gradient that moves to the left by a pixel every step, red and blue across and green down"""
+    pixels = []
+    for y in range(Y_RES):
+        for x in range(X_RES):
+            u = (x + step) % X_RES
+            pixels.append((u * 8 // X_RES) | (y * 8 // Y_RES) << 3 | (7 - u * 8 // X_RES) << 6)
+    return pixels
+
+
+def image_pixels(path):
+    from PIL import Image
+
+    image = Image.open(path).convert("RGB").resize((X_RES, Y_RES))
+    return [r >> 5 | (g >> 5) << 3 | (b >> 5) << 6 for r, g, b in image.getdata()]
 
 # -------------------------------------------------------------------------------------------------
 
@@ -0,0 +1,100 @@
+"""
+a numpy golden renderer for main.VGAOutput, draws the exact visible frame the hardware
+outputs for a set of inputs, as 3 bit per channel (r, g, b) values
+
+    frames = render_batch([game.vga_inputs() for game in games])   # (n, 480, 640, 3) uint8
+    frames = render_batch(states, MODES["800x600@60"])             # (n, 600, 800, 3) in another mode
+    bad = mismatches(captured, frames)                              # differing pixels per frame
+
+the layers are drawn in the same order as VGAOutput assigns them, so later ones win:
+score boxes, countdown box, sprite, paddles. blanking is everything outside the visible area,
+which is why anything past the right or bottom edge is simply clipped off
+"""
+import os
+
+import numpy as np
+
+try:
+    from .assets import load_sprite
+    from .modes import DEFAULT_MODE
+except ImportError:
+    from assets import load_sprite
+    from modes import DEFAULT_MODE
+
+_sprite_arrays = None
+
+def _sprite():
+    """(index, colours) arrays for the pope, colours is the palette as a (n, 3) lookup table"""
+    global _sprite_arrays
+    if _sprite_arrays is None:
+        sprite = load_sprite(os.path.join(os.path.dirname(__file__), "jp2smol_indexed.png"))
+        _sprite_arrays = (np.array(sprite.pixels, dtype=np.uint8), np.array(sprite.palette, dtype=np.uint8))
+    return _sprite_arrays
+
+
+def _column(states, name):
+    return np.array([state[name] for state in states], dtype=np.int64)
+
+
+def render_batch(states, mode=DEFAULT_MODE):
+    """
+    render a list of states, each a dict with the inputs of VGAOutput: pope_location, paddle_location,
+    enemy_paddle_location, player_score, enemy_score and timer. returns a (n, height, width, 3) uint8 array
+    """
+    count = len(states)
+    width = mode.width
+    height = mode.height
+    frames = np.zeros((count, height, width, 3), dtype=np.uint8)
+
+    player_score = _column(states, "player_score")
+    enemy_score = _column(states, "enemy_score")
+    timer = _column(states, "timer")
+    pope_location = _column(states, "pope_location")
+    paddle_location = _column(states, "paddle_location")
+    enemy_paddle_location = _column(states, "enemy_paddle_location")
+
+    #player score
+    frames[:, 50:75, 100:125, 0] = 7
+    frames[:, 50:75, 100:125, 1:3] = (~player_score & 7)[:, None, None, None]
+
+    #enemy score
+    frames[:, 50:75, width-125:width-100, 0] = 7
+    frames[:, 50:75, width-125:width-100, 1:3] = (~enemy_score & 7)[:, None, None, None]
+
+    #timer count down
+    countdown = np.stack([
+        timer > 120,
+        (timer <= 60) & (timer != 0),
+        (timer > 60) & (timer <= 120),
+    ], axis=-1) * 7
+    frames[:, 100:200, width//2-100:width//2+100] = countdown[:, None, None, :]
+
+    #pope
+    index, palette = _sprite()
+    dy, dx = np.nonzero(index)
+    colours = palette[index[dy, dx]]
+    ys = (pope_location >> 10)[:, None] + dy[None, :]
+    xs = (pope_location & 0x3ff)[:, None] + dx[None, :]
+    visible = (ys < height) & (xs < width)
+    frame_index = np.broadcast_to(np.arange(count)[:, None], ys.shape)
+    pixel_index = np.broadcast_to(np.arange(len(dy))[None, :], ys.shape)
+    frames[frame_index[visible], ys[visible], xs[visible]] = colours[pixel_index[visible]]
+
+    #paddles
+    rows = np.arange(height)[None, :]
+    paddle = (rows >= paddle_location[:, None]) & (rows < paddle_location[:, None] + 150)
+    enemy_paddle = (rows >= enemy_paddle_location[:, None]) & (rows < enemy_paddle_location[:, None] + 150)
+    frames[:, :, 25:50][paddle] = 7
+    frames[:, :, width-50:width-25][enemy_paddle] = 7
+
+    return frames
+
+
+def render(state, mode=DEFAULT_MODE):
+    """render a single state, returns a (height, width, 3) uint8 array"""
+    return render_batch([state], mode)[0]
+
+
+def mismatches(frames, expected):
+    """number of differing pixels in every frame of two equally shaped stacks of frames"""
+    return np.count_nonzero(np.any(np.asarray(frames) != np.asarray(expected), axis=-1), axis=(-2, -1))
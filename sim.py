@@ -0,0 +1,121 @@
+"""
+the command line simulation mode shared by main.py and ray_march.py
+
+    python main.py --frames 10                              # simulate 10 frames, no vcd
+    python main.py --frames 3 --vcd test.vcd                # also dump a vcd and a gtkw next to it
+    python main.py --frames 300 --input 190:move_up=1 --input 250:move_up=0
+    python main.py --frames 200 --input 190.2:move_up=1 --input 190.3:move_up=0 --latency
+    python main.py --frames 300 --script inputs.txt         # one "FRAME NAME=VALUE" per line
+    python main.py --frames 5 --capture frame.png           # frame0000.png, frame0001.png, ... see capture.py
+
+inputs are the i_* ports of the top module without the prefix, they change at the start of
+the given frame and keep their value until they are changed again. a fractional frame is that far
+into the frame, 190.5 is halfway down frame 190
+"""
+import argparse
+import time
+
+from amaranth.sim import Simulator, Delay
+
+try:
+    from .modes import DEFAULT_MODE
+except ImportError:
+    from modes import DEFAULT_MODE
+
+PIXEL_CLOCK = DEFAULT_MODE.pixel_clock
+
+
+def parse_input(text):
+    """parses "FRAME:NAME=VALUE" (or "FRAME NAME=VALUE") into a (frame, name, value) tuple"""
+    try:
+        frame, assignment = text.replace(":", " ", 1).split()
+        name, value = assignment.split("=")
+        return float(frame), name, int(value, 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FRAME:NAME=VALUE, got {text!r}")
+
+
+def read_script(path):
+    events = []
+    with open(path) as file:
+        for line in file:
+            line = line.split("#")[0].strip()
+            if line:
+                events.append(parse_input(line))
+    return events
+
+
+def simulate(mod, frames, clocks_per_frame, inputs=(), vcd=None, processes=(), pixel_clock=PIXEL_CLOCK):
+    """
+    run mod for a number of frames with the pix domain at the vga pixel clock, applying the
+    (frame, name, value) input events in order. extra processes are added as sync processes
+    in the pix domain. returns the wall clock time the simulation took
+    """
+    period = 1 / pixel_clock
+    events = sorted(inputs, key=lambda event: event[0])
+    for _, name, _ in events:
+        if not hasattr(mod, f"i_{name}"):
+            raise ValueError(f"{type(mod).__name__} has no input named {name}")
+
+    def drive_inputs():
+        now = 0
+        for frame, name, value in events:
+            # change the inputs between clock edges, so that the edge at the start of the frame sees them
+            at = round(frame * clocks_per_frame) * period
+            if at > now:
+                yield Delay(at - now)
+                now = at
+            yield getattr(mod, f"i_{name}").eq(value)
+
+    sim = Simulator(mod)
+    sim.add_clock(period, domain="pix")
+    if events:
+        sim.add_process(drive_inputs)
+    for process in processes:
+        sim.add_sync_process(process, domain="pix")
+
+    start = time.perf_counter()
+    if vcd:
+        with sim.write_vcd(vcd, vcd.rsplit(".", 1)[0] + ".gtkw"):
+            sim.run_until(frames * clocks_per_frame * period, run_passive=True)
+    else:
+        sim.run_until(frames * clocks_per_frame * period, run_passive=True)
+    return time.perf_counter() - start
+
+
+def add_arguments(parser, frames=2):
+    parser.add_argument("--frames", type=int, default=frames, help="frames to simulate, 0 skips the simulation")
+    parser.add_argument("--vcd", metavar="FILE", help="write a vcd (and a gtkw next to it), this is a lot slower")
+    parser.add_argument("--input", type=parse_input, action="append", default=[], metavar="FRAME:NAME=VALUE",
+        help="set input i_NAME at the start of a frame, can be given more than once")
+    parser.add_argument("--script", metavar="FILE", help="read input changes from a file, one FRAME NAME=VALUE per line")
+    parser.add_argument("--capture", metavar="PATH",
+        help="write the frames that are drawn to a .npy stack, or to pngs with the frame number formatted into PATH")
+
+
+def run_from_args(mod, args, processes=()):
+    """simulate a top module with a vga submodule using the options from add_arguments and print the throughput"""
+    if args.frames <= 0:
+        return
+    inputs = list(args.input)
+    if args.script:
+        inputs += read_script(args.script)
+    processes = list(processes)
+    writer = None
+    if args.capture:
+        from capture import FrameCapture, open_writer
+
+        writer = open_writer(args.capture)
+        processes.append(FrameCapture(mod, mod.vga, writer).process)
+
+    clocks_per_frame = mod.vga.mode.frame_clocks
+    try:
+        elapsed = simulate(mod, args.frames, clocks_per_frame, inputs, args.vcd, processes, mod.vga.mode.pixel_clock)
+    finally:
+        if writer is not None:
+            writer.close()
+    cycles = args.frames * clocks_per_frame
+    print(f"{args.frames} frames ({cycles} cycles) in {elapsed:.1f}s: "
+        f"{cycles / elapsed:.0f} cycles/s, {args.frames / elapsed:.3f} frames/s")
+    if writer is not None:
+        print(f"{writer.count} frames captured to {args.capture}")
@@ -4,177 +4,141 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
   reg \$auto$verilog_backend.cc:2352:dump_module$1  = 0;
   wire \$1 ;
   wire \$10 ;
-  wire \$101 ;
-  wire [10:0] \$103 ;
-  wire [10:0] \$105 ;
-  wire \$107 ;
-  wire [10:0] \$109 ;
+  wire [11:0] \$100 ;
+  wire [11:0] \$101 ;
+  wire [11:0] \$103 ;
+  wire \$104 ;
+  wire [11:0] \$107 ;
+  wire [11:0] \$108 ;
+  wire [11:0] \$110 ;
   wire \$111 ;
-  wire \$113 ;
-  wire \$115 ;
-  wire \$117 ;
-  wire \$119 ;
+  wire \$114 ;
+  wire \$116 ;
+  wire \$118 ;
   wire \$12 ;
-  wire \$121 ;
-  wire [3:0] \$123 ;
-  wire [3:0] \$124 ;
+  wire \$120 ;
+  wire \$122 ;
+  wire \$124 ;
   wire \$126 ;
-  wire [3:0] \$128 ;
-  wire [3:0] \$129 ;
-  wire \$131 ;
-  wire \$133 ;
-  wire \$135 ;
-  wire \$137 ;
-  wire \$139 ;
+  wire \$128 ;
+  wire \$130 ;
+  wire \$132 ;
+  wire \$134 ;
+  wire \$136 ;
+  wire \$138 ;
   wire \$14 ;
-  wire \$141 ;
-  wire \$143 ;
-  wire \$145 ;
-  wire [10:0] \$147 ;
-  wire [10:0] \$149 ;
-  wire \$151 ;
-  wire [10:0] \$153 ;
-  wire \$155 ;
-  wire \$157 ;
-  wire \$159 ;
+  wire \$140 ;
+  wire \$142 ;
+  wire \$144 ;
+  wire \$146 ;
+  wire \$148 ;
+  wire \$150 ;
+  wire \$152 ;
+  wire \$154 ;
+  wire \$156 ;
+  wire \$158 ;
   wire \$16 ;
-  wire \$161 ;
-  wire [10:0] \$163 ;
-  wire [10:0] \$165 ;
-  wire \$167 ;
-  wire [10:0] \$169 ;
-  wire \$171 ;
-  wire \$173 ;
-  wire \$175 ;
-  wire \$177 ;
-  wire \$179 ;
+  wire \$160 ;
+  wire \$162 ;
+  wire \$164 ;
+  wire \$166 ;
+  wire \$168 ;
+  wire \$170 ;
+  wire \$172 ;
+  wire \$174 ;
+  wire \$176 ;
+  wire \$178 ;
   wire \$18 ;
-  wire \$181 ;
-  wire \$183 ;
-  wire \$185 ;
-  wire [10:0] \$187 ;
-  wire [10:0] \$189 ;
-  wire \$191 ;
-  wire [10:0] \$193 ;
-  wire \$195 ;
-  wire \$197 ;
-  wire \$199 ;
-  wire [10:0] \$20 ;
-  wire \$201 ;
-  wire \$203 ;
-  wire \$205 ;
-  wire \$207 ;
-  wire \$209 ;
-  wire [10:0] \$21 ;
-  wire \$211 ;
-  wire \$213 ;
-  wire \$215 ;
-  wire \$217 ;
-  wire [10:0] \$219 ;
-  wire [10:0] \$220 ;
-  wire \$222 ;
-  wire \$224 ;
-  wire [10:0] \$226 ;
-  wire [10:0] \$227 ;
-  wire \$229 ;
-  wire [10:0] \$23 ;
-  wire \$231 ;
-  wire \$233 ;
-  wire \$235 ;
-  wire \$237 ;
-  wire [11:0] \$239 ;
-  wire [10:0] \$24 ;
-  wire [10:0] \$241 ;
-  wire [11:0] \$243 ;
-  wire \$245 ;
-  wire \$247 ;
-  wire \$249 ;
-  wire \$251 ;
-  wire \$253 ;
-  wire [10:0] \$255 ;
-  wire [10:0] \$256 ;
-  wire [11:0] \$258 ;
-  wire [11:0] \$26 ;
-  wire [10:0] \$260 ;
-  wire [11:0] \$262 ;
-  wire \$264 ;
-  wire \$266 ;
-  wire \$268 ;
-  wire [10:0] \$27 ;
-  wire \$270 ;
-  wire \$272 ;
-  wire [10:0] \$274 ;
-  wire [10:0] \$275 ;
-  wire \$277 ;
-  wire \$279 ;
-  wire \$281 ;
-  wire [10:0] \$283 ;
-  wire [10:0] \$284 ;
-  wire \$286 ;
-  wire \$288 ;
-  wire [10:0] \$29 ;
-  wire \$290 ;
-  wire [10:0] \$292 ;
-  wire [10:0] \$293 ;
-  wire \$295 ;
-  wire \$297 ;
-  wire \$299 ;
+  wire \$180 ;
+  wire \$182 ;
+  wire \$184 ;
+  wire \$186 ;
+  wire \$188 ;
+  wire \$190 ;
+  wire \$192 ;
+  wire \$194 ;
+  wire \$196 ;
+  wire \$198 ;
+  wire \$20 ;
+  wire \$200 ;
+  wire \$202 ;
+  wire \$204 ;
+  wire \$22 ;
+  wire \$24 ;
+  wire \$26 ;
+  wire \$28 ;
   wire \$3 ;
-  wire [4:0] \$30 ;
-  wire \$301 ;
-  wire \$303 ;
-  wire \$305 ;
-  wire [3:0] \$307 ;
-  wire [3:0] \$308 ;
-  wire \$310 ;
-  wire \$312 ;
-  wire \$314 ;
-  wire \$316 ;
-  wire [3:0] \$318 ;
-  wire [3:0] \$319 ;
-  wire [11:0] \$33 ;
-  wire \$35 ;
-  wire \$37 ;
-  wire \$39 ;
-  wire \$41 ;
-  wire \$43 ;
-  wire \$45 ;
-  wire [3:0] \$47 ;
-  wire [3:0] \$48 ;
+  wire \$30 ;
+  wire [11:0] \$32 ;
+  wire [11:0] \$34 ;
+  wire [11:0] \$36 ;
+  wire [11:0] \$38 ;
+  wire [11:0] \$40 ;
+  wire [11:0] \$42 ;
+  wire [11:0] \$44 ;
+  wire [11:0] \$46 ;
+  wire [7:0] \$47 ;
   wire \$5 ;
-  wire [3:0] \$50 ;
-  wire [3:0] \$52 ;
-  wire \$53 ;
-  wire \$56 ;
-  wire [3:0] \$58 ;
-  wire [3:0] \$59 ;
-  wire [3:0] \$61 ;
-  wire [3:0] \$63 ;
-  wire \$64 ;
-  wire \$67 ;
-  wire \$69 ;
-  wire [8:0] \$7 ;
-  wire \$71 ;
-  wire [10:0] \$73 ;
+  wire [11:0] \$50 ;
+  wire [6:0] \$51 ;
+  wire [11:0] \$54 ;
+  wire [11:0] \$56 ;
+  wire \$58 ;
+  wire [11:0] \$60 ;
+  wire [2:0] \$61 ;
+  wire [11:0] \$64 ;
+  wire \$66 ;
+  wire [11:0] \$68 ;
+  wire [10:0] \$69 ;
+  wire [12:0] \$7 ;
+  wire [11:0] \$72 ;
+  wire [11:0] \$74 ;
   wire [10:0] \$75 ;
-  wire \$77 ;
-  wire [10:0] \$79 ;
-  wire [8:0] \$8 ;
-  wire \$81 ;
-  wire \$83 ;
-  wire \$85 ;
-  wire \$87 ;
-  wire [3:0] \$89 ;
-  wire [3:0] \$90 ;
+  wire [11:0] \$78 ;
+  wire [12:0] \$8 ;
+  wire [11:0] \$80 ;
+  wire [11:0] \$82 ;
+  wire [11:0] \$84 ;
+  wire \$86 ;
+  wire [11:0] \$88 ;
+  wire [2:0] \$89 ;
   wire \$92 ;
-  wire [3:0] \$94 ;
-  wire [3:0] \$95 ;
-  wire \$97 ;
-  wire \$99 ;
+  wire \$94 ;
+  wire \$96 ;
+  wire [6:0] \$98 ;
+  reg [11:0] acc = 12'h000;
+  reg [11:0] \acc$next ;
+  reg [11:0] add_a;
+  reg [11:0] add_b;
+  wire [11:0] add_sum;
+  reg [6:0] angle = 7'h00;
+  reg [6:0] \angle$next ;
+  reg bounce_bottom = 1'h0;
+  reg \bounce_bottom$next ;
+  reg bounce_top = 1'h0;
+  reg \bounce_top$next ;
+  wire [4:0] buttons_i_buttons;
+  reg buttons_i_take;
+  wire [4:0] buttons_o_level;
+  wire [4:0] buttons_o_pressed;
+  reg enemy_follow_down = 1'h0;
+  reg \enemy_follow_down$next ;
+  reg enemy_follow_up = 1'h0;
+  reg \enemy_follow_up$next ;
   reg [9:0] enemy_paddle_location = 10'h0a5;
   reg [9:0] \enemy_paddle_location$next ;
   reg [2:0] enemy_score = 3'h0;
   reg [2:0] \enemy_score$next ;
+  reg enemy_scored = 1'h0;
+  reg \enemy_scored$next ;
+  reg [2:0] enemy_step = 3'h0;
+  reg [2:0] \enemy_step$next ;
+  reg [3:0] fsm_state = 4'h0;
+  reg [3:0] \fsm_state$next ;
+  reg hit_enemy = 1'h0;
+  reg \hit_enemy$next ;
+  reg hit_player = 1'h0;
+  reg \hit_player$next ;
   input i_move_down;
   wire i_move_down;
   input i_move_up;
@@ -185,6 +149,8 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
   wire i_player_two_down;
   input i_player_two_up;
   wire i_player_two_up;
+  reg [15:0] lfsr = 16'h0001;
+  reg [15:0] \lfsr$next ;
   output [2:0] o_b;
   wire [2:0] o_b;
   output [2:0] o_g;
@@ -193,24 +159,34 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
   wire o_hsync;
   output [2:0] o_r;
   wire [2:0] o_r;
+  reg o_updated = 1'h0;
+  reg \o_updated$next ;
   output o_vsync;
   wire o_vsync;
   reg [9:0] paddle_location = 10'h0a5;
   reg [9:0] \paddle_location$next ;
+  reg [2:0] paddle_step = 3'h0;
+  reg [2:0] \paddle_step$next ;
   input pix_clk;
   wire pix_clk;
   input pix_rst;
   wire pix_rst;
   reg [2:0] player_score = 3'h0;
   reg [2:0] \player_score$next ;
+  reg player_scored = 1'h0;
+  reg \player_scored$next ;
   reg pope_h_velocity = 1'h0;
   reg \pope_h_velocity$next ;
-  reg [19:0] pope_location = 20'h3712f;
-  reg [19:0] \pope_location$next ;
-  reg [2:0] pope_v_velocity = 3'h7;
-  reg [2:0] \pope_v_velocity$next ;
+  reg [21:0] pope_location = 22'h0dc12f;
+  reg [21:0] \pope_location$next ;
+  reg [6:0] pope_v_velocity = 7'h7f;
+  reg [6:0] \pope_v_velocity$next ;
   reg prev_vsync = 1'h0;
   reg \prev_vsync$next ;
+  reg [15:0] random = 16'h0000;
+  reg [15:0] \random$next ;
+  reg [4:0] taken = 5'h00;
+  reg [4:0] \taken$next ;
   reg [7:0] time_until_start = 8'hb3;
   reg [7:0] \time_until_start$next ;
   wire vga_i_enable;
@@ -225,171 +201,163 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
   wire vga_o_hsync;
   wire [2:0] vga_o_r;
   wire vga_o_vsync;
-  assign \$99  = pope_location[9:0] >= 10'h22c;
-  assign \$101  = \$97  & \$99 ;
-  assign \$103  = + pope_location[19:10];
-  assign \$105  = enemy_paddle_location - 6'h28;
-  assign \$107  = $signed(\$103 ) > $signed(\$105 );
-  assign \$10  = pope_location[9:0] <= 3'h6;
-  assign \$109  = enemy_paddle_location + 8'h96;
-  assign \$111  = pope_location[19:10] <= \$109 ;
-  assign \$113  = \$107  & \$111 ;
-  assign \$115  = \$101  & \$113 ;
-  assign \$119  = \$115  & \$117 ;
-  assign \$121  = $signed(pope_v_velocity) != $signed(3'h5);
-  assign \$124  = $signed(pope_v_velocity) - $signed(3'h1);
-  assign \$126  = $signed(pope_v_velocity) < $signed(3'h3);
-  assign \$12  = pope_location[9:0] >= 10'h25e;
-  assign \$129  = $signed(pope_v_velocity) + $signed(3'h1);
-  assign \$131  = pope_location[9:0] <= 3'h6;
-  assign \$133  = pope_location[9:0] >= 10'h25e;
-  assign \$135  = ~ vga_o_vsync;
-  assign \$137  = prev_vsync & \$135 ;
-  assign \$139  = time_until_start > 1'h0;
-  assign \$141  = ~ pope_h_velocity;
-  assign \$143  = pope_location[9:0] < 6'h32;
-  assign \$145  = \$141  & \$143 ;
-  assign \$147  = + pope_location[19:10];
-  assign \$14  = ~ vga_o_vsync;
-  assign \$149  = paddle_location - 6'h28;
-  assign \$151  = $signed(\$147 ) > $signed(\$149 );
-  assign \$153  = paddle_location + 8'h96;
-  assign \$155  = pope_location[19:10] <= \$153 ;
-  assign \$157  = \$151  & \$155 ;
-  assign \$159  = \$145  & \$157 ;
-  assign \$161  = pope_location[9:0] >= 10'h22c;
-  assign \$163  = + pope_location[19:10];
-  assign \$165  = enemy_paddle_location - 6'h28;
-  assign \$167  = $signed(\$163 ) > $signed(\$165 );
-  assign \$16  = prev_vsync & \$14 ;
-  assign \$169  = enemy_paddle_location + 8'h96;
-  assign \$171  = pope_location[19:10] <= \$169 ;
-  assign \$173  = \$167  & \$171 ;
-  assign \$175  = \$161  & \$173 ;
-  assign \$177  = ~ i_player_two_active;
-  assign \$179  = \$175  & \$177 ;
-  assign \$183  = pope_location[9:0] >= 10'h22c;
-  assign \$185  = \$181  & \$183 ;
-  assign \$187  = + pope_location[19:10];
-  assign \$18  = time_until_start > 1'h0;
-  assign \$189  = enemy_paddle_location - 6'h28;
-  assign \$191  = $signed(\$187 ) > $signed(\$189 );
-  assign \$193  = enemy_paddle_location + 8'h96;
-  assign \$195  = pope_location[19:10] <= \$193 ;
-  assign \$197  = \$191  & \$195 ;
-  assign \$1  = ~ vga_o_vsync;
-  assign \$199  = \$185  & \$197 ;
-  assign \$203  = \$199  & \$201 ;
-  assign \$205  = pope_location[9:0] <= 3'h6;
-  assign \$207  = pope_location[9:0] >= 10'h25e;
-  assign \$209  = ~ vga_o_vsync;
-  assign \$211  = prev_vsync & \$209 ;
-  assign \$213  = time_until_start > 1'h0;
-  assign \$215  = paddle_location >= 2'h3;
-  assign \$217  = i_move_up & \$215 ;
-  assign \$21  = pope_location[9:0] + 2'h3;
-  assign \$220  = paddle_location - 2'h3;
-  assign \$222  = paddle_location < 9'h147;
-  assign \$224  = i_move_down & \$222 ;
-  assign \$227  = paddle_location + 2'h3;
-  assign \$229  = pope_location[9:0] <= 3'h6;
-  assign \$231  = pope_location[9:0] >= 10'h25e;
-  assign \$233  = ~ vga_o_vsync;
-  assign \$235  = prev_vsync & \$233 ;
-  assign \$237  = time_until_start > 1'h0;
-  assign \$239  = + pope_location[19:10];
-  assign \$241  = enemy_paddle_location + 7'h4b;
-  assign \$243  = \$241  - 5'h14;
-  assign \$245  = $signed(\$239 ) > $signed(\$243 );
-  assign \$247  = enemy_paddle_location < 9'h136;
-  assign \$24  = pope_location[9:0] - 2'h3;
-  assign \$249  = \$245  & \$247 ;
-  assign \$251  = ~ i_player_two_active;
-  assign \$253  = \$249  & \$251 ;
-  assign \$256  = enemy_paddle_location + 2'h2;
-  assign \$258  = + pope_location[19:10];
-  assign \$260  = enemy_paddle_location + 7'h4b;
-  assign \$262  = \$260  - 5'h14;
-  assign \$264  = $signed(\$258 ) < $signed(\$262 );
-  assign \$266  = enemy_paddle_location > 5'h14;
-  assign \$268  = \$264  & \$266 ;
-  assign \$270  = ~ i_player_two_active;
-  assign \$272  = \$268  & \$270 ;
-  assign \$275  = enemy_paddle_location - 2'h2;
-  assign \$277  = enemy_paddle_location >= 2'h3;
-  assign \$27  = + pope_location[19:10];
-  assign \$279  = i_player_two_up & \$277 ;
-  assign \$281  = \$279  & i_player_two_active;
-  assign \$284  = enemy_paddle_location - 2'h3;
-  assign \$286  = enemy_paddle_location < 9'h147;
-  assign \$288  = i_player_two_down & \$286 ;
-  assign \$290  = \$288  & i_player_two_active;
-  assign \$293  = enemy_paddle_location + 2'h3;
-  assign \$295  = pope_location[9:0] <= 3'h6;
-  assign \$297  = pope_location[9:0] >= 10'h25e;
-  assign \$299  = ~ vga_o_vsync;
-  assign \$301  = prev_vsync & \$299 ;
-  assign \$303  = time_until_start > 1'h0;
-  assign \$305  = pope_location[9:0] <= 3'h6;
-  assign \$308  = enemy_score + 1'h1;
-  assign \$30  = $signed(3'h3) * $signed(pope_v_velocity);
-  assign \$310  = ~ vga_o_vsync;
-  assign \$312  = prev_vsync & \$310 ;
-  assign \$314  = time_until_start > 1'h0;
-  assign \$316  = pope_location[9:0] >= 10'h25e;
-  assign \$29  = + $signed(\$30 );
-  assign \$319  = player_score + 1'h1;
+  assign \$101  = + $signed(pope_v_velocity);
+  assign \$104  = $signed(pope_v_velocity) > $signed(7'h00);
+  assign \$103  = \$104  ? \$101  : acc;
+  assign \$108  = + $signed(pope_v_velocity);
+  assign \$10  = time_until_start > 1'h0;
+  assign \$111  = $signed(pope_v_velocity) < $signed(7'h00);
+  assign \$110  = \$111  ? \$108  : acc;
+  assign \$114  = hit_player | hit_enemy;
+  assign \$116  = enemy_scored | player_scored;
+  assign \$118  = time_until_start > 1'h0;
+  assign \$120  = time_until_start > 1'h0;
+  assign \$122  = pope_location[21:12] <= 5'h14;
+  assign \$124  = time_until_start > 1'h0;
+  assign \$126  = pope_location[21:12] >= 9'h1b8;
+  assign \$128  = time_until_start > 1'h0;
+  assign \$12  = ~ vga_o_vsync;
+  assign \$130  = pope_location[9:0] <= 3'h6;
+  assign \$132  = time_until_start > 1'h0;
+  assign \$134  = pope_location[9:0] >= 10'h25e;
+  assign \$136  = ~ pope_h_velocity;
+  assign \$138  = pope_location[9:0] < 6'h32;
+  assign \$140  = \$136  & \$138 ;
+  assign \$142  = $signed(acc) < $signed(12'h028);
+  assign \$144  = \$140  & \$142 ;
+  assign \$146  = $signed(acc) >= $signed(9'h16a);
+  assign \$148  = \$144  & \$146 ;
+  assign \$14  = prev_vsync & \$12 ;
+  assign \$152  = pope_location[9:0] >= 10'h22c;
+  assign \$154  = \$150  & \$152 ;
+  assign \$156  = $signed(acc) < $signed(12'h028);
+  assign \$158  = \$154  & \$156 ;
+  assign \$160  = $signed(acc) >= $signed(9'h16a);
+  assign \$162  = \$158  & \$160 ;
+  assign \$164  = $signed(acc) < $signed(7'h49);
+  assign \$166  = $signed(acc) > $signed(7'h49);
+  assign \$168  = enemy_scored | player_scored;
+  assign \$16  = ~ vga_o_vsync;
+  assign \$170  = paddle_location >= 2'h3;
+  assign \$172  = taken[0] & \$170 ;
+  assign \$174  = paddle_location < 9'h147;
+  assign \$176  = taken[1] & \$174 ;
+  assign \$178  = ~ taken[4];
+  assign \$180  = enemy_paddle_location < 9'h136;
+  assign \$182  = enemy_follow_down & \$180 ;
+  assign \$184  = enemy_paddle_location > 5'h14;
+  assign \$186  = enemy_follow_up & \$184 ;
+  assign \$188  = enemy_paddle_location >= 2'h3;
+  assign \$18  = prev_vsync & \$16 ;
+  assign \$190  = taken[2] & \$188 ;
+  assign \$192  = enemy_paddle_location < 9'h147;
+  assign \$194  = taken[3] & \$192 ;
+  assign \$196  = enemy_scored | player_scored;
+  assign \$198  = enemy_scored | player_scored;
+  assign \$1  = lfsr[10] ^ lfsr[12];
+  assign \$200  = enemy_scored | player_scored;
+  assign \$202  = enemy_scored | player_scored;
+  assign \$204  = enemy_scored | player_scored;
   always @(posedge pix_clk)
     prev_vsync <= \prev_vsync$next ;
+  always @(posedge pix_clk)
+    lfsr <= \lfsr$next ;
+  always @(posedge pix_clk)
+    o_updated <= \o_updated$next ;
+  always @(posedge pix_clk)
+    random <= \random$next ;
+  assign \$20  = ~ vga_o_vsync;
+  always @(posedge pix_clk)
+    taken <= \taken$next ;
+  always @(posedge pix_clk)
+    fsm_state <= \fsm_state$next ;
   always @(posedge pix_clk)
     time_until_start <= \time_until_start$next ;
+  always @(posedge pix_clk)
+    pope_v_velocity <= \pope_v_velocity$next ;
+  always @(posedge pix_clk)
+    acc <= \acc$next ;
+  always @(posedge pix_clk)
+    bounce_top <= \bounce_top$next ;
+  always @(posedge pix_clk)
+    bounce_bottom <= \bounce_bottom$next ;
+  always @(posedge pix_clk)
+    enemy_scored <= \enemy_scored$next ;
+  always @(posedge pix_clk)
+    player_scored <= \player_scored$next ;
+  always @(posedge pix_clk)
+    hit_player <= \hit_player$next ;
+  always @(posedge pix_clk)
+    angle <= \angle$next ;
+  always @(posedge pix_clk)
+    hit_enemy <= \hit_enemy$next ;
+  always @(posedge pix_clk)
+    enemy_follow_down <= \enemy_follow_down$next ;
+  always @(posedge pix_clk)
+    enemy_follow_up <= \enemy_follow_up$next ;
   always @(posedge pix_clk)
     pope_location <= \pope_location$next ;
   always @(posedge pix_clk)
-    pope_v_velocity <= \pope_v_velocity$next ;
+    paddle_step <= \paddle_step$next ;
   always @(posedge pix_clk)
-    pope_h_velocity <= \pope_h_velocity$next ;
+    enemy_step <= \enemy_step$next ;
   always @(posedge pix_clk)
     paddle_location <= \paddle_location$next ;
   always @(posedge pix_clk)
     enemy_paddle_location <= \enemy_paddle_location$next ;
+  always @(posedge pix_clk)
+    pope_h_velocity <= \pope_h_velocity$next ;
+  assign \$22  = prev_vsync & \$20 ;
   always @(posedge pix_clk)
     enemy_score <= \enemy_score$next ;
   always @(posedge pix_clk)
     player_score <= \player_score$next ;
-  assign \$33  = $signed(\$27 ) + $signed(\$29 );
-  assign \$35  = pope_location[9:0] <= 3'h6;
-  assign \$37  = pope_location[9:0] >= 10'h25e;
-  assign \$3  = prev_vsync & \$1 ;
-  assign \$39  = ~ vga_o_vsync;
-  assign \$41  = prev_vsync & \$39 ;
-  assign \$43  = time_until_start > 1'h0;
-  assign \$45  = pope_location[19:10] <= 5'h14;
-  assign \$48  = + $signed(pope_v_velocity);
-  assign \$50  = - $signed(pope_v_velocity);
-  assign \$53  = $signed(pope_v_velocity) > $signed(3'h0);
-  assign \$52  = \$53  ? \$48  : \$50 ;
-  assign \$56  = pope_location[19:10] >= 9'h1b8;
-  assign \$5  = time_until_start > 1'h0;
-  assign \$59  = + $signed(pope_v_velocity);
-  assign \$61  = - $signed(pope_v_velocity);
-  assign \$64  = $signed(pope_v_velocity) < $signed(3'h0);
-  assign \$63  = \$64  ? \$59  : \$61 ;
-  assign \$67  = ~ pope_h_velocity;
-  assign \$69  = pope_location[9:0] < 6'h32;
-  assign \$71  = \$67  & \$69 ;
-  assign \$73  = + pope_location[19:10];
-  assign \$75  = paddle_location - 6'h28;
-  assign \$77  = $signed(\$73 ) > $signed(\$75 );
-  assign \$79  = paddle_location + 8'h96;
-  assign \$81  = pope_location[19:10] <= \$79 ;
-  assign \$83  = \$77  & \$81 ;
-  assign \$85  = \$71  & \$83 ;
-  assign \$87  = $signed(pope_v_velocity) != $signed(3'h5);
-  assign \$8  = time_until_start - 1'h1;
-  assign \$90  = $signed(pope_v_velocity) - $signed(3'h1);
-  assign \$92  = $signed(pope_v_velocity) < $signed(3'h3);
-  assign \$95  = $signed(pope_v_velocity) + $signed(3'h1);
+  assign \$24  = ~ vga_o_vsync;
+  assign \$26  = prev_vsync & \$24 ;
+  assign \$28  = time_until_start > 1'h0;
+  assign \$30  = time_until_start > 1'h0;
+  assign \$32  = + time_until_start;
+  assign \$34  = + paddle_location;
+  assign \$36  = ~ $signed(acc);
+  assign \$3  = \$1  ^ lfsr[13];
+  assign \$40  = + enemy_paddle_location;
+  assign \$42  = ~ $signed(acc);
+  assign \$46  = + $signed(\$47 );
+  assign \$51  = ~ $signed(pope_v_velocity);
+  assign \$50  = + $signed(\$51 );
+  assign \$54  = + paddle_location;
+  assign \$56  = + enemy_paddle_location;
+  assign \$58  = enemy_scored | player_scored;
+  assign \$5  = \$3  ^ lfsr[15];
+  assign \$61  = enemy_scored ? enemy_score : player_score;
+  assign \$60  = + \$61 ;
+  assign \$64  = + pope_location[9:0];
+  assign \$66  = time_until_start > 1'h0;
+  assign \$69  = - pope_location[21:12];
+  assign \$68  = + $signed(\$69 );
+  assign \$72  = + $signed(random[2:0]);
+  assign \$75  = - pope_location[21:12];
+  assign \$74  = + $signed(\$75 );
+  assign \$78  = + $signed(random[2:0]);
+  assign \$80  = + $signed(pope_v_velocity);
+  assign \$82  = + $signed(paddle_step);
+  assign \$84  = + $signed(enemy_step);
+  assign \$86  = enemy_scored | player_scored;
+  assign \$8  = $signed(add_a) + $signed(add_b);
+  assign \$89  = pope_h_velocity ? 3'h3 : 3'h5;
+  assign \$88  = + $signed(\$89 );
+  assign \$92  = time_until_start > 1'h0;
+  assign \$94  = enemy_scored | player_scored;
+  assign \$96  = time_until_start > 1'h0;
+  assign \$98  = + $signed(random[3:0]);
+  \sphn_vga_top.buttons  buttons (
+    .i_buttons(buttons_i_buttons),
+    .i_take(buttons_i_take),
+    .o_level(buttons_o_level),
+    .o_pressed(buttons_o_pressed),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
   \sphn_vga_top.vga  vga (
     .i_enable(1'h1),
     .i_enemy_paddle_location(vga_i_enemy_paddle_location),
@@ -413,152 +381,578 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
       \prev_vsync$next  = 1'h0;
     end
   end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    add_a = 12'h000;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$30 ) begin
+            add_a = \$32 ;
+          end else begin
+            add_a = \$34 ;
+          end
+      4'h2:
+          add_a = \$36 ;
+      4'h3:
+          add_a = \$38 ;
+      4'h4:
+          add_a = \$40 ;
+      4'h5:
+          add_a = \$42 ;
+      4'h6:
+          add_a = \$44 ;
+      4'h7:
+          add_a = \$46 ;
+      4'h8:
+          add_a = pope_location[21:10];
+      4'h9:
+          add_a = \$50 ;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          add_a = \$54 ;
+      4'hd:
+          add_a = \$56 ;
+      4'he:
+          (* full_case = 32'd1 *)
+          if (\$58 ) begin
+            add_a = \$60 ;
+          end else begin
+            add_a = \$64 ;
+          end
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    add_b = 12'h000;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$66 ) begin
+            add_b = 12'hfff;
+          end else begin
+            add_b = \$68 ;
+          end
+      4'h2:
+          add_b = 12'hfca;
+      4'h3:
+          add_b = \$72 ;
+      4'h4:
+          add_b = \$74 ;
+      4'h5:
+          add_b = 12'hfca;
+      4'h6:
+          add_b = \$78 ;
+      4'h7:
+          add_b = \$80 ;
+      4'h8:
+          add_b = acc;
+      4'h9:
+          add_b = 12'h001;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          add_b = \$82 ;
+      4'hd:
+          add_b = \$84 ;
+      4'he:
+          (* full_case = 32'd1 *)
+          if (\$86 ) begin
+            add_b = 12'h001;
+          end else begin
+            add_b = \$88 ;
+          end
+    endcase
+  end
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \time_until_start$next  = time_until_start;
-    if (\$3 ) begin
-      (* full_case = 32'd1 *)
-      if (\$5 ) begin
-        \time_until_start$next  = \$8 [7:0];
-      end else begin
-        if (\$10 ) begin
-          \time_until_start$next  = 8'hb3;
-        end
-        if (\$12 ) begin
-          \time_until_start$next  = 8'hb3;
-        end
-      end
-    end
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          if (\$92 ) begin
+            \time_until_start$next  = add_sum[7:0];
+          end
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          if (\$94 ) begin
+            \time_until_start$next  = 8'hb3;
+          end
+    endcase
     if (pix_rst) begin
       \time_until_start$next  = 8'hb3;
     end
   end
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
-    \pope_location$next  = pope_location;
-    if (\$16 ) begin
-      (* full_case = 32'd1 *)
-      if (\$18 ) begin
-      end else begin
-        (* full_case = 32'd1 *)
-        if (pope_h_velocity) begin
-          \pope_location$next [9:0] = \$21 [9:0];
-        end else begin
-          \pope_location$next [9:0] = \$24 [9:0];
-        end
+    \pope_v_velocity$next  = pope_v_velocity;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          if (\$96 ) begin
+            \pope_v_velocity$next  = \$98 ;
+          end
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
         begin
-            \pope_location$next [19:10] = \$33 [9:0];
-        end
-        if (\$35 ) begin
-          \pope_location$next  = 20'h3712f;
-        end
-        if (\$37 ) begin
-          \pope_location$next  = 20'h3712f;
+          if (bounce_top) begin
+            \pope_v_velocity$next  = \$103 [6:0];
+          end
+          if (bounce_bottom) begin
+            \pope_v_velocity$next  = \$110 [6:0];
+          end
+          if (\$114 ) begin
+            \pope_v_velocity$next  = angle;
+          end
         end
-      end
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          if (\$116 ) begin
+            \pope_v_velocity$next  = 7'h7f;
+          end
+    endcase
+    if (pix_rst) begin
+      \pope_v_velocity$next  = 7'h7f;
     end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \acc$next  = acc;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$118 ) begin
+          end else begin
+            \acc$next  = add_sum;
+          end
+      4'h2:
+          \acc$next  = add_sum;
+      4'h3:
+          /* empty */;
+      4'h4:
+          \acc$next  = add_sum;
+      4'h5:
+          \acc$next  = add_sum;
+      4'h6:
+          /* empty */;
+      4'h7:
+          \acc$next  = add_sum;
+      4'h8:
+          /* empty */;
+      4'h9:
+          \acc$next  = add_sum;
+    endcase
     if (pix_rst) begin
-      \pope_location$next  = 20'h3712f;
+      \acc$next  = 12'h000;
     end
   end
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
-    \pope_v_velocity$next  = pope_v_velocity;
-    if (\$41 ) begin
-      (* full_case = 32'd1 *)
-      if (\$43 ) begin
-      end else begin
-        if (\$45 ) begin
-          \pope_v_velocity$next  = \$52 [2:0];
-        end
-        if (\$56 ) begin
-          \pope_v_velocity$next  = \$63 [2:0];
-        end
-        if (\$85 ) begin
-          if (i_move_up) begin
-            if (\$87 ) begin
-              \pope_v_velocity$next  = \$90 [2:0];
-            end
+    \bounce_top$next  = bounce_top;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$120 ) begin
+          end else begin
+            \bounce_top$next  = \$122 ;
           end
-          if (i_move_down) begin
-            if (\$92 ) begin
-              \pope_v_velocity$next  = \$95 [2:0];
-            end
+    endcase
+    if (pix_rst) begin
+      \bounce_top$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \bounce_bottom$next  = bounce_bottom;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$124 ) begin
+          end else begin
+            \bounce_bottom$next  = \$126 ;
           end
-        end
-        if (\$119 ) begin
-          if (i_player_two_up) begin
-            if (\$121 ) begin
-              \pope_v_velocity$next  = \$124 [2:0];
-            end
+    endcase
+    if (pix_rst) begin
+      \bounce_bottom$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \enemy_scored$next  = enemy_scored;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$128 ) begin
+          end else begin
+            \enemy_scored$next  = \$130 ;
           end
-          if (i_player_two_down) begin
-            if (\$126 ) begin
-              \pope_v_velocity$next  = \$129 [2:0];
-            end
+    endcase
+    if (pix_rst) begin
+      \enemy_scored$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \player_scored$next  = player_scored;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$132 ) begin
+          end else begin
+            \player_scored$next  = \$134 ;
           end
-        end
-        if (\$131 ) begin
-          \pope_v_velocity$next  = 3'h7;
-        end
-        if (\$133 ) begin
-          \pope_v_velocity$next  = 3'h7;
-        end
-      end
+    endcase
+    if (pix_rst) begin
+      \player_scored$next  = 1'h0;
     end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \hit_player$next  = hit_player;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          \hit_player$next  = \$148 ;
+    endcase
     if (pix_rst) begin
-      \pope_v_velocity$next  = 3'h7;
+      \hit_player$next  = 1'h0;
     end
   end
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
-    \pope_h_velocity$next  = pope_h_velocity;
-    if (\$137 ) begin
-      (* full_case = 32'd1 *)
-      if (\$139 ) begin
-      end else begin
-        if (\$159 ) begin
-          \pope_h_velocity$next  = 1'h1;
-        end
-        if (\$179 ) begin
-          \pope_h_velocity$next  = 1'h0;
-        end
-        if (\$203 ) begin
-          \pope_h_velocity$next  = 1'h0;
-        end
-        if (\$205 ) begin
-          \pope_h_velocity$next  = 1'h0;
-        end
-        if (\$207 ) begin
-          \pope_h_velocity$next  = 1'h0;
-        end
-      end
+    \lfsr$next  = { lfsr[14:0], \$5  };
+    if (pix_rst) begin
+      \lfsr$next  = 16'h0001;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \angle$next  = angle;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          \angle$next  = add_sum[6:0];
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          if (hit_enemy) begin
+            \angle$next  = add_sum[6:0];
+          end
+    endcase
+    if (pix_rst) begin
+      \angle$next  = 7'h00;
     end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \hit_enemy$next  = hit_enemy;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          \hit_enemy$next  = \$162 ;
+    endcase
     if (pix_rst) begin
-      \pope_h_velocity$next  = 1'h0;
+      \hit_enemy$next  = 1'h0;
     end
   end
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
-    \paddle_location$next  = paddle_location;
-    if (\$211 ) begin
-      (* full_case = 32'd1 *)
-      if (\$213 ) begin
-      end else begin
-        if (\$217 ) begin
-          \paddle_location$next  = \$220 [9:0];
-        end
-        if (\$224 ) begin
-          \paddle_location$next  = \$227 [9:0];
-        end
-        if (\$229 ) begin
-          \paddle_location$next  = 10'h0a5;
+    \enemy_follow_down$next  = enemy_follow_down;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          \enemy_follow_down$next  = \$164 ;
+    endcase
+    if (pix_rst) begin
+      \enemy_follow_down$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \enemy_follow_up$next  = enemy_follow_up;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          \enemy_follow_up$next  = \$166 ;
+    endcase
+    if (pix_rst) begin
+      \enemy_follow_up$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \pope_location$next  = pope_location;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          \pope_location$next [21:10] = add_sum;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          (* full_case = 32'd1 *)
+          if (\$168 ) begin
+            \pope_location$next  = 22'h0dc12f;
+          end else begin
+            \pope_location$next [9:0] = add_sum[9:0];
+          end
+    endcase
+    if (pix_rst) begin
+      \pope_location$next  = 22'h0dc12f;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \paddle_step$next  = paddle_step;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+        begin
+          \paddle_step$next  = 3'h0;
+          if (\$172 ) begin
+            \paddle_step$next  = 3'h5;
+          end
+          if (\$176 ) begin
+            \paddle_step$next  = 3'h3;
+          end
         end
-        if (\$231 ) begin
-          \paddle_location$next  = 10'h0a5;
+    endcase
+    if (pix_rst) begin
+      \paddle_step$next  = 3'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \enemy_step$next  = enemy_step;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+        begin
+          \enemy_step$next  = 3'h0;
+          (* full_case = 32'd1 *)
+          if (\$178 ) begin
+            if (\$182 ) begin
+              \enemy_step$next  = 3'h2;
+            end
+            if (\$186 ) begin
+              \enemy_step$next  = 3'h6;
+            end
+          end else begin
+            if (\$190 ) begin
+              \enemy_step$next  = 3'h5;
+            end
+            if (\$194 ) begin
+              \enemy_step$next  = 3'h3;
+            end
+          end
         end
-      end
+    endcase
+    if (pix_rst) begin
+      \enemy_step$next  = 3'h0;
     end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \paddle_location$next  = paddle_location;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          \paddle_location$next  = add_sum[9:0];
+      4'hd:
+          /* empty */;
+      4'he:
+          if (\$196 ) begin
+            \paddle_location$next  = 10'h0a5;
+          end
+    endcase
     if (pix_rst) begin
       \paddle_location$next  = 10'h0a5;
     end
@@ -566,46 +960,132 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \enemy_paddle_location$next  = enemy_paddle_location;
-    if (\$235 ) begin
-      (* full_case = 32'd1 *)
-      if (\$237 ) begin
-      end else begin
-        if (\$253 ) begin
-          \enemy_paddle_location$next  = \$256 [9:0];
-        end
-        if (\$272 ) begin
-          \enemy_paddle_location$next  = \$275 [9:0];
-        end
-        if (\$281 ) begin
-          \enemy_paddle_location$next  = \$284 [9:0];
-        end
-        if (\$290 ) begin
-          \enemy_paddle_location$next  = \$293 [9:0];
-        end
-        if (\$295 ) begin
-          \enemy_paddle_location$next  = 10'h0a5;
-        end
-        if (\$297 ) begin
-          \enemy_paddle_location$next  = 10'h0a5;
-        end
-      end
-    end
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          \enemy_paddle_location$next  = add_sum[9:0];
+      4'he:
+          if (\$198 ) begin
+            \enemy_paddle_location$next  = 10'h0a5;
+          end
+    endcase
     if (pix_rst) begin
       \enemy_paddle_location$next  = 10'h0a5;
     end
   end
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
-    \enemy_score$next  = enemy_score;
-    if (\$301 ) begin
-      (* full_case = 32'd1 *)
-      if (\$303 ) begin
-      end else begin
-        if (\$305 ) begin
-          \enemy_score$next  = \$308 [2:0];
-        end
-      end
+    \pope_h_velocity$next  = pope_h_velocity;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          (* full_case = 32'd1 *)
+          if (\$200 ) begin
+            \pope_h_velocity$next  = 1'h0;
+          end else begin
+            if (hit_player) begin
+              \pope_h_velocity$next  = 1'h1;
+            end
+            if (hit_enemy) begin
+              \pope_h_velocity$next  = 1'h0;
+            end
+          end
+    endcase
+    if (pix_rst) begin
+      \pope_h_velocity$next  = 1'h0;
     end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \enemy_score$next  = enemy_score;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          if (\$202 ) begin
+            if (enemy_scored) begin
+              \enemy_score$next  = add_sum[2:0];
+            end
+          end
+    endcase
     if (pix_rst) begin
       \enemy_score$next  = 3'h0;
     end
@@ -613,224 +1093,338 @@ module sphn_vga_top(o_g, o_b, o_hsync, o_vsync, i_move_up, i_move_down, i_player
   always @* begin
     if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
     \player_score$next  = player_score;
-    if (\$312 ) begin
-      (* full_case = 32'd1 *)
-      if (\$314 ) begin
-      end else begin
-        if (\$316 ) begin
-          \player_score$next  = \$319 [2:0];
-        end
-      end
-    end
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          /* empty */;
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          if (\$204 ) begin
+            (* full_case = 32'd1 *)
+            if (enemy_scored) begin
+            end else begin
+              \player_score$next  = add_sum[2:0];
+            end
+          end
+    endcase
     if (pix_rst) begin
       \player_score$next  = 3'h0;
     end
   end
-  assign \$7  = \$8 ;
-  assign \$20  = \$21 ;
-  assign \$23  = \$24 ;
-  assign \$26  = \$33 ;
-  assign \$47  = \$52 ;
-  assign \$58  = \$63 ;
-  assign \$89  = \$90 ;
-  assign \$94  = \$95 ;
-  assign \$123  = \$124 ;
-  assign \$128  = \$129 ;
-  assign \$219  = \$220 ;
-  assign \$226  = \$227 ;
-  assign \$255  = \$256 ;
-  assign \$274  = \$275 ;
-  assign \$283  = \$284 ;
-  assign \$292  = \$293 ;
-  assign \$307  = \$308 ;
-  assign \$318  = \$319 ;
-  assign o_vsync = vga_o_vsync;
-  assign o_hsync = vga_o_hsync;
-  assign o_b = vga_o_b;
-  assign o_g = vga_o_g;
-  assign o_r = vga_o_r;
-  assign vga_i_timer = time_until_start;
-  assign vga_i_enemy_score = enemy_score;
-  assign vga_i_player_score = player_score;
-  assign vga_i_enemy_paddle_location = enemy_paddle_location;
-  assign vga_i_paddle_location = paddle_location;
-  assign vga_i_pope_location = pope_location;
-  assign vga_i_enable = 1'h1;
-  assign \$97  = pope_h_velocity;
-  assign \$117  = i_player_two_active;
-  assign \$181  = pope_h_velocity;
-  assign \$201  = i_player_two_active;
-endmodule
-
-module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_paddle_location, i_player_score, i_enemy_score, i_timer, o_r, o_g, o_b, o_hsync, pix_rst, pix_clk, i_enable);
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \o_updated$next  = 1'h0;
+    casez (fsm_state)
+      4'h0:
+          /* empty */;
+      4'h1:
+          if (\$10 ) begin
+            \o_updated$next  = 1'h1;
+          end
+      4'h2:
+          /* empty */;
+      4'h3:
+          /* empty */;
+      4'h4:
+          /* empty */;
+      4'h5:
+          /* empty */;
+      4'h6:
+          /* empty */;
+      4'h7:
+          /* empty */;
+      4'h8:
+          /* empty */;
+      4'h9:
+          /* empty */;
+      4'ha:
+          /* empty */;
+      4'hb:
+          /* empty */;
+      4'hc:
+          /* empty */;
+      4'hd:
+          /* empty */;
+      4'he:
+          \o_updated$next  = 1'h1;
+    endcase
+    if (pix_rst) begin
+      \o_updated$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    buttons_i_take = 1'h0;
+    casez (fsm_state)
+      4'h0:
+          if (\$14 ) begin
+            buttons_i_take = 1'h1;
+          end
+    endcase
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \random$next  = random;
+    casez (fsm_state)
+      4'h0:
+          if (\$18 ) begin
+            \random$next  = lfsr;
+          end
+    endcase
+    if (pix_rst) begin
+      \random$next  = 16'h0000;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \taken$next  = taken;
+    casez (fsm_state)
+      4'h0:
+          if (\$22 ) begin
+            \taken$next [3:0] = buttons_o_pressed[3:0];
+            \taken$next [4] = buttons_o_level[4];
+          end
+    endcase
+    if (pix_rst) begin
+      \taken$next  = 5'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$1 ) begin end
+    \fsm_state$next  = fsm_state;
+    casez (fsm_state)
+      4'h0:
+          if (\$26 ) begin
+            \fsm_state$next  = 4'h1;
+          end
+      4'h1:
+          (* full_case = 32'd1 *)
+          if (\$28 ) begin
+            \fsm_state$next  = 4'h0;
+          end else begin
+            \fsm_state$next  = 4'h2;
+          end
+      4'h2:
+          \fsm_state$next  = 4'h3;
+      4'h3:
+          \fsm_state$next  = 4'h4;
+      4'h4:
+          \fsm_state$next  = 4'h5;
+      4'h5:
+          \fsm_state$next  = 4'h6;
+      4'h6:
+          \fsm_state$next  = 4'h7;
+      4'h7:
+          \fsm_state$next  = 4'h8;
+      4'h8:
+          \fsm_state$next  = 4'h9;
+      4'h9:
+          \fsm_state$next  = 4'ha;
+      4'ha:
+          \fsm_state$next  = 4'hb;
+      4'hb:
+          \fsm_state$next  = 4'hc;
+      4'hc:
+          \fsm_state$next  = 4'hd;
+      4'hd:
+          \fsm_state$next  = 4'he;
+      4'he:
+          \fsm_state$next  = 4'h0;
+    endcase
+    if (pix_rst) begin
+      \fsm_state$next  = 4'h0;
+    end
+  end
+  assign \$7  = \$8 ;
+  assign \$100  = \$103 ;
+  assign \$107  = \$110 ;
+  assign o_vsync = vga_o_vsync;
+  assign o_hsync = vga_o_hsync;
+  assign o_b = vga_o_b;
+  assign o_g = vga_o_g;
+  assign o_r = vga_o_r;
+  assign vga_i_timer = time_until_start;
+  assign vga_i_enemy_score = enemy_score;
+  assign vga_i_player_score = player_score;
+  assign vga_i_enemy_paddle_location = enemy_paddle_location;
+  assign vga_i_paddle_location = paddle_location;
+  assign vga_i_pope_location = { pope_location[21:12], pope_location[9:0] };
+  assign buttons_i_buttons = { i_player_two_active, i_player_two_down, i_player_two_up, i_move_down, i_move_up };
+  assign add_sum = \$8 [11:0];
+  assign vga_i_enable = 1'h1;
+  assign \$38  = { acc[11], acc[11], acc[11], acc[11:3] };
+  assign \$44  = { acc[11], acc[11], acc[11], acc[11:3] };
+  assign \$47  = { pope_v_velocity, 1'h0 };
+  assign \$150  = pope_h_velocity;
+endmodule
+
+module \sphn_vga_top.buttons (i_take, o_pressed, o_level, pix_rst, pix_clk, i_buttons);
   reg \$auto$verilog_backend.cc:2352:dump_module$2  = 0;
+  wire \$1 ;
+  wire [16:0] \$3 ;
+  wire [16:0] \$4 ;
+  wire \$6 ;
+  wire [4:0] \$8 ;
+  input [4:0] i_buttons;
+  wire [4:0] i_buttons;
+  input i_take;
+  wire i_take;
+  output [4:0] o_level;
+  reg [4:0] o_level = 5'h00;
+  reg [4:0] \o_level$next ;
+  output [4:0] o_pressed;
+  wire [4:0] o_pressed;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  reg [15:0] prescaler = 16'h0000;
+  reg [15:0] \prescaler$next ;
+  reg [4:0] seen = 5'h00;
+  reg [4:0] \seen$next ;
+  wire [4:0] sync_synced;
+  always @(posedge pix_clk)
+    prescaler <= \prescaler$next ;
+  always @(posedge pix_clk)
+    o_level <= \o_level$next ;
+  always @(posedge pix_clk)
+    seen <= \seen$next ;
+  assign \$1  = prescaler == 16'hffff;
+  assign \$4  = prescaler + 1'h1;
+  assign \$6  = prescaler == 16'hffff;
+  assign \$8  = seen | o_level;
+  \sphn_vga_top.buttons.sync  sync (
+    .i_buttons(i_buttons),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst),
+    .synced(sync_synced)
+  );
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    (* full_case = 32'd1 *)
+    if (\$1 ) begin
+      \prescaler$next  = 16'h0000;
+    end else begin
+      \prescaler$next  = \$4 [15:0];
+    end
+    if (pix_rst) begin
+      \prescaler$next  = 16'h0000;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    \o_level$next  = o_level;
+    if (\$6 ) begin
+      \o_level$next  = sync_synced;
+    end
+    if (pix_rst) begin
+      \o_level$next  = 5'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    (* full_case = 32'd1 *)
+    if (i_take) begin
+      \seen$next  = 5'h00;
+    end else begin
+      \seen$next  = o_pressed;
+    end
+    if (pix_rst) begin
+      \seen$next  = 5'h00;
+    end
+  end
+  assign \$3  = \$4 ;
+  assign o_pressed = \$8 ;
+endmodule
+
+module \sphn_vga_top.buttons.sync (pix_rst, pix_clk, synced, i_buttons);
+  input [4:0] i_buttons;
+  wire [4:0] i_buttons;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  reg [4:0] stage0 = 5'h00;
+  wire [4:0] \stage0$next ;
+  reg [4:0] stage1 = 5'h00;
+  wire [4:0] \stage1$next ;
+  output [4:0] synced;
+  wire [4:0] synced;
+  always @(posedge pix_clk)
+    stage0 <= \stage0$next ;
+  always @(posedge pix_clk)
+    stage1 <= \stage1$next ;
+  assign synced = stage1;
+  assign \stage1$next  = stage0;
+  assign \stage0$next  = i_buttons;
+endmodule
+
+module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_paddle_location, i_player_score, i_enemy_score, i_timer, o_r, o_g, o_b, o_hsync, pix_rst, pix_clk, i_enable);
+  reg \$auto$verilog_backend.cc:2352:dump_module$3  = 0;
   wire [11:0] \$1 ;
   wire \$101 ;
   wire \$103 ;
   wire \$105 ;
   wire \$107 ;
   wire \$109 ;
-  wire \$11 ;
   wire \$111 ;
   wire \$113 ;
   wire \$115 ;
   wire \$117 ;
   wire \$119 ;
+  wire [11:0] \$12 ;
   wire \$121 ;
-  wire [2:0] \$123 ;
+  wire \$123 ;
   wire \$125 ;
-  wire \$127 ;
-  wire \$129 ;
-  wire \$13 ;
-  wire \$131 ;
-  wire \$133 ;
-  wire \$135 ;
-  wire \$137 ;
-  wire [2:0] \$139 ;
-  wire \$141 ;
-  wire \$143 ;
-  wire \$145 ;
-  wire \$147 ;
-  wire \$149 ;
-  wire \$15 ;
-  wire \$151 ;
-  wire \$153 ;
-  wire \$155 ;
-  wire \$157 ;
-  wire \$159 ;
-  wire \$161 ;
-  wire \$163 ;
-  wire \$165 ;
-  wire \$167 ;
-  wire \$169 ;
-  wire \$17 ;
-  wire \$171 ;
-  wire \$173 ;
-  wire [10:0] \$175 ;
-  wire \$177 ;
-  wire \$179 ;
-  wire \$181 ;
-  wire \$183 ;
-  wire \$185 ;
-  wire \$187 ;
-  wire \$189 ;
-  wire \$19 ;
-  wire [10:0] \$191 ;
-  wire \$193 ;
-  wire \$195 ;
-  wire \$197 ;
-  wire \$199 ;
+  wire [11:0] \$13 ;
+  wire [11:0] \$15 ;
+  wire \$16 ;
+  wire [11:0] \$19 ;
   wire [11:0] \$2 ;
-  wire \$201 ;
-  wire \$203 ;
-  wire \$205 ;
-  wire \$207 ;
-  wire \$209 ;
-  wire \$21 ;
-  wire \$211 ;
-  wire \$213 ;
-  wire \$215 ;
-  wire \$217 ;
-  wire \$219 ;
-  wire \$221 ;
-  wire \$223 ;
-  wire [2:0] \$225 ;
-  wire \$227 ;
-  wire \$229 ;
-  wire \$23 ;
-  wire \$231 ;
-  wire \$233 ;
-  wire \$235 ;
-  wire \$237 ;
-  wire \$239 ;
-  wire [2:0] \$241 ;
-  wire \$243 ;
-  wire \$245 ;
-  wire \$247 ;
-  wire \$249 ;
+  wire [11:0] \$21 ;
+  wire \$22 ;
   wire \$25 ;
-  wire \$251 ;
-  wire \$253 ;
-  wire \$255 ;
-  wire \$257 ;
-  wire \$259 ;
-  wire \$261 ;
-  wire \$263 ;
-  wire \$265 ;
-  wire \$267 ;
-  wire \$269 ;
   wire \$27 ;
-  wire \$271 ;
-  wire \$273 ;
-  wire \$275 ;
-  wire [10:0] \$277 ;
-  wire \$279 ;
-  wire \$281 ;
-  wire \$283 ;
-  wire \$285 ;
-  wire \$287 ;
-  wire \$289 ;
   wire \$29 ;
-  wire \$291 ;
-  wire [10:0] \$293 ;
-  wire \$295 ;
-  wire \$297 ;
-  wire \$299 ;
-  wire \$301 ;
-  wire \$303 ;
-  wire \$305 ;
-  wire \$307 ;
-  wire \$309 ;
   wire \$31 ;
-  wire \$311 ;
-  wire [11:0] \$313 ;
-  wire [11:0] \$315 ;
-  wire [11:0] \$317 ;
-  wire [11:0] \$319 ;
-  wire [11:0] \$321 ;
-  wire [11:0] \$323 ;
-  wire [11:0] \$325 ;
-  wire [11:0] \$327 ;
-  wire [11:0] \$329 ;
   wire \$33 ;
-  wire [11:0] \$331 ;
-  wire [11:0] \$333 ;
-  wire [11:0] \$335 ;
-  wire [11:0] \$337 ;
-  wire [11:0] \$339 ;
-  wire [11:0] \$341 ;
-  wire [11:0] \$343 ;
-  wire [11:0] \$345 ;
-  wire [11:0] \$347 ;
-  wire [11:0] \$349 ;
   wire \$35 ;
-  wire [11:0] \$351 ;
-  wire [11:0] \$353 ;
-  wire [11:0] \$355 ;
-  wire [11:0] \$357 ;
-  wire [11:0] \$359 ;
-  wire [11:0] \$361 ;
-  wire [11:0] \$363 ;
-  wire [11:0] \$365 ;
-  wire [11:0] \$367 ;
-  wire [11:0] \$369 ;
   wire \$37 ;
-  wire [11:0] \$371 ;
-  wire [11:0] \$373 ;
-  wire [11:0] \$375 ;
-  wire [11:0] \$377 ;
-  wire [11:0] \$379 ;
   wire \$39 ;
-  wire \$4 ;
+  wire [11:0] \$4 ;
   wire \$41 ;
   wire \$43 ;
   wire \$45 ;
   wire \$47 ;
   wire \$49 ;
   wire \$51 ;
-  wire \$53 ;
+  wire [2:0] \$53 ;
   wire \$55 ;
-  wire \$57 ;
+  wire [2:0] \$57 ;
   wire \$59 ;
   wire [11:0] \$6 ;
   wire \$61 ;
@@ -838,25 +1432,33 @@ module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_p
   wire \$65 ;
   wire \$67 ;
   wire \$69 ;
-  wire [11:0] \$7 ;
   wire \$71 ;
-  wire [10:0] \$73 ;
+  wire \$73 ;
   wire \$75 ;
   wire \$77 ;
   wire \$79 ;
+  wire [11:0] \$8 ;
   wire \$81 ;
   wire \$83 ;
   wire \$85 ;
   wire \$87 ;
-  wire [10:0] \$89 ;
+  wire \$89 ;
   wire \$9 ;
-  wire \$91 ;
+  wire [2:0] \$91 ;
   wire \$93 ;
-  wire \$95 ;
+  wire [2:0] \$95 ;
   wire \$97 ;
   wire \$99 ;
   reg [21:0] clock = 22'h000000;
   reg [21:0] \clock$next ;
+  wire [10:0] enemy_paddle_x_i_next;
+  wire enemy_paddle_x_o_inside;
+  wire [10:0] enemy_paddle_y_i_next;
+  wire enemy_paddle_y_o_inside;
+  wire [10:0] enemy_score_x_i_next;
+  wire enemy_score_x_o_inside;
+  wire [10:0] hsync_i_next;
+  wire hsync_o_inside;
   input i_enable;
   wire i_enable;
   input [9:0] i_enemy_paddle_location;
@@ -871,254 +1473,208 @@ module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_p
   wire [19:0] i_pope_location;
   input [7:0] i_timer;
   wire [7:0] i_timer;
+  wire [10:0] next_x;
+  wire [10:0] next_y;
   output [2:0] o_b;
   reg [2:0] o_b;
   output [2:0] o_g;
   reg [2:0] o_g;
   output o_hsync;
-  reg o_hsync;
+  wire o_hsync;
   output [2:0] o_r;
   reg [2:0] o_r;
   output o_vsync;
-  reg o_vsync;
-  reg [4:0] palette_index;
+  wire o_vsync;
+  wire [10:0] paddle_x_i_next;
+  wire paddle_x_o_inside;
+  wire [10:0] paddle_y_i_next;
+  wire paddle_y_o_inside;
+  wire [4:0] palette_index;
   input pix_clk;
   wire pix_clk;
   input pix_rst;
   wire pix_rst;
-  assign \$9  = clock[21:11] == 10'h20c;
-  assign \$99  = clock[10:0] >= 10'h24e;
-  assign \$101  = \$97  & \$99 ;
-  assign \$103  = clock[10:0] >= 10'h280;
-  assign \$105  = clock[21:11] >= 9'h1e0;
-  assign \$107  = \$103  | \$105 ;
-  assign \$109  = clock[10:0] >= 7'h64;
-  assign \$111  = clock[10:0] < 7'h7d;
-  assign \$113  = \$109  & \$111 ;
-  assign \$115  = clock[21:11] >= 6'h32;
-  assign \$117  = \$113  & \$115 ;
-  assign \$11  = clock[10:0] >= 10'h290;
-  assign \$119  = clock[21:11] < 7'h4b;
-  assign \$121  = \$117  & \$119 ;
-  assign \$123  = ~ i_player_score;
-  assign \$125  = clock[10:0] >= 10'h203;
-  assign \$127  = clock[10:0] < 10'h21c;
-  assign \$129  = \$125  & \$127 ;
-  assign \$131  = clock[21:11] >= 6'h32;
-  assign \$133  = \$129  & \$131 ;
-  assign \$135  = clock[21:11] < 7'h4b;
-  assign \$137  = \$133  & \$135 ;
-  assign \$13  = clock[10:0] < 10'h2f0;
-  assign \$139  = ~ i_enemy_score;
-  assign \$141  = clock[10:0] >= 8'hdc;
-  assign \$143  = clock[10:0] < 9'h1a4;
-  assign \$145  = \$141  & \$143 ;
-  assign \$147  = clock[21:11] >= 7'h64;
-  assign \$149  = \$145  & \$147 ;
-  assign \$151  = clock[21:11] < 8'hc8;
-  assign \$153  = \$149  & \$151 ;
-  assign \$155  = i_timer > 6'h3c;
-  assign \$157  = i_timer <= 7'h78;
-  assign \$15  = \$11  & \$13 ;
-  assign \$159  = \$155  & \$157 ;
-  assign \$161  = i_timer > 6'h3c;
-  assign \$163  = i_timer <= 7'h78;
-  assign \$165  = \$161  & \$163 ;
-  assign \$167  = i_timer > 6'h3c;
-  assign \$169  = i_timer <= 7'h78;
-  assign \$171  = \$167  & \$169 ;
-  assign \$173  = clock[21:11] >= i_paddle_location;
-  assign \$175  = i_paddle_location + 8'h96;
-  assign \$177  = clock[21:11] < \$175 ;
-  assign \$17  = clock[21:11] >= 9'h1ea;
-  assign \$179  = \$173  & \$177 ;
-  assign \$181  = clock[10:0] >= 5'h19;
-  assign \$183  = \$179  & \$181 ;
-  assign \$185  = clock[10:0] < 6'h32;
-  assign \$187  = \$183  & \$185 ;
-  assign \$189  = clock[21:11] >= i_enemy_paddle_location;
-  assign \$191  = i_enemy_paddle_location + 8'h96;
-  assign \$193  = clock[21:11] < \$191 ;
-  assign \$195  = \$189  & \$193 ;
-  assign \$197  = clock[10:0] < 10'h267;
-  assign \$19  = clock[21:11] < 9'h1ec;
-  assign \$199  = \$195  & \$197 ;
-  assign \$201  = clock[10:0] >= 10'h24e;
-  assign \$203  = \$199  & \$201 ;
-  assign \$205  = clock[10:0] >= 10'h280;
-  assign \$207  = clock[21:11] >= 9'h1e0;
-  assign \$209  = \$205  | \$207 ;
-  assign \$211  = clock[10:0] >= 7'h64;
-  assign \$213  = clock[10:0] < 7'h7d;
-  assign \$215  = \$211  & \$213 ;
-  assign \$217  = clock[21:11] >= 6'h32;
-  assign \$21  = \$17  & \$19 ;
-  assign \$219  = \$215  & \$217 ;
-  assign \$221  = clock[21:11] < 7'h4b;
-  assign \$223  = \$219  & \$221 ;
-  assign \$225  = ~ i_player_score;
-  assign \$227  = clock[10:0] >= 10'h203;
-  assign \$229  = clock[10:0] < 10'h21c;
-  assign \$231  = \$227  & \$229 ;
-  assign \$233  = clock[21:11] >= 6'h32;
-  assign \$235  = \$231  & \$233 ;
-  assign \$237  = clock[21:11] < 7'h4b;
-  assign \$23  = clock[10:0] >= 7'h64;
-  assign \$239  = \$235  & \$237 ;
-  assign \$241  = ~ i_enemy_score;
-  assign \$243  = clock[10:0] >= 8'hdc;
-  assign \$245  = clock[10:0] < 9'h1a4;
-  assign \$247  = \$243  & \$245 ;
-  assign \$249  = clock[21:11] >= 7'h64;
-  assign \$251  = \$247  & \$249 ;
-  assign \$253  = clock[21:11] < 8'hc8;
-  assign \$255  = \$251  & \$253 ;
-  assign \$257  = i_timer <= 6'h3c;
-  assign \$25  = clock[10:0] < 7'h7d;
-  assign \$259  = | i_timer;
-  assign \$261  = \$257  & \$259 ;
-  assign \$263  = i_timer <= 6'h3c;
-  assign \$265  = | i_timer;
-  assign \$267  = \$263  & \$265 ;
-  assign \$269  = i_timer <= 6'h3c;
-  assign \$271  = | i_timer;
-  assign \$273  = \$269  & \$271 ;
-  assign \$275  = clock[21:11] >= i_paddle_location;
-  assign \$277  = i_paddle_location + 8'h96;
-  assign \$27  = \$23  & \$25 ;
-  assign \$279  = clock[21:11] < \$277 ;
-  assign \$281  = \$275  & \$279 ;
-  assign \$283  = clock[10:0] >= 5'h19;
-  assign \$285  = \$281  & \$283 ;
-  assign \$287  = clock[10:0] < 6'h32;
-  assign \$289  = \$285  & \$287 ;
-  assign \$291  = clock[21:11] >= i_enemy_paddle_location;
-  assign \$293  = i_enemy_paddle_location + 8'h96;
-  assign \$295  = clock[21:11] < \$293 ;
-  assign \$297  = \$291  & \$295 ;
-  assign \$2  = clock[10:0] + 1'h1;
-  assign \$29  = clock[21:11] >= 6'h32;
-  assign \$299  = clock[10:0] < 10'h267;
-  assign \$301  = \$297  & \$299 ;
-  assign \$303  = clock[10:0] >= 10'h24e;
-  assign \$305  = \$301  & \$303 ;
-  assign \$307  = clock[10:0] >= 10'h280;
-  assign \$309  = clock[21:11] >= 9'h1e0;
-  assign \$311  = \$307  | \$309 ;
-  assign \$313  = clock[10:0] - i_pope_location[9:0];
-  assign \$315  = clock[21:11] - i_pope_location[19:10];
-  assign \$317  = clock[21:11] - i_pope_location[19:10];
-  assign \$31  = \$27  & \$29 ;
-  assign \$319  = clock[21:11] - i_pope_location[19:10];
-  assign \$321  = clock[21:11] - i_pope_location[19:10];
-  assign \$323  = clock[21:11] - i_pope_location[19:10];
-  assign \$325  = clock[21:11] - i_pope_location[19:10];
-  assign \$327  = clock[21:11] - i_pope_location[19:10];
-  assign \$329  = clock[21:11] - i_pope_location[19:10];
-  assign \$331  = clock[21:11] - i_pope_location[19:10];
-  assign \$333  = clock[21:11] - i_pope_location[19:10];
-  assign \$335  = clock[21:11] - i_pope_location[19:10];
-  assign \$337  = clock[21:11] - i_pope_location[19:10];
-  assign \$33  = clock[21:11] < 7'h4b;
-  assign \$339  = clock[21:11] - i_pope_location[19:10];
-  assign \$341  = clock[21:11] - i_pope_location[19:10];
-  assign \$343  = clock[21:11] - i_pope_location[19:10];
-  assign \$345  = clock[21:11] - i_pope_location[19:10];
-  assign \$347  = clock[21:11] - i_pope_location[19:10];
-  assign \$349  = clock[21:11] - i_pope_location[19:10];
-  assign \$351  = clock[21:11] - i_pope_location[19:10];
-  assign \$353  = clock[21:11] - i_pope_location[19:10];
-  assign \$355  = clock[21:11] - i_pope_location[19:10];
-  assign \$357  = clock[21:11] - i_pope_location[19:10];
-  assign \$35  = \$31  & \$33 ;
-  assign \$359  = clock[21:11] - i_pope_location[19:10];
-  assign \$361  = clock[21:11] - i_pope_location[19:10];
-  assign \$363  = clock[21:11] - i_pope_location[19:10];
-  assign \$365  = clock[21:11] - i_pope_location[19:10];
-  assign \$367  = clock[21:11] - i_pope_location[19:10];
-  assign \$369  = clock[21:11] - i_pope_location[19:10];
-  assign \$371  = clock[21:11] - i_pope_location[19:10];
-  assign \$373  = clock[21:11] - i_pope_location[19:10];
-  assign \$375  = clock[21:11] - i_pope_location[19:10];
-  assign \$377  = clock[21:11] - i_pope_location[19:10];
-  assign \$37  = clock[10:0] >= 10'h203;
-  assign \$379  = clock[21:11] - i_pope_location[19:10];
+  wire [10:0] player_score_x_i_next;
+  wire player_score_x_o_inside;
+  wire [10:0] score_y_i_next;
+  wire score_y_o_inside;
+  wire [21:0] sprite_i_clock;
+  wire sprite_i_enable;
+  wire [19:0] sprite_i_location;
+  wire [4:0] sprite_o_index;
+  wire [10:0] timer_x_i_next;
+  wire timer_x_o_inside;
+  wire [10:0] timer_y_i_next;
+  wire timer_y_o_inside;
+  wire [10:0] visible_x_i_next;
+  wire visible_x_o_inside;
+  wire [10:0] visible_y_i_next;
+  wire visible_y_o_inside;
+  wire [10:0] vsync_i_next;
+  wire vsync_o_inside;
+  assign \$9  = clock[10:0] == 10'h31f;
+  assign \$99  = i_timer <= 6'h3c;
+  assign \$101  = | i_timer;
+  assign \$103  = \$99  & \$101 ;
+  assign \$105  = i_timer <= 6'h3c;
+  assign \$107  = | i_timer;
+  assign \$8  = \$9  ? 12'h000 : \$6 ;
+  assign \$109  = \$105  & \$107 ;
+  assign \$111  = i_timer <= 6'h3c;
+  assign \$113  = | i_timer;
+  assign \$115  = \$111  & \$113 ;
+  assign \$117  = paddle_x_o_inside & paddle_y_o_inside;
+  assign \$119  = enemy_paddle_x_o_inside & enemy_paddle_y_o_inside;
+  assign \$121  = ~ visible_x_o_inside;
+  assign \$123  = ~ visible_y_o_inside;
+  assign \$125  = \$121  | \$123 ;
   always @(posedge pix_clk)
     clock <= \clock$next ;
-  assign \$39  = clock[10:0] < 10'h21c;
-  assign \$41  = \$37  & \$39 ;
-  assign \$43  = clock[21:11] >= 6'h32;
-  assign \$45  = \$41  & \$43 ;
-  assign \$47  = clock[21:11] < 7'h4b;
-  assign \$4  = clock[10:0] == 10'h31f;
-  assign \$49  = \$45  & \$47 ;
-  assign \$51  = clock[10:0] >= 8'hdc;
-  assign \$53  = clock[10:0] < 9'h1a4;
-  assign \$55  = \$51  & \$53 ;
-  assign \$57  = clock[21:11] >= 7'h64;
-  assign \$59  = \$55  & \$57 ;
-  assign \$61  = clock[21:11] < 8'hc8;
-  assign \$63  = \$59  & \$61 ;
-  assign \$65  = i_timer > 7'h78;
-  assign \$67  = i_timer > 7'h78;
-  assign \$69  = i_timer > 7'h78;
-  assign \$71  = clock[21:11] >= i_paddle_location;
-  assign \$73  = i_paddle_location + 8'h96;
-  assign \$75  = clock[21:11] < \$73 ;
-  assign \$77  = \$71  & \$75 ;
-  assign \$7  = clock[21:11] + 1'h1;
-  assign \$79  = clock[10:0] >= 5'h19;
-  assign \$81  = \$77  & \$79 ;
-  assign \$83  = clock[10:0] < 6'h32;
-  assign \$85  = \$81  & \$83 ;
-  assign \$87  = clock[21:11] >= i_enemy_paddle_location;
-  assign \$89  = i_enemy_paddle_location + 8'h96;
-  assign \$91  = clock[21:11] < \$89 ;
-  assign \$93  = \$87  & \$91 ;
-  assign \$95  = clock[10:0] < 10'h267;
-  assign \$97  = \$93  & \$95 ;
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
-    \clock$next  = clock;
-    if (i_enable) begin
-      \clock$next [10:0] = \$2 [10:0];
-    end
-    if (\$4 ) begin
-      \clock$next [10:0] = 11'h000;
-      \clock$next [21:11] = \$7 [10:0];
-      if (\$9 ) begin
-        \clock$next [21:11] = 11'h000;
-      end
-    end
-    if (pix_rst) begin
-      \clock$next  = 22'h000000;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
-    o_hsync = 1'h1;
-    if (\$15 ) begin
-      o_hsync = 1'h0;
-    end
-  end
-  always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
-    o_vsync = 1'h1;
-    if (\$21 ) begin
-      o_vsync = 1'h0;
-    end
-  end
+  assign \$13  = clock[21:11] + 1'h1;
+  assign \$16  = clock[21:11] == 10'h20c;
+  assign \$15  = \$16  ? 12'h000 : \$13 ;
+  assign \$19  = + clock[21:11];
+  assign \$22  = clock[10:0] == 10'h31f;
+  assign \$21  = \$22  ? \$15  : \$19 ;
+  assign \$25  = ~ hsync_o_inside;
+  assign \$27  = ~ vsync_o_inside;
+  assign \$2  = clock[10:0] + 1'h1;
+  assign \$29  = player_score_x_o_inside & score_y_o_inside;
+  assign \$31  = enemy_score_x_o_inside & score_y_o_inside;
+  assign \$33  = timer_x_o_inside & timer_y_o_inside;
+  assign \$35  = i_timer > 7'h78;
+  assign \$37  = i_timer > 7'h78;
+  assign \$39  = i_timer > 7'h78;
+  assign \$41  = paddle_x_o_inside & paddle_y_o_inside;
+  assign \$43  = enemy_paddle_x_o_inside & enemy_paddle_y_o_inside;
+  assign \$45  = ~ visible_x_o_inside;
+  assign \$47  = ~ visible_y_o_inside;
+  assign \$4  = + clock[10:0];
+  assign \$49  = \$45  | \$47 ;
+  assign \$51  = player_score_x_o_inside & score_y_o_inside;
+  assign \$53  = ~ i_player_score;
+  assign \$55  = enemy_score_x_o_inside & score_y_o_inside;
+  assign \$57  = ~ i_enemy_score;
+  assign \$59  = timer_x_o_inside & timer_y_o_inside;
+  assign \$61  = i_timer > 6'h3c;
+  assign \$63  = i_timer <= 7'h78;
+  assign \$65  = \$61  & \$63 ;
+  assign \$67  = i_timer > 6'h3c;
+  assign \$6  = i_enable ? \$2  : \$4 ;
+  assign \$69  = i_timer <= 7'h78;
+  assign \$71  = \$67  & \$69 ;
+  assign \$73  = i_timer > 6'h3c;
+  assign \$75  = i_timer <= 7'h78;
+  assign \$77  = \$73  & \$75 ;
+  assign \$79  = paddle_x_o_inside & paddle_y_o_inside;
+  assign \$81  = enemy_paddle_x_o_inside & enemy_paddle_y_o_inside;
+  assign \$83  = ~ visible_x_o_inside;
+  assign \$85  = ~ visible_y_o_inside;
+  assign \$87  = \$83  | \$85 ;
+  assign \$89  = player_score_x_o_inside & score_y_o_inside;
+  assign \$91  = ~ i_player_score;
+  assign \$93  = enemy_score_x_o_inside & score_y_o_inside;
+  assign \$95  = ~ i_enemy_score;
+  assign \$97  = timer_x_o_inside & timer_y_o_inside;
+  \sphn_vga_top.vga.enemy_paddle_x  enemy_paddle_x (
+    .i_next(enemy_paddle_x_i_next),
+    .o_inside(enemy_paddle_x_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.enemy_paddle_y  enemy_paddle_y (
+    .i_enemy_paddle_location(i_enemy_paddle_location),
+    .i_next(enemy_paddle_y_i_next),
+    .o_inside(enemy_paddle_y_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.enemy_score_x  enemy_score_x (
+    .i_next(enemy_score_x_i_next),
+    .o_inside(enemy_score_x_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.hsync  hsync (
+    .i_next(hsync_i_next),
+    .o_inside(hsync_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.paddle_x  paddle_x (
+    .i_next(paddle_x_i_next),
+    .o_inside(paddle_x_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.paddle_y  paddle_y (
+    .i_next(paddle_y_i_next),
+    .i_paddle_location(i_paddle_location),
+    .o_inside(paddle_y_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.player_score_x  player_score_x (
+    .i_next(player_score_x_i_next),
+    .o_inside(player_score_x_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.score_y  score_y (
+    .i_next(score_y_i_next),
+    .o_inside(score_y_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.sprite  sprite (
+    .i_clock(sprite_i_clock),
+    .i_enable(sprite_i_enable),
+    .i_location(sprite_i_location),
+    .o_index(sprite_o_index),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.timer_x  timer_x (
+    .i_next(timer_x_i_next),
+    .o_inside(timer_x_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.timer_y  timer_y (
+    .i_next(timer_y_i_next),
+    .o_inside(timer_y_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.visible_x  visible_x (
+    .i_next(visible_x_i_next),
+    .o_inside(visible_x_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.visible_y  visible_y (
+    .i_next(visible_y_i_next),
+    .o_inside(visible_y_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
+  \sphn_vga_top.vga.vsync  vsync (
+    .i_next(vsync_i_next),
+    .o_inside(vsync_o_inside),
+    .pix_clk(pix_clk),
+    .pix_rst(pix_rst)
+  );
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$3 ) begin end
     o_r = 3'h0;
-    if (\$35 ) begin
+    if (\$29 ) begin
       o_r = 3'h7;
     end
-    if (\$49 ) begin
+    if (\$31 ) begin
       o_r = 3'h7;
     end
-    if (\$63 ) begin
-      o_r = { \$69 , \$67 , \$65  };
+    if (\$33 ) begin
+      o_r = { \$39 , \$37 , \$35  };
     end
     casez (palette_index)
       5'h01:
@@ -1182,27 +1738,27 @@ module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_p
       5'h1e:
           o_r = 3'h7;
     endcase
-    if (\$85 ) begin
+    if (\$41 ) begin
       o_r = 3'h7;
     end
-    if (\$101 ) begin
+    if (\$43 ) begin
       o_r = 3'h7;
     end
-    if (\$107 ) begin
+    if (\$49 ) begin
       o_r = 3'h0;
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$3 ) begin end
     o_b = 3'h0;
-    if (\$121 ) begin
-      o_b = \$123 ;
+    if (\$51 ) begin
+      o_b = \$53 ;
     end
-    if (\$137 ) begin
-      o_b = \$139 ;
+    if (\$55 ) begin
+      o_b = \$57 ;
     end
-    if (\$153 ) begin
-      o_b = { \$171 , \$165 , \$159  };
+    if (\$59 ) begin
+      o_b = { \$77 , \$71 , \$65  };
     end
     casez (palette_index)
       5'h01:
@@ -1266,27 +1822,34 @@ module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_p
       5'h1e:
           o_b = 3'h5;
     endcase
-    if (\$187 ) begin
+    if (\$79 ) begin
       o_b = 3'h7;
     end
-    if (\$203 ) begin
+    if (\$81 ) begin
       o_b = 3'h7;
     end
-    if (\$209 ) begin
+    if (\$87 ) begin
       o_b = 3'h0;
     end
   end
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
+    if (\$auto$verilog_backend.cc:2352:dump_module$3 ) begin end
+    \clock$next  = { next_y, next_x };
+    if (pix_rst) begin
+      \clock$next  = 22'h000000;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$3 ) begin end
     o_g = 3'h0;
-    if (\$223 ) begin
-      o_g = \$225 ;
+    if (\$89 ) begin
+      o_g = \$91 ;
     end
-    if (\$239 ) begin
-      o_g = \$241 ;
+    if (\$93 ) begin
+      o_g = \$95 ;
     end
-    if (\$255 ) begin
-      o_g = { \$273 , \$267 , \$261  };
+    if (\$97 ) begin
+      o_g = { \$115 , \$109 , \$103  };
     end
     casez (palette_index)
       5'h01:
@@ -1350,2089 +1913,1659 @@ module \sphn_vga_top.vga (o_vsync, i_pope_location, i_paddle_location, i_enemy_p
       5'h1e:
           o_g = 3'h7;
     endcase
-    if (\$289 ) begin
+    if (\$117 ) begin
       o_g = 3'h7;
     end
-    if (\$305 ) begin
+    if (\$119 ) begin
       o_g = 3'h7;
     end
-    if (\$311 ) begin
+    if (\$125 ) begin
       o_g = 3'h0;
     end
   end
+  assign \$1  = \$8 ;
+  assign \$12  = \$21 ;
+  assign palette_index = sprite_o_index;
+  assign sprite_i_location = i_pope_location;
+  assign sprite_i_clock = clock;
+  assign sprite_i_enable = i_enable;
+  assign o_vsync = \$27 ;
+  assign o_hsync = \$25 ;
+  assign vsync_i_next = next_y;
+  assign hsync_i_next = next_x;
+  assign visible_y_i_next = next_y;
+  assign visible_x_i_next = next_x;
+  assign enemy_paddle_y_i_next = next_y;
+  assign enemy_paddle_x_i_next = next_x;
+  assign paddle_y_i_next = next_y;
+  assign paddle_x_i_next = next_x;
+  assign timer_y_i_next = next_y;
+  assign timer_x_i_next = next_x;
+  assign score_y_i_next = next_y;
+  assign enemy_score_x_i_next = next_x;
+  assign player_score_x_i_next = next_x;
+  assign next_y = \$21 [10:0];
+  assign next_x = \$8 [10:0];
+endmodule
+
+module \sphn_vga_top.vga.enemy_paddle_x (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$4  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 10'h24e;
+  assign \$5  = i_next == 10'h267;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
   always @* begin
-    if (\$auto$verilog_backend.cc:2352:dump_module$2 ) begin end
-    palette_index = 5'h00;
-    casez (\$313 )
-      12'h000:
-          casez (\$315 )
-            12'h010:
-                palette_index = 5'h1e;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h1a;
-            12'h014:
-                palette_index = 5'h1e;
-          endcase
-      12'h001:
-          casez (\$317 )
-            12'h010:
-                palette_index = 5'h13;
-            12'h011:
-                palette_index = 5'h15;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h15;
-            12'h014:
-                palette_index = 5'h18;
-            12'h015:
-                palette_index = 5'h1e;
-          endcase
-      12'h002:
-          casez (\$319 )
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h15;
-            12'h011:
-                palette_index = 5'h10;
-            12'h012:
-                palette_index = 5'h15;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h15;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h18;
-            12'h017:
-                palette_index = 5'h13;
-            12'h018:
-                palette_index = 5'h1a;
-          endcase
-      12'h003:
-          casez (\$321 )
-            12'h00f:
-                palette_index = 5'h0e;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h15;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h15;
-            12'h016:
-                palette_index = 5'h13;
-            12'h017:
-                palette_index = 5'h18;
-            12'h018:
-                palette_index = 5'h13;
-            12'h019:
-                palette_index = 5'h1e;
-          endcase
-      12'h004:
-          casez (\$323 )
-            12'h00a:
-                palette_index = 5'h1c;
-            12'h00b:
-                palette_index = 5'h0d;
-            12'h00c:
-                palette_index = 5'h0e;
-            12'h00d:
-                palette_index = 5'h0d;
-            12'h00e:
-                palette_index = 5'h0b;
-            12'h00f:
-                palette_index = 5'h07;
-            12'h010:
-                palette_index = 5'h0e;
-            12'h011:
-                palette_index = 5'h0e;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h0c;
-            12'h014:
-                palette_index = 5'h15;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h12;
-            12'h017:
-                palette_index = 5'h10;
-            12'h018:
-                palette_index = 5'h17;
-            12'h019:
-                palette_index = 5'h18;
-          endcase
-      12'h005:
-          casez (\$325 )
-            12'h008:
-                palette_index = 5'h1c;
-            12'h009:
-                palette_index = 5'h07;
-            12'h00a:
-                palette_index = 5'h08;
-            12'h00b:
-                palette_index = 5'h07;
-            12'h00c:
-                palette_index = 5'h07;
-            12'h00d:
-                palette_index = 5'h07;
-            12'h00e:
-                palette_index = 5'h07;
-            12'h00f:
-                palette_index = 5'h0b;
-            12'h010:
-                palette_index = 5'h0b;
-            12'h011:
-                palette_index = 5'h0e;
-            12'h012:
-                palette_index = 5'h0c;
-            12'h013:
-                palette_index = 5'h0c;
-            12'h014:
-                palette_index = 5'h09;
-            12'h015:
-                palette_index = 5'h0a;
-            12'h016:
-                palette_index = 5'h0a;
-            12'h017:
-                palette_index = 5'h0a;
-            12'h018:
-                palette_index = 5'h09;
-            12'h019:
-                palette_index = 5'h0a;
-            12'h01a:
-                palette_index = 5'h09;
-            12'h01b:
-                palette_index = 5'h10;
-            12'h01c:
-                palette_index = 5'h09;
-            12'h01d:
-                palette_index = 5'h09;
-            12'h01e:
-                palette_index = 5'h05;
-            12'h01f:
-                palette_index = 5'h06;
-            12'h020:
-                palette_index = 5'h05;
-            12'h021:
-                palette_index = 5'h0c;
-          endcase
-      12'h006:
-          casez (\$327 )
-            12'h007:
-                palette_index = 5'h0d;
-            12'h008:
-                palette_index = 5'h0b;
-            12'h009:
-                palette_index = 5'h07;
-            12'h00a:
-                palette_index = 5'h07;
-            12'h00b:
-                palette_index = 5'h07;
-            12'h00c:
-                palette_index = 5'h0b;
-            12'h00d:
-                palette_index = 5'h07;
-            12'h00e:
-                palette_index = 5'h0c;
-            12'h00f:
-                palette_index = 5'h0c;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h0c;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h09;
-            12'h014:
-                palette_index = 5'h0a;
-            12'h015:
-                palette_index = 5'h09;
-            12'h016:
-                palette_index = 5'h0a;
-            12'h017:
-                palette_index = 5'h09;
-            12'h018:
-                palette_index = 5'h0a;
-            12'h019:
-                palette_index = 5'h09;
-            12'h01a:
-                palette_index = 5'h0a;
-            12'h01b:
-                palette_index = 5'h09;
-            12'h01c:
-                palette_index = 5'h0a;
-            12'h01d:
-                palette_index = 5'h09;
-            12'h01e:
-                palette_index = 5'h0a;
-            12'h01f:
-                palette_index = 5'h09;
-            12'h020:
-                palette_index = 5'h0a;
-            12'h021:
-                palette_index = 5'h09;
-            12'h022:
-                palette_index = 5'h10;
-          endcase
-      12'h007:
-          casez (\$329 )
-            12'h006:
-                palette_index = 5'h0b;
-            12'h007:
-                palette_index = 5'h07;
-            12'h008:
-                palette_index = 5'h07;
-            12'h009:
-                palette_index = 5'h09;
-            12'h00a:
-                palette_index = 5'h09;
-            12'h00b:
-                palette_index = 5'h10;
-            12'h00c:
-                palette_index = 5'h0c;
-            12'h00d:
-                palette_index = 5'h10;
-            12'h00e:
-                palette_index = 5'h0c;
-            12'h00f:
-                palette_index = 5'h10;
-            12'h010:
-                palette_index = 5'h0c;
-            12'h011:
-                palette_index = 5'h10;
-            12'h012:
-                palette_index = 5'h0c;
-            12'h013:
-                palette_index = 5'h0f;
-            12'h014:
-                palette_index = 5'h0c;
-            12'h015:
-                palette_index = 5'h0f;
-            12'h016:
-                palette_index = 5'h0a;
-            12'h017:
-                palette_index = 5'h0f;
-            12'h018:
-                palette_index = 5'h0a;
-            12'h019:
-                palette_index = 5'h0a;
-            12'h01a:
-                palette_index = 5'h09;
-            12'h01b:
-                palette_index = 5'h0a;
-            12'h01c:
-                palette_index = 5'h09;
-            12'h01d:
-                palette_index = 5'h0a;
-            12'h01e:
-                palette_index = 5'h09;
-            12'h01f:
-                palette_index = 5'h0a;
-            12'h020:
-                palette_index = 5'h09;
-            12'h021:
-                palette_index = 5'h0a;
-            12'h022:
-                palette_index = 5'h09;
-            12'h023:
-                palette_index = 5'h15;
-          endcase
-      12'h008:
-          casez (\$331 )
-            12'h005:
-                palette_index = 5'h07;
-            12'h006:
-                palette_index = 5'h07;
-            12'h007:
-                palette_index = 5'h07;
-            12'h008:
-                palette_index = 5'h0c;
-            12'h009:
-                palette_index = 5'h0c;
-            12'h00a:
-                palette_index = 5'h12;
-            12'h00b:
-                palette_index = 5'h10;
-            12'h00c:
-                palette_index = 5'h12;
-            12'h00d:
-                palette_index = 5'h10;
-            12'h00e:
-                palette_index = 5'h10;
-            12'h00f:
-                palette_index = 5'h0c;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h0c;
-            12'h012:
-                palette_index = 5'h12;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h12;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h12;
-            12'h017:
-                palette_index = 5'h0f;
-            12'h018:
-                palette_index = 5'h12;
-            12'h019:
-                palette_index = 5'h0a;
-            12'h01a:
-                palette_index = 5'h0a;
-            12'h01b:
-                palette_index = 5'h09;
-            12'h01c:
-                palette_index = 5'h0a;
-            12'h01d:
-                palette_index = 5'h09;
-            12'h01e:
-                palette_index = 5'h0a;
-            12'h01f:
-                palette_index = 5'h09;
-            12'h020:
-                palette_index = 5'h0c;
-            12'h021:
-                palette_index = 5'h09;
-            12'h022:
-                palette_index = 5'h0c;
-            12'h023:
-                palette_index = 5'h09;
-            12'h024:
-                palette_index = 5'h1a;
-          endcase
-      12'h009:
-          casez (\$333 )
-            12'h004:
-                palette_index = 5'h0b;
-            12'h005:
-                palette_index = 5'h07;
-            12'h006:
-                palette_index = 5'h07;
-            12'h007:
-                palette_index = 5'h10;
-            12'h008:
-                palette_index = 5'h10;
-            12'h009:
-                palette_index = 5'h12;
-            12'h00a:
-                palette_index = 5'h10;
-            12'h00b:
-                palette_index = 5'h12;
-            12'h00c:
-                palette_index = 5'h10;
-            12'h00d:
-                palette_index = 5'h12;
-            12'h00e:
-                palette_index = 5'h10;
-            12'h00f:
-                palette_index = 5'h12;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h12;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h12;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h17;
-            12'h016:
-                palette_index = 5'h12;
-            12'h017:
-                palette_index = 5'h17;
-            12'h018:
-                palette_index = 5'h12;
-            12'h019:
-                palette_index = 5'h17;
-            12'h01a:
-                palette_index = 5'h0a;
-            12'h01b:
-                palette_index = 5'h0f;
-            12'h01c:
-                palette_index = 5'h09;
-            12'h01d:
-                palette_index = 5'h0a;
-            12'h01e:
-                palette_index = 5'h09;
-            12'h01f:
-                palette_index = 5'h0c;
-            12'h020:
-                palette_index = 5'h09;
-            12'h021:
-                palette_index = 5'h0c;
-            12'h022:
-                palette_index = 5'h09;
-            12'h023:
-                palette_index = 5'h0c;
-            12'h024:
-                palette_index = 5'h09;
-          endcase
-      12'h00a:
-          casez (\$335 )
-            12'h003:
-                palette_index = 5'h1f;
-            12'h004:
-                palette_index = 5'h07;
-            12'h005:
-                palette_index = 5'h09;
-            12'h006:
-                palette_index = 5'h10;
-            12'h007:
-                palette_index = 5'h10;
-            12'h008:
-                palette_index = 5'h12;
-            12'h009:
-                palette_index = 5'h10;
-            12'h00a:
-                palette_index = 5'h12;
-            12'h00b:
-                palette_index = 5'h10;
-            12'h00c:
-                palette_index = 5'h12;
-            12'h00d:
-                palette_index = 5'h10;
-            12'h00e:
-                palette_index = 5'h12;
-            12'h00f:
-                palette_index = 5'h10;
-            12'h010:
-                palette_index = 5'h12;
-            12'h011:
-                palette_index = 5'h10;
-            12'h012:
-                palette_index = 5'h12;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h12;
-            12'h015:
-                palette_index = 5'h12;
-            12'h016:
-                palette_index = 5'h18;
-            12'h017:
-                palette_index = 5'h18;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h12;
-            12'h01a:
-                palette_index = 5'h17;
-            12'h01b:
-                palette_index = 5'h0f;
-            12'h01c:
-                palette_index = 5'h0f;
-            12'h01d:
-                palette_index = 5'h0a;
-            12'h01e:
-                palette_index = 5'h0f;
-            12'h01f:
-                palette_index = 5'h0c;
-            12'h020:
-                palette_index = 5'h0f;
-            12'h021:
-                palette_index = 5'h0c;
-            12'h022:
-                palette_index = 5'h0c;
-            12'h023:
-                palette_index = 5'h09;
-            12'h024:
-                palette_index = 5'h0c;
-            12'h025:
-                palette_index = 5'h18;
-          endcase
-      12'h00b:
-          casez (\$337 )
-            12'h002:
-                palette_index = 5'h1d;
-            12'h003:
-                palette_index = 5'h0e;
-            12'h004:
-                palette_index = 5'h07;
-            12'h005:
-                palette_index = 5'h0c;
-            12'h006:
-                palette_index = 5'h10;
-            12'h007:
-                palette_index = 5'h12;
-            12'h008:
-                palette_index = 5'h10;
-            12'h009:
-                palette_index = 5'h12;
-            12'h00a:
-                palette_index = 5'h10;
-            12'h00b:
-                palette_index = 5'h12;
-            12'h00c:
-                palette_index = 5'h10;
-            12'h00d:
-                palette_index = 5'h12;
-            12'h00e:
-                palette_index = 5'h10;
-            12'h00f:
-                palette_index = 5'h12;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h12;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h12;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h17;
-            12'h016:
-                palette_index = 5'h18;
-            12'h017:
-                palette_index = 5'h1a;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h17;
-            12'h01c:
-                palette_index = 5'h0f;
-            12'h01d:
-                palette_index = 5'h0f;
-            12'h01e:
-                palette_index = 5'h0c;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h0c;
-            12'h023:
-                palette_index = 5'h0c;
-            12'h024:
-                palette_index = 5'h09;
-            12'h025:
-                palette_index = 5'h0c;
-          endcase
-      12'h00c:
-          casez (\$339 )
-            12'h002:
-                palette_index = 5'h1b;
-            12'h003:
-                palette_index = 5'h0b;
-            12'h004:
-                palette_index = 5'h0c;
-            12'h005:
-                palette_index = 5'h0c;
-            12'h006:
-                palette_index = 5'h12;
-            12'h007:
-                palette_index = 5'h10;
-            12'h008:
-                palette_index = 5'h12;
-            12'h009:
-                palette_index = 5'h10;
-            12'h00a:
-                palette_index = 5'h12;
-            12'h00b:
-                palette_index = 5'h10;
-            12'h00c:
-                palette_index = 5'h12;
-            12'h00d:
-                palette_index = 5'h10;
-            12'h00e:
-                palette_index = 5'h12;
-            12'h00f:
-                palette_index = 5'h10;
-            12'h010:
-                palette_index = 5'h12;
-            12'h011:
-                palette_index = 5'h10;
-            12'h012:
-                palette_index = 5'h12;
-            12'h013:
-                palette_index = 5'h0c;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h1a;
-            12'h017:
-                palette_index = 5'h18;
-            12'h018:
-                palette_index = 5'h1a;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h1a;
-            12'h01b:
-                palette_index = 5'h12;
-            12'h01c:
-                palette_index = 5'h12;
-            12'h01d:
-                palette_index = 5'h0a;
-            12'h01e:
-                palette_index = 5'h0f;
-            12'h01f:
-                palette_index = 5'h0f;
-            12'h020:
-                palette_index = 5'h12;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h0c;
-            12'h024:
-                palette_index = 5'h0c;
-            12'h025:
-                palette_index = 5'h09;
-            12'h026:
-                palette_index = 5'h10;
-          endcase
-      12'h00d:
-          casez (\$341 )
-            12'h001:
-                palette_index = 5'h1f;
-            12'h002:
-                palette_index = 5'h0d;
-            12'h003:
-                palette_index = 5'h04;
-            12'h004:
-                palette_index = 5'h09;
-            12'h005:
-                palette_index = 5'h12;
-            12'h006:
-                palette_index = 5'h10;
-            12'h007:
-                palette_index = 5'h17;
-            12'h008:
-                palette_index = 5'h15;
-            12'h009:
-                palette_index = 5'h18;
-            12'h00a:
-                palette_index = 5'h15;
-            12'h00b:
-                palette_index = 5'h12;
-            12'h00c:
-                palette_index = 5'h10;
-            12'h00d:
-                palette_index = 5'h12;
-            12'h00e:
-                palette_index = 5'h10;
-            12'h00f:
-                palette_index = 5'h12;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h12;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h09;
-            12'h014:
-                palette_index = 5'h05;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h13;
-            12'h017:
-                palette_index = 5'h1a;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h17;
-            12'h01c:
-                palette_index = 5'h0f;
-            12'h01d:
-                palette_index = 5'h0f;
-            12'h01e:
-                palette_index = 5'h09;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h12;
-            12'h022:
-                palette_index = 5'h10;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h10;
-            12'h025:
-                palette_index = 5'h10;
-            12'h026:
-                palette_index = 5'h09;
-            12'h027:
-                palette_index = 5'h18;
-          endcase
-      12'h00e:
-          casez (\$343 )
-            12'h001:
-                palette_index = 5'h1f;
-            12'h002:
-                palette_index = 5'h0b;
-            12'h003:
-                palette_index = 5'h02;
-            12'h004:
-                palette_index = 5'h0c;
-            12'h005:
-                palette_index = 5'h10;
-            12'h006:
-                palette_index = 5'h15;
-            12'h007:
-                palette_index = 5'h13;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h13;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h15;
-            12'h00c:
-                palette_index = 5'h15;
-            12'h00d:
-                palette_index = 5'h10;
-            12'h00e:
-                palette_index = 5'h12;
-            12'h00f:
-                palette_index = 5'h10;
-            12'h010:
-                palette_index = 5'h12;
-            12'h011:
-                palette_index = 5'h10;
-            12'h012:
-                palette_index = 5'h12;
-            12'h013:
-                palette_index = 5'h05;
-            12'h014:
-                palette_index = 5'h04;
-            12'h015:
-                palette_index = 5'h05;
-            12'h016:
-                palette_index = 5'h15;
-            12'h017:
-                palette_index = 5'h17;
-            12'h018:
-                palette_index = 5'h1a;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h1a;
-            12'h01b:
-                palette_index = 5'h12;
-            12'h01c:
-                palette_index = 5'h12;
-            12'h01d:
-                palette_index = 5'h09;
-            12'h01e:
-                palette_index = 5'h12;
-            12'h01f:
-                palette_index = 5'h10;
-            12'h020:
-                palette_index = 5'h12;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h10;
-            12'h026:
-                palette_index = 5'h10;
-            12'h027:
-                palette_index = 5'h0c;
-          endcase
-      12'h00f:
-          casez (\$345 )
-            12'h001:
-                palette_index = 5'h1f;
-            12'h002:
-                palette_index = 5'h07;
-            12'h003:
-                palette_index = 5'h04;
-            12'h004:
-                palette_index = 5'h09;
-            12'h005:
-                palette_index = 5'h15;
-            12'h006:
-                palette_index = 5'h15;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h13;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h13;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h06;
-            12'h014:
-                palette_index = 5'h02;
-            12'h015:
-                palette_index = 5'h04;
-            12'h016:
-                palette_index = 5'h09;
-            12'h017:
-                palette_index = 5'h12;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h17;
-            12'h01c:
-                palette_index = 5'h0a;
-            12'h01d:
-                palette_index = 5'h12;
-            12'h01e:
-                palette_index = 5'h10;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h12;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h17;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h12;
-            12'h026:
-                palette_index = 5'h10;
-            12'h027:
-                palette_index = 5'h10;
-          endcase
-      12'h010:
-          casez (\$347 )
-            12'h000:
-                palette_index = 5'h1f;
-            12'h001:
-                palette_index = 5'h1c;
-            12'h002:
-                palette_index = 5'h07;
-            12'h003:
-                palette_index = 5'h02;
-            12'h004:
-                palette_index = 5'h09;
-            12'h005:
-                palette_index = 5'h10;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h1a;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h1b;
-            12'h00b:
-                palette_index = 5'h18;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h15;
-            12'h013:
-                palette_index = 5'h05;
-            12'h014:
-                palette_index = 5'h04;
-            12'h015:
-                palette_index = 5'h02;
-            12'h016:
-                palette_index = 5'h09;
-            12'h017:
-                palette_index = 5'h0c;
-            12'h018:
-                palette_index = 5'h1a;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h0f;
-            12'h01c:
-                palette_index = 5'h12;
-            12'h01d:
-                palette_index = 5'h12;
-            12'h01e:
-                palette_index = 5'h18;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h12;
-            12'h021:
-                palette_index = 5'h12;
-            12'h022:
-                palette_index = 5'h17;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h17;
-            12'h025:
-                palette_index = 5'h12;
-            12'h026:
-                palette_index = 5'h12;
-            12'h027:
-                palette_index = 5'h10;
-          endcase
-      12'h011:
-          casez (\$349 )
-            12'h000:
-                palette_index = 5'h1d;
-            12'h001:
-                palette_index = 5'h1b;
-            12'h002:
-                palette_index = 5'h07;
-            12'h003:
-                palette_index = 5'h0b;
-            12'h004:
-                palette_index = 5'h07;
-            12'h005:
-                palette_index = 5'h15;
-            12'h006:
-                palette_index = 5'h13;
-            12'h007:
-                palette_index = 5'h1a;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1b;
-            12'h00a:
-                palette_index = 5'h1b;
-            12'h00b:
-                palette_index = 5'h1b;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h1a;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h09;
-            12'h014:
-                palette_index = 5'h02;
-            12'h015:
-                palette_index = 5'h03;
-            12'h016:
-                palette_index = 5'h04;
-            12'h017:
-                palette_index = 5'h10;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h12;
-            12'h01b:
-                palette_index = 5'h12;
-            12'h01c:
-                palette_index = 5'h12;
-            12'h01d:
-                palette_index = 5'h17;
-            12'h01e:
-                palette_index = 5'h17;
-            12'h01f:
-                palette_index = 5'h17;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h17;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h17;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h17;
-            12'h026:
-                palette_index = 5'h12;
-            12'h027:
-                palette_index = 5'h12;
-          endcase
-      12'h012:
-          casez (\$351 )
-            12'h000:
-                palette_index = 5'h1f;
-            12'h001:
-                palette_index = 5'h1b;
-            12'h002:
-                palette_index = 5'h0b;
-            12'h003:
-                palette_index = 5'h07;
-            12'h004:
-                palette_index = 5'h0b;
-            12'h005:
-                palette_index = 5'h10;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h1a;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h1b;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h1a;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h05;
-            12'h015:
-                palette_index = 5'h02;
-            12'h016:
-                palette_index = 5'h06;
-            12'h017:
-                palette_index = 5'h10;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h13;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h12;
-            12'h01c:
-                palette_index = 5'h17;
-            12'h01d:
-                palette_index = 5'h10;
-            12'h01e:
-                palette_index = 5'h17;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h12;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h17;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h17;
-            12'h025:
-                palette_index = 5'h12;
-            12'h026:
-                palette_index = 5'h17;
-            12'h027:
-                palette_index = 5'h10;
-          endcase
-      12'h013:
-          casez (\$353 )
-            12'h000:
-                palette_index = 5'h1d;
-            12'h001:
-                palette_index = 5'h1e;
-            12'h002:
-                palette_index = 5'h11;
-            12'h003:
-                palette_index = 5'h07;
-            12'h004:
-                palette_index = 5'h0b;
-            12'h005:
-                palette_index = 5'h15;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h1a;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h1a;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h18;
-            12'h014:
-                palette_index = 5'h05;
-            12'h015:
-                palette_index = 5'h06;
-            12'h016:
-                palette_index = 5'h09;
-            12'h017:
-                palette_index = 5'h17;
-            12'h018:
-                palette_index = 5'h17;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h17;
-            12'h01b:
-                palette_index = 5'h17;
-            12'h01c:
-                palette_index = 5'h17;
-            12'h01d:
-                palette_index = 5'h12;
-            12'h01e:
-                palette_index = 5'h10;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h12;
-            12'h022:
-                palette_index = 5'h10;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h17;
-            12'h026:
-                palette_index = 5'h12;
-            12'h027:
-                palette_index = 5'h17;
-          endcase
-      12'h014:
-          casez (\$355 )
-            12'h000:
-                palette_index = 5'h1f;
-            12'h001:
-                palette_index = 5'h1b;
-            12'h002:
-                palette_index = 5'h0e;
-            12'h003:
-                palette_index = 5'h07;
-            12'h004:
-                palette_index = 5'h14;
-            12'h005:
-                palette_index = 5'h16;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h1a;
-            12'h009:
-                palette_index = 5'h18;
-            12'h00a:
-                palette_index = 5'h1a;
-            12'h00b:
-                palette_index = 5'h18;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h1a;
-            12'h013:
-                palette_index = 5'h13;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h09;
-            12'h016:
-                palette_index = 5'h12;
-            12'h017:
-                palette_index = 5'h17;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h13;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h18;
-            12'h01c:
-                palette_index = 5'h1a;
-            12'h01d:
-                palette_index = 5'h17;
-            12'h01e:
-                palette_index = 5'h12;
-            12'h01f:
-                palette_index = 5'h09;
-            12'h020:
-                palette_index = 5'h12;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h10;
-            12'h024:
-                palette_index = 5'h17;
-            12'h025:
-                palette_index = 5'h12;
-            12'h026:
-                palette_index = 5'h17;
-            12'h027:
-                palette_index = 5'h12;
-          endcase
-      12'h015:
-          casez (\$357 )
-            12'h000:
-                palette_index = 5'h1d;
-            12'h001:
-                palette_index = 5'h1f;
-            12'h002:
-                palette_index = 5'h0e;
-            12'h003:
-                palette_index = 5'h0e;
-            12'h004:
-                palette_index = 5'h14;
-            12'h005:
-                palette_index = 5'h1e;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h1a;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h1a;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h1a;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h12;
-            12'h016:
-                palette_index = 5'h10;
-            12'h017:
-                palette_index = 5'h1a;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h1a;
-            12'h01c:
-                palette_index = 5'h1a;
-            12'h01d:
-                palette_index = 5'h1a;
-            12'h01e:
-                palette_index = 5'h10;
-            12'h01f:
-                palette_index = 5'h0c;
-            12'h020:
-                palette_index = 5'h0c;
-            12'h021:
-                palette_index = 5'h12;
-            12'h022:
-                palette_index = 5'h10;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h17;
-            12'h026:
-                palette_index = 5'h12;
-            12'h027:
-                palette_index = 5'h17;
-          endcase
-      12'h016:
-          casez (\$359 )
-            12'h001:
-                palette_index = 5'h1d;
-            12'h002:
-                palette_index = 5'h16;
-            12'h003:
-                palette_index = 5'h0e;
-            12'h004:
-                palette_index = 5'h16;
-            12'h005:
-                palette_index = 5'h19;
-            12'h006:
-                palette_index = 5'h1a;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h1a;
-            12'h009:
-                palette_index = 5'h18;
-            12'h00a:
-                palette_index = 5'h1a;
-            12'h00b:
-                palette_index = 5'h18;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h1a;
-            12'h013:
-                palette_index = 5'h18;
-            12'h014:
-                palette_index = 5'h15;
-            12'h015:
-                palette_index = 5'h0c;
-            12'h016:
-                palette_index = 5'h0c;
-            12'h017:
-                palette_index = 5'h10;
-            12'h018:
-                palette_index = 5'h1a;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h1a;
-            12'h01b:
-                palette_index = 5'h18;
-            12'h01c:
-                palette_index = 5'h1a;
-            12'h01d:
-                palette_index = 5'h13;
-            12'h01e:
-                palette_index = 5'h12;
-            12'h01f:
-                palette_index = 5'h0c;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h10;
-            12'h024:
-                palette_index = 5'h17;
-            12'h025:
-                palette_index = 5'h12;
-            12'h026:
-                palette_index = 5'h17;
-            12'h027:
-                palette_index = 5'h1a;
-          endcase
-      12'h017:
-          casez (\$361 )
-            12'h001:
-                palette_index = 5'h1f;
-            12'h002:
-                palette_index = 5'h16;
-            12'h003:
-                palette_index = 5'h16;
-            12'h004:
-                palette_index = 5'h16;
-            12'h005:
-                palette_index = 5'h1b;
-            12'h006:
-                palette_index = 5'h1a;
-            12'h007:
-                palette_index = 5'h1a;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h1a;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h1a;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h09;
-            12'h016:
-                palette_index = 5'h02;
-            12'h017:
-                palette_index = 5'h05;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h18;
-            12'h01c:
-                palette_index = 5'h10;
-            12'h01d:
-                palette_index = 5'h10;
-            12'h01e:
-                palette_index = 5'h0c;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h0c;
-            12'h021:
-                palette_index = 5'h12;
-            12'h022:
-                palette_index = 5'h10;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h17;
-            12'h026:
-                palette_index = 5'h18;
-          endcase
-      12'h018:
-          casez (\$363 )
-            12'h001:
-                palette_index = 5'h1d;
-            12'h002:
-                palette_index = 5'h1b;
-            12'h003:
-                palette_index = 5'h16;
-            12'h004:
-                palette_index = 5'h1e;
-            12'h005:
-                palette_index = 5'h19;
-            12'h006:
-                palette_index = 5'h1b;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h1a;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h1b;
-            12'h00b:
-                palette_index = 5'h18;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h1a;
-            12'h013:
-                palette_index = 5'h18;
-            12'h014:
-                palette_index = 5'h12;
-            12'h015:
-                palette_index = 5'h04;
-            12'h016:
-                palette_index = 5'h01;
-            12'h017:
-                palette_index = 5'h01;
-            12'h018:
-                palette_index = 5'h10;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h1a;
-            12'h01b:
-                palette_index = 5'h18;
-            12'h01c:
-                palette_index = 5'h10;
-            12'h01d:
-                palette_index = 5'h06;
-            12'h01e:
-                palette_index = 5'h06;
-            12'h01f:
-                palette_index = 5'h09;
-            12'h020:
-                palette_index = 5'h09;
-            12'h021:
-                palette_index = 5'h0c;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h10;
-            12'h024:
-                palette_index = 5'h12;
-            12'h025:
-                palette_index = 5'h10;
-          endcase
-      12'h019:
-          casez (\$365 )
-            12'h002:
-                palette_index = 5'h1d;
-            12'h003:
-                palette_index = 5'h1e;
-            12'h004:
-                palette_index = 5'h19;
-            12'h005:
-                palette_index = 5'h1b;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h1a;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1b;
-            12'h00a:
-                palette_index = 5'h1a;
-            12'h00b:
-                palette_index = 5'h1b;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h1a;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h1a;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h04;
-            12'h016:
-                palette_index = 5'h02;
-            12'h017:
-                palette_index = 5'h03;
-            12'h018:
-                palette_index = 5'h10;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h1a;
-            12'h01c:
-                palette_index = 5'h13;
-            12'h01d:
-                palette_index = 5'h0c;
-            12'h01e:
-                palette_index = 5'h05;
-            12'h01f:
-                palette_index = 5'h09;
-            12'h020:
-                palette_index = 5'h09;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h10;
-            12'h023:
-                palette_index = 5'h12;
-            12'h024:
-                palette_index = 5'h10;
-          endcase
-      12'h01a:
-          casez (\$367 )
-            12'h003:
-                palette_index = 5'h1b;
-            12'h004:
-                palette_index = 5'h1b;
-            12'h005:
-                palette_index = 5'h16;
-            12'h006:
-                palette_index = 5'h1a;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h1a;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h1b;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h1a;
-            12'h013:
-                palette_index = 5'h18;
-            12'h014:
-                palette_index = 5'h15;
-            12'h015:
-                palette_index = 5'h04;
-            12'h016:
-                palette_index = 5'h01;
-            12'h017:
-                palette_index = 5'h01;
-            12'h018:
-                palette_index = 5'h15;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h1a;
-            12'h01b:
-                palette_index = 5'h1a;
-            12'h01c:
-                palette_index = 5'h1a;
-            12'h01d:
-                palette_index = 5'h10;
-            12'h01e:
-                palette_index = 5'h0a;
-            12'h01f:
-                palette_index = 5'h09;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h10;
-            12'h022:
-                palette_index = 5'h12;
-            12'h023:
-                palette_index = 5'h1a;
-          endcase
-      12'h01b:
-          casez (\$369 )
-            12'h004:
-                palette_index = 5'h16;
-            12'h005:
-                palette_index = 5'h18;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h1b;
-            12'h00a:
-                palette_index = 5'h1b;
-            12'h00b:
-                palette_index = 5'h1e;
-            12'h00c:
-                palette_index = 5'h1b;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h1a;
-            12'h010:
-                palette_index = 5'h18;
-            12'h011:
-                palette_index = 5'h1a;
-            12'h012:
-                palette_index = 5'h18;
-            12'h013:
-                palette_index = 5'h1a;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h09;
-            12'h016:
-                palette_index = 5'h01;
-            12'h017:
-                palette_index = 5'h04;
-            12'h018:
-                palette_index = 5'h15;
-            12'h019:
-                palette_index = 5'h1a;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h1a;
-            12'h01c:
-                palette_index = 5'h18;
-            12'h01d:
-                palette_index = 5'h12;
-            12'h01e:
-                palette_index = 5'h0a;
-            12'h01f:
-                palette_index = 5'h12;
-            12'h020:
-                palette_index = 5'h10;
-            12'h021:
-                palette_index = 5'h1a;
-            12'h022:
-                palette_index = 5'h1e;
-          endcase
-      12'h01c:
-          casez (\$371 )
-            12'h004:
-                palette_index = 5'h1f;
-            12'h005:
-                palette_index = 5'h16;
-            12'h006:
-                palette_index = 5'h18;
-            12'h007:
-                palette_index = 5'h13;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h18;
-            12'h00a:
-                palette_index = 5'h1e;
-            12'h00b:
-                palette_index = 5'h1b;
-            12'h00c:
-                palette_index = 5'h1e;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h1a;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h1a;
-            12'h011:
-                palette_index = 5'h18;
-            12'h012:
-                palette_index = 5'h1a;
-            12'h013:
-                palette_index = 5'h18;
-            12'h014:
-                palette_index = 5'h18;
-            12'h015:
-                palette_index = 5'h09;
-            12'h016:
-                palette_index = 5'h05;
-            12'h017:
-                palette_index = 5'h05;
-            12'h018:
-                palette_index = 5'h18;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h1a;
-            12'h01b:
-                palette_index = 5'h18;
-            12'h01c:
-                palette_index = 5'h18;
-            12'h01d:
-                palette_index = 5'h10;
-            12'h01e:
-                palette_index = 5'h12;
-            12'h01f:
-                palette_index = 5'h15;
-            12'h020:
-                palette_index = 5'h1f;
-          endcase
-      12'h01d:
-          casez (\$373 )
-            12'h005:
-                palette_index = 5'h1f;
-            12'h006:
-                palette_index = 5'h16;
-            12'h007:
-                palette_index = 5'h18;
-            12'h008:
-                palette_index = 5'h16;
-            12'h009:
-                palette_index = 5'h1a;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h1a;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h1a;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h18;
-            12'h010:
-                palette_index = 5'h15;
-            12'h011:
-                palette_index = 5'h15;
-            12'h012:
-                palette_index = 5'h15;
-            12'h013:
-                palette_index = 5'h18;
-            12'h014:
-                palette_index = 5'h10;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h09;
-            12'h017:
-                palette_index = 5'h10;
-            12'h018:
-                palette_index = 5'h13;
-            12'h019:
-                palette_index = 5'h18;
-            12'h01a:
-                palette_index = 5'h13;
-            12'h01b:
-                palette_index = 5'h18;
-            12'h01c:
-                palette_index = 5'h18;
-            12'h01d:
-                palette_index = 5'h1e;
-          endcase
-      12'h01e:
-          casez (\$375 )
-            12'h006:
-                palette_index = 5'h1f;
-            12'h007:
-                palette_index = 5'h16;
-            12'h008:
-                palette_index = 5'h18;
-            12'h009:
-                palette_index = 5'h13;
-            12'h00a:
-                palette_index = 5'h18;
-            12'h00b:
-                palette_index = 5'h18;
-            12'h00c:
-                palette_index = 5'h1a;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h18;
-            12'h00f:
-                palette_index = 5'h15;
-            12'h010:
-                palette_index = 5'h15;
-            12'h011:
-                palette_index = 5'h10;
-            12'h012:
-                palette_index = 5'h15;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h15;
-            12'h015:
-                palette_index = 5'h0c;
-            12'h016:
-                palette_index = 5'h0c;
-            12'h017:
-                palette_index = 5'h0c;
-            12'h018:
-                palette_index = 5'h15;
-            12'h019:
-                palette_index = 5'h10;
-            12'h01a:
-                palette_index = 5'h18;
-            12'h01b:
-                palette_index = 5'h1b;
-          endcase
-      12'h01f:
-          casez (\$377 )
-            12'h007:
-                palette_index = 5'h1f;
-            12'h008:
-                palette_index = 5'h11;
-            12'h009:
-                palette_index = 5'h18;
-            12'h00a:
-                palette_index = 5'h13;
-            12'h00b:
-                palette_index = 5'h18;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h18;
-            12'h00e:
-                palette_index = 5'h15;
-            12'h00f:
-                palette_index = 5'h15;
-            12'h010:
-                palette_index = 5'h10;
-            12'h011:
-                palette_index = 5'h15;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h10;
-            12'h014:
-                palette_index = 5'h0c;
-            12'h015:
-                palette_index = 5'h10;
-            12'h016:
-                palette_index = 5'h0c;
-            12'h017:
-                palette_index = 5'h15;
-            12'h018:
-                palette_index = 5'h1a;
-            12'h019:
-                palette_index = 5'h1e;
-          endcase
-      12'h020:
-          casez (\$379 )
-            12'h008:
-                palette_index = 5'h1b;
-            12'h009:
-                palette_index = 5'h11;
-            12'h00a:
-                palette_index = 5'h16;
-            12'h00b:
-                palette_index = 5'h16;
-            12'h00c:
-                palette_index = 5'h18;
-            12'h00d:
-                palette_index = 5'h13;
-            12'h00e:
-                palette_index = 5'h15;
-            12'h00f:
-                palette_index = 5'h10;
-            12'h010:
-                palette_index = 5'h15;
-            12'h011:
-                palette_index = 5'h0e;
-            12'h012:
-                palette_index = 5'h10;
-            12'h013:
-                palette_index = 5'h0e;
-            12'h014:
-                palette_index = 5'h1b;
-            12'h015:
-                palette_index = 5'h1b;
-          endcase
-    endcase
+    if (\$auto$verilog_backend.cc:2352:dump_module$4 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.enemy_paddle_y (pix_rst, pix_clk, i_next, o_inside, i_enemy_paddle_location);
+  reg \$auto$verilog_backend.cc:2352:dump_module$5  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire [10:0] \$5 ;
+  wire \$7 ;
+  wire \$9 ;
+  input [9:0] i_enemy_paddle_location;
+  wire [9:0] i_enemy_paddle_location;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$9  = ! i_enemy_paddle_location;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == i_enemy_paddle_location;
+  assign \$5  = i_enemy_paddle_location + 8'h96;
+  assign \$7  = i_next == \$5 ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$5 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = \$9 ;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$7 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.enemy_score_x (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$6  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 10'h203;
+  assign \$5  = i_next == 10'h21c;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$6 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.hsync (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$7  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 10'h290;
+  assign \$5  = i_next == 10'h2f0;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$7 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.paddle_x (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$8  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 5'h19;
+  assign \$5  = i_next == 6'h32;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$8 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.paddle_y (pix_rst, pix_clk, i_next, o_inside, i_paddle_location);
+  reg \$auto$verilog_backend.cc:2352:dump_module$9  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire [10:0] \$5 ;
+  wire \$7 ;
+  wire \$9 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  input [9:0] i_paddle_location;
+  wire [9:0] i_paddle_location;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$9  = ! i_paddle_location;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == i_paddle_location;
+  assign \$5  = i_paddle_location + 8'h96;
+  assign \$7  = i_next == \$5 ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$9 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = \$9 ;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$7 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.player_score_x (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$10  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 7'h64;
+  assign \$5  = i_next == 7'h7d;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$10 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.score_y (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$11  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 6'h32;
+  assign \$5  = i_next == 7'h4b;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$11 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.sprite (pix_clk, i_enable, i_clock, i_location, o_index, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$12  = 0;
+  wire \$11 ;
+  wire \$13 ;
+  wire \$15 ;
+  wire \$17 ;
+  wire \$19 ;
+  wire [11:0] \$21 ;
+  wire [11:0] \$23 ;
+  wire \$24 ;
+  wire \$27 ;
+  wire \$29 ;
+  wire \$3 ;
+  wire \$31 ;
+  wire \$33 ;
+  wire [6:0] \$35 ;
+  wire [6:0] \$36 ;
+  wire \$38 ;
+  wire \$40 ;
+  wire [11:0] \$42 ;
+  wire [11:0] \$44 ;
+  wire \$45 ;
+  wire \$48 ;
+  wire [11:0] \$5 ;
+  wire \$50 ;
+  wire \$52 ;
+  wire \$54 ;
+  wire \$56 ;
+  wire \$58 ;
+  wire [11:0] \$60 ;
+  wire [11:0] \$62 ;
+  wire \$63 ;
+  wire \$66 ;
+  wire \$68 ;
+  wire [11:0] \$7 ;
+  wire \$70 ;
+  wire \$72 ;
+  wire [10:0] \$74 ;
+  wire [10:0] \$75 ;
+  wire \$77 ;
+  wire \$79 ;
+  wire \$8 ;
+  wire [11:0] \$81 ;
+  wire [11:0] \$83 ;
+  wire \$84 ;
+  wire \$87 ;
+  wire \$89 ;
+  wire \$91 ;
+  wire \$93 ;
+  wire [5:0] \$95 ;
+  wire [5:0] \$96 ;
+  wire [4:0] \$98 ;
+  reg [9:0] \$memory_r_addr  = 10'h000;
+  wire [5:0] \$memory_r_addr$1 ;
+  reg [9:0] \$memory_r_addr$next ;
+  wire [10:0] \$memory_r_data ;
+  wire [9:0] \$memory_r_data$2 ;
+  reg active = 1'h0;
+  reg \active$next ;
+  input [21:0] i_clock;
+  wire [21:0] i_clock;
+  input i_enable;
+  wire i_enable;
+  input [19:0] i_location;
+  wire [19:0] i_location;
+  reg [5:0] next_row;
+  reg next_row_active;
+  output [4:0] o_index;
+  wire [4:0] o_index;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  reg [5:0] row = 6'h00;
+  reg [5:0] \row$next ;
+  reg row_active = 1'h0;
+  reg \row_active$next ;
+  reg [4:0] run_count = 5'h00;
+  reg [4:0] \run_count$next ;
+  reg [9:0] row_rom [39:0];
+  initial begin
+    row_rom[0] = 10'h000;
+    row_rom[1] = 10'h006;
+    row_rom[2] = 10'h00f;
+    row_rom[3] = 10'h01b;
+    row_rom[4] = 10'h028;
+    row_rom[5] = 10'h037;
+    row_rom[6] = 10'h04b;
+    row_rom[7] = 10'h05b;
+    row_rom[8] = 10'h071;
+    row_rom[9] = 10'h08c;
+    row_rom[10] = 10'h0a5;
+    row_rom[11] = 10'h0be;
+    row_rom[12] = 10'h0d8;
+    row_rom[13] = 10'h0f3;
+    row_rom[14] = 10'h10d;
+    row_rom[15] = 10'h127;
+    row_rom[16] = 10'h144;
+    row_rom[17] = 10'h163;
+    row_rom[18] = 10'h183;
+    row_rom[19] = 10'h1a1;
+    row_rom[20] = 10'h1be;
+    row_rom[21] = 10'h1dc;
+    row_rom[22] = 10'h1f9;
+    row_rom[23] = 10'h211;
+    row_rom[24] = 10'h22d;
+    row_rom[25] = 10'h245;
+    row_rom[26] = 10'h261;
+    row_rom[27] = 10'h279;
+    row_rom[28] = 10'h28d;
+    row_rom[29] = 10'h29f;
+    row_rom[30] = 10'h2b6;
+    row_rom[31] = 10'h2cd;
+    row_rom[32] = 10'h2e0;
+    row_rom[33] = 10'h2f6;
+    row_rom[34] = 10'h30a;
+    row_rom[35] = 10'h31f;
+    row_rom[36] = 10'h331;
+    row_rom[37] = 10'h342;
+    row_rom[38] = 10'h350;
+    row_rom[39] = 10'h35b;
+  end
+  assign \$memory_r_data$2  = row_rom[\$memory_r_addr$1 ];
+  reg [10:0] run_rom [868:0];
+  initial begin
+    run_rom[0] = 11'h200;
+    run_rom[1] = 11'h01d;
+    run_rom[2] = 11'h000;
+    run_rom[3] = 11'h01d;
+    run_rom[4] = 11'h000;
+    run_rom[5] = 11'h41d;
+    run_rom[6] = 11'h1e0;
+    run_rom[7] = 11'h01c;
+    run_rom[8] = 11'h03b;
+    run_rom[9] = 11'h01e;
+    run_rom[10] = 11'h01b;
+    run_rom[11] = 11'h000;
+    run_rom[12] = 11'h01d;
+    run_rom[13] = 11'h000;
+    run_rom[14] = 11'h41d;
+    run_rom[15] = 11'h140;
+    run_rom[16] = 11'h01d;
+    run_rom[17] = 11'h01b;
+    run_rom[18] = 11'h00d;
+    run_rom[19] = 11'h00b;
+    run_rom[20] = 11'h047;
+    run_rom[21] = 11'h00b;
+    run_rom[22] = 11'h011;
+    run_rom[23] = 11'h02e;
+    run_rom[24] = 11'h036;
+    run_rom[25] = 11'h01b;
+    run_rom[26] = 11'h41d;
+    run_rom[27] = 11'h140;
+    run_rom[28] = 11'h00e;
+    run_rom[29] = 11'h00b;
+    run_rom[30] = 11'h004;
+    run_rom[31] = 11'h002;
+    run_rom[32] = 11'h004;
+    run_rom[33] = 11'h002;
+    run_rom[34] = 11'h00b;
+    run_rom[35] = 11'h047;
+    run_rom[36] = 11'h02e;
+    run_rom[37] = 11'h036;
+    run_rom[38] = 11'h01e;
+    run_rom[39] = 11'h41b;
+    run_rom[40] = 11'h100;
+    run_rom[41] = 11'h00b;
+    run_rom[42] = 11'h027;
+    run_rom[43] = 11'h00c;
+    run_rom[44] = 11'h009;
+    run_rom[45] = 11'h00c;
+    run_rom[46] = 11'h029;
+    run_rom[47] = 11'h007;
+    run_rom[48] = 11'h02b;
+    run_rom[49] = 11'h034;
+    run_rom[50] = 11'h036;
+    run_rom[51] = 11'h01e;
+    run_rom[52] = 11'h019;
+    run_rom[53] = 11'h01b;
+    run_rom[54] = 11'h416;
+    run_rom[55] = 11'h0e0;
+    run_rom[56] = 11'h027;
+    run_rom[57] = 11'h009;
+    run_rom[58] = 11'h02c;
+    run_rom[59] = 11'h012;
+    run_rom[60] = 11'h010;
+    run_rom[61] = 11'h015;
+    run_rom[62] = 11'h010;
+    run_rom[63] = 11'h015;
+    run_rom[64] = 11'h010;
+    run_rom[65] = 11'h015;
+    run_rom[66] = 11'h016;
+    run_rom[67] = 11'h01e;
+    run_rom[68] = 11'h019;
+    run_rom[69] = 11'h01b;
+    run_rom[70] = 11'h019;
+    run_rom[71] = 11'h01b;
+    run_rom[72] = 11'h016;
+    run_rom[73] = 11'h018;
+    run_rom[74] = 11'h416;
+    run_rom[75] = 11'h0c0;
+    run_rom[76] = 11'h00b;
+    run_rom[77] = 11'h027;
+    run_rom[78] = 11'h030;
+    run_rom[79] = 11'h012;
+    run_rom[80] = 11'h010;
+    run_rom[81] = 11'h035;
+    run_rom[82] = 11'h018;
+    run_rom[83] = 11'h013;
+    run_rom[84] = 11'h078;
+    run_rom[85] = 11'h03a;
+    run_rom[86] = 11'h01b;
+    run_rom[87] = 11'h018;
+    run_rom[88] = 11'h01a;
+    run_rom[89] = 11'h038;
+    run_rom[90] = 11'h416;
+    run_rom[91] = 11'h0a0;
+    run_rom[92] = 11'h00d;
+    run_rom[93] = 11'h027;
+    run_rom[94] = 11'h030;
+    run_rom[95] = 11'h012;
+    run_rom[96] = 11'h010;
+    run_rom[97] = 11'h017;
+    run_rom[98] = 11'h013;
+    run_rom[99] = 11'h038;
+    run_rom[100] = 11'h01a;
+    run_rom[101] = 11'h018;
+    run_rom[102] = 11'h01a;
+    run_rom[103] = 11'h018;
+    run_rom[104] = 11'h01a;
+    run_rom[105] = 11'h018;
+    run_rom[106] = 11'h01a;
+    run_rom[107] = 11'h018;
+    run_rom[108] = 11'h01a;
+    run_rom[109] = 11'h038;
+    run_rom[110] = 11'h013;
+    run_rom[111] = 11'h018;
+    run_rom[112] = 11'h416;
+    run_rom[113] = 11'h080;
+    run_rom[114] = 11'h01c;
+    run_rom[115] = 11'h00b;
+    run_rom[116] = 11'h007;
+    run_rom[117] = 11'h00c;
+    run_rom[118] = 11'h010;
+    run_rom[119] = 11'h012;
+    run_rom[120] = 11'h010;
+    run_rom[121] = 11'h012;
+    run_rom[122] = 11'h015;
+    run_rom[123] = 11'h038;
+    run_rom[124] = 11'h01a;
+    run_rom[125] = 11'h018;
+    run_rom[126] = 11'h01a;
+    run_rom[127] = 11'h018;
+    run_rom[128] = 11'h01a;
+    run_rom[129] = 11'h018;
+    run_rom[130] = 11'h01a;
+    run_rom[131] = 11'h018;
+    run_rom[132] = 11'h01a;
+    run_rom[133] = 11'h018;
+    run_rom[134] = 11'h01a;
+    run_rom[135] = 11'h038;
+    run_rom[136] = 11'h016;
+    run_rom[137] = 11'h018;
+    run_rom[138] = 11'h011;
+    run_rom[139] = 11'h41b;
+    run_rom[140] = 11'h080;
+    run_rom[141] = 11'h027;
+    run_rom[142] = 11'h009;
+    run_rom[143] = 11'h00c;
+    run_rom[144] = 11'h012;
+    run_rom[145] = 11'h010;
+    run_rom[146] = 11'h012;
+    run_rom[147] = 11'h010;
+    run_rom[148] = 11'h018;
+    run_rom[149] = 11'h013;
+    run_rom[150] = 11'h03a;
+    run_rom[151] = 11'h01b;
+    run_rom[152] = 11'h03a;
+    run_rom[153] = 11'h018;
+    run_rom[154] = 11'h01a;
+    run_rom[155] = 11'h018;
+    run_rom[156] = 11'h03a;
+    run_rom[157] = 11'h01b;
+    run_rom[158] = 11'h01a;
+    run_rom[159] = 11'h01b;
+    run_rom[160] = 11'h018;
+    run_rom[161] = 11'h01a;
+    run_rom[162] = 11'h013;
+    run_rom[163] = 11'h018;
+    run_rom[164] = 11'h411;
+    run_rom[165] = 11'h060;
+    run_rom[166] = 11'h01c;
+    run_rom[167] = 11'h008;
+    run_rom[168] = 11'h007;
+    run_rom[169] = 11'h009;
+    run_rom[170] = 11'h012;
+    run_rom[171] = 11'h010;
+    run_rom[172] = 11'h012;
+    run_rom[173] = 11'h010;
+    run_rom[174] = 11'h012;
+    run_rom[175] = 11'h015;
+    run_rom[176] = 11'h038;
+    run_rom[177] = 11'h05b;
+    run_rom[178] = 11'h018;
+    run_rom[179] = 11'h01a;
+    run_rom[180] = 11'h018;
+    run_rom[181] = 11'h01a;
+    run_rom[182] = 11'h018;
+    run_rom[183] = 11'h01b;
+    run_rom[184] = 11'h01a;
+    run_rom[185] = 11'h03b;
+    run_rom[186] = 11'h01e;
+    run_rom[187] = 11'h038;
+    run_rom[188] = 11'h013;
+    run_rom[189] = 11'h416;
+    run_rom[190] = 11'h060;
+    run_rom[191] = 11'h00d;
+    run_rom[192] = 11'h027;
+    run_rom[193] = 11'h030;
+    run_rom[194] = 11'h012;
+    run_rom[195] = 11'h010;
+    run_rom[196] = 11'h012;
+    run_rom[197] = 11'h010;
+    run_rom[198] = 11'h012;
+    run_rom[199] = 11'h015;
+    run_rom[200] = 11'h01a;
+    run_rom[201] = 11'h018;
+    run_rom[202] = 11'h01b;
+    run_rom[203] = 11'h03a;
+    run_rom[204] = 11'h018;
+    run_rom[205] = 11'h01a;
+    run_rom[206] = 11'h018;
+    run_rom[207] = 11'h01a;
+    run_rom[208] = 11'h018;
+    run_rom[209] = 11'h01b;
+    run_rom[210] = 11'h01a;
+    run_rom[211] = 11'h01e;
+    run_rom[212] = 11'h01b;
+    run_rom[213] = 11'h01a;
+    run_rom[214] = 11'h038;
+    run_rom[215] = 11'h416;
+    run_rom[216] = 11'h060;
+    run_rom[217] = 11'h00e;
+    run_rom[218] = 11'h007;
+    run_rom[219] = 11'h00b;
+    run_rom[220] = 11'h00c;
+    run_rom[221] = 11'h012;
+    run_rom[222] = 11'h010;
+    run_rom[223] = 11'h012;
+    run_rom[224] = 11'h010;
+    run_rom[225] = 11'h012;
+    run_rom[226] = 11'h010;
+    run_rom[227] = 11'h015;
+    run_rom[228] = 11'h013;
+    run_rom[229] = 11'h05a;
+    run_rom[230] = 11'h018;
+    run_rom[231] = 11'h01a;
+    run_rom[232] = 11'h018;
+    run_rom[233] = 11'h01a;
+    run_rom[234] = 11'h018;
+    run_rom[235] = 11'h01a;
+    run_rom[236] = 11'h018;
+    run_rom[237] = 11'h01a;
+    run_rom[238] = 11'h01b;
+    run_rom[239] = 11'h01e;
+    run_rom[240] = 11'h018;
+    run_rom[241] = 11'h01a;
+    run_rom[242] = 11'h438;
+    run_rom[243] = 11'h060;
+    run_rom[244] = 11'h00d;
+    run_rom[245] = 11'h027;
+    run_rom[246] = 11'h030;
+    run_rom[247] = 11'h012;
+    run_rom[248] = 11'h010;
+    run_rom[249] = 11'h012;
+    run_rom[250] = 11'h010;
+    run_rom[251] = 11'h012;
+    run_rom[252] = 11'h010;
+    run_rom[253] = 11'h038;
+    run_rom[254] = 11'h01a;
+    run_rom[255] = 11'h018;
+    run_rom[256] = 11'h01a;
+    run_rom[257] = 11'h018;
+    run_rom[258] = 11'h01a;
+    run_rom[259] = 11'h018;
+    run_rom[260] = 11'h01a;
+    run_rom[261] = 11'h018;
+    run_rom[262] = 11'h01a;
+    run_rom[263] = 11'h018;
+    run_rom[264] = 11'h01a;
+    run_rom[265] = 11'h018;
+    run_rom[266] = 11'h01a;
+    run_rom[267] = 11'h038;
+    run_rom[268] = 11'h413;
+    run_rom[269] = 11'h060;
+    run_rom[270] = 11'h00b;
+    run_rom[271] = 11'h007;
+    run_rom[272] = 11'h02c;
+    run_rom[273] = 11'h030;
+    run_rom[274] = 11'h012;
+    run_rom[275] = 11'h010;
+    run_rom[276] = 11'h012;
+    run_rom[277] = 11'h010;
+    run_rom[278] = 11'h012;
+    run_rom[279] = 11'h013;
+    run_rom[280] = 11'h01a;
+    run_rom[281] = 11'h018;
+    run_rom[282] = 11'h01a;
+    run_rom[283] = 11'h018;
+    run_rom[284] = 11'h01a;
+    run_rom[285] = 11'h018;
+    run_rom[286] = 11'h01a;
+    run_rom[287] = 11'h018;
+    run_rom[288] = 11'h01a;
+    run_rom[289] = 11'h018;
+    run_rom[290] = 11'h01a;
+    run_rom[291] = 11'h018;
+    run_rom[292] = 11'h01a;
+    run_rom[293] = 11'h038;
+    run_rom[294] = 11'h435;
+    run_rom[295] = 11'h020;
+    run_rom[296] = 11'h018;
+    run_rom[297] = 11'h00e;
+    run_rom[298] = 11'h007;
+    run_rom[299] = 11'h00b;
+    run_rom[300] = 11'h00c;
+    run_rom[301] = 11'h010;
+    run_rom[302] = 11'h00c;
+    run_rom[303] = 11'h012;
+    run_rom[304] = 11'h010;
+    run_rom[305] = 11'h012;
+    run_rom[306] = 11'h010;
+    run_rom[307] = 11'h012;
+    run_rom[308] = 11'h010;
+    run_rom[309] = 11'h038;
+    run_rom[310] = 11'h01a;
+    run_rom[311] = 11'h018;
+    run_rom[312] = 11'h01a;
+    run_rom[313] = 11'h018;
+    run_rom[314] = 11'h01a;
+    run_rom[315] = 11'h018;
+    run_rom[316] = 11'h01a;
+    run_rom[317] = 11'h018;
+    run_rom[318] = 11'h01a;
+    run_rom[319] = 11'h018;
+    run_rom[320] = 11'h01a;
+    run_rom[321] = 11'h038;
+    run_rom[322] = 11'h035;
+    run_rom[323] = 11'h410;
+    run_rom[324] = 11'h01e;
+    run_rom[325] = 11'h013;
+    run_rom[326] = 11'h015;
+    run_rom[327] = 11'h010;
+    run_rom[328] = 11'h00e;
+    run_rom[329] = 11'h00b;
+    run_rom[330] = 11'h010;
+    run_rom[331] = 11'h00c;
+    run_rom[332] = 11'h030;
+    run_rom[333] = 11'h012;
+    run_rom[334] = 11'h010;
+    run_rom[335] = 11'h012;
+    run_rom[336] = 11'h010;
+    run_rom[337] = 11'h012;
+    run_rom[338] = 11'h018;
+    run_rom[339] = 11'h01a;
+    run_rom[340] = 11'h018;
+    run_rom[341] = 11'h01a;
+    run_rom[342] = 11'h018;
+    run_rom[343] = 11'h01a;
+    run_rom[344] = 11'h018;
+    run_rom[345] = 11'h01a;
+    run_rom[346] = 11'h018;
+    run_rom[347] = 11'h01a;
+    run_rom[348] = 11'h018;
+    run_rom[349] = 11'h01a;
+    run_rom[350] = 11'h018;
+    run_rom[351] = 11'h01a;
+    run_rom[352] = 11'h035;
+    run_rom[353] = 11'h010;
+    run_rom[354] = 11'h415;
+    run_rom[355] = 11'h018;
+    run_rom[356] = 11'h015;
+    run_rom[357] = 11'h010;
+    run_rom[358] = 11'h015;
+    run_rom[359] = 11'h02e;
+    run_rom[360] = 11'h00c;
+    run_rom[361] = 11'h010;
+    run_rom[362] = 11'h00c;
+    run_rom[363] = 11'h012;
+    run_rom[364] = 11'h010;
+    run_rom[365] = 11'h012;
+    run_rom[366] = 11'h010;
+    run_rom[367] = 11'h012;
+    run_rom[368] = 11'h010;
+    run_rom[369] = 11'h01a;
+    run_rom[370] = 11'h018;
+    run_rom[371] = 11'h01a;
+    run_rom[372] = 11'h018;
+    run_rom[373] = 11'h01a;
+    run_rom[374] = 11'h018;
+    run_rom[375] = 11'h01a;
+    run_rom[376] = 11'h018;
+    run_rom[377] = 11'h01a;
+    run_rom[378] = 11'h018;
+    run_rom[379] = 11'h01a;
+    run_rom[380] = 11'h018;
+    run_rom[381] = 11'h01a;
+    run_rom[382] = 11'h018;
+    run_rom[383] = 11'h015;
+    run_rom[384] = 11'h010;
+    run_rom[385] = 11'h015;
+    run_rom[386] = 11'h40e;
+    run_rom[387] = 11'h018;
+    run_rom[388] = 11'h010;
+    run_rom[389] = 11'h015;
+    run_rom[390] = 11'h030;
+    run_rom[391] = 11'h00c;
+    run_rom[392] = 11'h010;
+    run_rom[393] = 11'h00c;
+    run_rom[394] = 11'h012;
+    run_rom[395] = 11'h010;
+    run_rom[396] = 11'h012;
+    run_rom[397] = 11'h010;
+    run_rom[398] = 11'h012;
+    run_rom[399] = 11'h010;
+    run_rom[400] = 11'h012;
+    run_rom[401] = 11'h010;
+    run_rom[402] = 11'h015;
+    run_rom[403] = 11'h018;
+    run_rom[404] = 11'h01a;
+    run_rom[405] = 11'h018;
+    run_rom[406] = 11'h01a;
+    run_rom[407] = 11'h018;
+    run_rom[408] = 11'h01a;
+    run_rom[409] = 11'h018;
+    run_rom[410] = 11'h01a;
+    run_rom[411] = 11'h018;
+    run_rom[412] = 11'h01a;
+    run_rom[413] = 11'h018;
+    run_rom[414] = 11'h01a;
+    run_rom[415] = 11'h035;
+    run_rom[416] = 11'h430;
+    run_rom[417] = 11'h01a;
+    run_rom[418] = 11'h015;
+    run_rom[419] = 11'h030;
+    run_rom[420] = 11'h02c;
+    run_rom[421] = 11'h009;
+    run_rom[422] = 11'h00f;
+    run_rom[423] = 11'h010;
+    run_rom[424] = 11'h012;
+    run_rom[425] = 11'h010;
+    run_rom[426] = 11'h012;
+    run_rom[427] = 11'h00c;
+    run_rom[428] = 11'h009;
+    run_rom[429] = 11'h005;
+    run_rom[430] = 11'h006;
+    run_rom[431] = 11'h005;
+    run_rom[432] = 11'h009;
+    run_rom[433] = 11'h010;
+    run_rom[434] = 11'h018;
+    run_rom[435] = 11'h013;
+    run_rom[436] = 11'h01a;
+    run_rom[437] = 11'h018;
+    run_rom[438] = 11'h01a;
+    run_rom[439] = 11'h018;
+    run_rom[440] = 11'h01a;
+    run_rom[441] = 11'h018;
+    run_rom[442] = 11'h01a;
+    run_rom[443] = 11'h038;
+    run_rom[444] = 11'h030;
+    run_rom[445] = 11'h40e;
+    run_rom[446] = 11'h01e;
+    run_rom[447] = 11'h018;
+    run_rom[448] = 11'h015;
+    run_rom[449] = 11'h010;
+    run_rom[450] = 11'h015;
+    run_rom[451] = 11'h009;
+    run_rom[452] = 11'h00a;
+    run_rom[453] = 11'h00c;
+    run_rom[454] = 11'h012;
+    run_rom[455] = 11'h010;
+    run_rom[456] = 11'h012;
+    run_rom[457] = 11'h030;
+    run_rom[458] = 11'h005;
+    run_rom[459] = 11'h004;
+    run_rom[460] = 11'h002;
+    run_rom[461] = 11'h004;
+    run_rom[462] = 11'h002;
+    run_rom[463] = 11'h025;
+    run_rom[464] = 11'h030;
+    run_rom[465] = 11'h015;
+    run_rom[466] = 11'h010;
+    run_rom[467] = 11'h012;
+    run_rom[468] = 11'h010;
+    run_rom[469] = 11'h015;
+    run_rom[470] = 11'h010;
+    run_rom[471] = 11'h018;
+    run_rom[472] = 11'h010;
+    run_rom[473] = 11'h015;
+    run_rom[474] = 11'h00c;
+    run_rom[475] = 11'h41b;
+    run_rom[476] = 11'h000;
+    run_rom[477] = 11'h01e;
+    run_rom[478] = 11'h010;
+    run_rom[479] = 11'h015;
+    run_rom[480] = 11'h010;
+    run_rom[481] = 11'h00a;
+    run_rom[482] = 11'h009;
+    run_rom[483] = 11'h00f;
+    run_rom[484] = 11'h010;
+    run_rom[485] = 11'h017;
+    run_rom[486] = 11'h012;
+    run_rom[487] = 11'h017;
+    run_rom[488] = 11'h030;
+    run_rom[489] = 11'h005;
+    run_rom[490] = 11'h004;
+    run_rom[491] = 11'h002;
+    run_rom[492] = 11'h003;
+    run_rom[493] = 11'h002;
+    run_rom[494] = 11'h006;
+    run_rom[495] = 11'h009;
+    run_rom[496] = 11'h012;
+    run_rom[497] = 11'h00c;
+    run_rom[498] = 11'h009;
+    run_rom[499] = 11'h044;
+    run_rom[500] = 11'h029;
+    run_rom[501] = 11'h010;
+    run_rom[502] = 11'h00c;
+    run_rom[503] = 11'h010;
+    run_rom[504] = 11'h41b;
+    run_rom[505] = 11'h020;
+    run_rom[506] = 11'h018;
+    run_rom[507] = 11'h013;
+    run_rom[508] = 11'h012;
+    run_rom[509] = 11'h04a;
+    run_rom[510] = 11'h032;
+    run_rom[511] = 11'h038;
+    run_rom[512] = 11'h01a;
+    run_rom[513] = 11'h013;
+    run_rom[514] = 11'h015;
+    run_rom[515] = 11'h029;
+    run_rom[516] = 11'h004;
+    run_rom[517] = 11'h006;
+    run_rom[518] = 11'h009;
+    run_rom[519] = 11'h012;
+    run_rom[520] = 11'h010;
+    run_rom[521] = 11'h00c;
+    run_rom[522] = 11'h002;
+    run_rom[523] = 11'h001;
+    run_rom[524] = 11'h002;
+    run_rom[525] = 11'h021;
+    run_rom[526] = 11'h005;
+    run_rom[527] = 11'h009;
+    run_rom[528] = 11'h42c;
+    run_rom[529] = 11'h020;
+    run_rom[530] = 11'h013;
+    run_rom[531] = 11'h018;
+    run_rom[532] = 11'h010;
+    run_rom[533] = 11'h00a;
+    run_rom[534] = 11'h009;
+    run_rom[535] = 11'h02f;
+    run_rom[536] = 11'h017;
+    run_rom[537] = 11'h018;
+    run_rom[538] = 11'h01a;
+    run_rom[539] = 11'h018;
+    run_rom[540] = 11'h01a;
+    run_rom[541] = 11'h017;
+    run_rom[542] = 11'h012;
+    run_rom[543] = 11'h00c;
+    run_rom[544] = 11'h030;
+    run_rom[545] = 11'h037;
+    run_rom[546] = 11'h01a;
+    run_rom[547] = 11'h010;
+    run_rom[548] = 11'h005;
+    run_rom[549] = 11'h001;
+    run_rom[550] = 11'h003;
+    run_rom[551] = 11'h001;
+    run_rom[552] = 11'h004;
+    run_rom[553] = 11'h005;
+    run_rom[554] = 11'h010;
+    run_rom[555] = 11'h00c;
+    run_rom[556] = 11'h415;
+    run_rom[557] = 11'h020;
+    run_rom[558] = 11'h01a;
+    run_rom[559] = 11'h013;
+    run_rom[560] = 11'h017;
+    run_rom[561] = 11'h009;
+    run_rom[562] = 11'h02a;
+    run_rom[563] = 11'h032;
+    run_rom[564] = 11'h038;
+    run_rom[565] = 11'h01a;
+    run_rom[566] = 11'h018;
+    run_rom[567] = 11'h01a;
+    run_rom[568] = 11'h018;
+    run_rom[569] = 11'h01a;
+    run_rom[570] = 11'h038;
+    run_rom[571] = 11'h017;
+    run_rom[572] = 11'h038;
+    run_rom[573] = 11'h01a;
+    run_rom[574] = 11'h018;
+    run_rom[575] = 11'h030;
+    run_rom[576] = 11'h035;
+    run_rom[577] = 11'h018;
+    run_rom[578] = 11'h013;
+    run_rom[579] = 11'h015;
+    run_rom[580] = 11'h41a;
+    run_rom[581] = 11'h040;
+    run_rom[582] = 11'h01e;
+    run_rom[583] = 11'h018;
+    run_rom[584] = 11'h00a;
+    run_rom[585] = 11'h009;
+    run_rom[586] = 11'h02a;
+    run_rom[587] = 11'h017;
+    run_rom[588] = 11'h012;
+    run_rom[589] = 11'h01a;
+    run_rom[590] = 11'h018;
+    run_rom[591] = 11'h01a;
+    run_rom[592] = 11'h018;
+    run_rom[593] = 11'h01a;
+    run_rom[594] = 11'h018;
+    run_rom[595] = 11'h01a;
+    run_rom[596] = 11'h013;
+    run_rom[597] = 11'h018;
+    run_rom[598] = 11'h013;
+    run_rom[599] = 11'h01a;
+    run_rom[600] = 11'h018;
+    run_rom[601] = 11'h01a;
+    run_rom[602] = 11'h018;
+    run_rom[603] = 11'h01a;
+    run_rom[604] = 11'h018;
+    run_rom[605] = 11'h01a;
+    run_rom[606] = 11'h038;
+    run_rom[607] = 11'h010;
+    run_rom[608] = 11'h41e;
+    run_rom[609] = 11'h080;
+    run_rom[610] = 11'h009;
+    run_rom[611] = 11'h00a;
+    run_rom[612] = 11'h009;
+    run_rom[613] = 11'h02a;
+    run_rom[614] = 11'h017;
+    run_rom[615] = 11'h018;
+    run_rom[616] = 11'h01a;
+    run_rom[617] = 11'h018;
+    run_rom[618] = 11'h01a;
+    run_rom[619] = 11'h038;
+    run_rom[620] = 11'h012;
+    run_rom[621] = 11'h018;
+    run_rom[622] = 11'h017;
+    run_rom[623] = 11'h038;
+    run_rom[624] = 11'h01a;
+    run_rom[625] = 11'h018;
+    run_rom[626] = 11'h01a;
+    run_rom[627] = 11'h018;
+    run_rom[628] = 11'h01a;
+    run_rom[629] = 11'h018;
+    run_rom[630] = 11'h01a;
+    run_rom[631] = 11'h013;
+    run_rom[632] = 11'h418;
+    run_rom[633] = 11'h080;
+    run_rom[634] = 11'h010;
+    run_rom[635] = 11'h009;
+    run_rom[636] = 11'h00a;
+    run_rom[637] = 11'h009;
+    run_rom[638] = 11'h02f;
+    run_rom[639] = 11'h017;
+    run_rom[640] = 11'h012;
+    run_rom[641] = 11'h017;
+    run_rom[642] = 11'h012;
+    run_rom[643] = 11'h017;
+    run_rom[644] = 11'h00f;
+    run_rom[645] = 11'h032;
+    run_rom[646] = 11'h017;
+    run_rom[647] = 11'h018;
+    run_rom[648] = 11'h01a;
+    run_rom[649] = 11'h058;
+    run_rom[650] = 11'h05a;
+    run_rom[651] = 11'h038;
+    run_rom[652] = 11'h41b;
+    run_rom[653] = 11'h080;
+    run_rom[654] = 11'h009;
+    run_rom[655] = 11'h00a;
+    run_rom[656] = 11'h009;
+    run_rom[657] = 11'h00a;
+    run_rom[658] = 11'h009;
+    run_rom[659] = 11'h02f;
+    run_rom[660] = 11'h012;
+    run_rom[661] = 11'h00f;
+    run_rom[662] = 11'h012;
+    run_rom[663] = 11'h00a;
+    run_rom[664] = 11'h032;
+    run_rom[665] = 11'h037;
+    run_rom[666] = 11'h05a;
+    run_rom[667] = 11'h030;
+    run_rom[668] = 11'h013;
+    run_rom[669] = 11'h01a;
+    run_rom[670] = 11'h458;
+    run_rom[671] = 11'h080;
+    run_rom[672] = 11'h029;
+    run_rom[673] = 11'h00a;
+    run_rom[674] = 11'h009;
+    run_rom[675] = 11'h02a;
+    run_rom[676] = 11'h00f;
+    run_rom[677] = 11'h00a;
+    run_rom[678] = 11'h00f;
+    run_rom[679] = 11'h009;
+    run_rom[680] = 11'h032;
+    run_rom[681] = 11'h017;
+    run_rom[682] = 11'h010;
+    run_rom[683] = 11'h012;
+    run_rom[684] = 11'h017;
+    run_rom[685] = 11'h01a;
+    run_rom[686] = 11'h013;
+    run_rom[687] = 11'h010;
+    run_rom[688] = 11'h006;
+    run_rom[689] = 11'h00c;
+    run_rom[690] = 11'h010;
+    run_rom[691] = 11'h012;
+    run_rom[692] = 11'h010;
+    run_rom[693] = 11'h41e;
+    run_rom[694] = 11'h080;
+    run_rom[695] = 11'h005;
+    run_rom[696] = 11'h00a;
+    run_rom[697] = 11'h009;
+    run_rom[698] = 11'h00a;
+    run_rom[699] = 11'h009;
+    run_rom[700] = 11'h00f;
+    run_rom[701] = 11'h00c;
+    run_rom[702] = 11'h00f;
+    run_rom[703] = 11'h009;
+    run_rom[704] = 11'h012;
+    run_rom[705] = 11'h010;
+    run_rom[706] = 11'h018;
+    run_rom[707] = 11'h037;
+    run_rom[708] = 11'h010;
+    run_rom[709] = 11'h012;
+    run_rom[710] = 11'h010;
+    run_rom[711] = 11'h012;
+    run_rom[712] = 11'h00c;
+    run_rom[713] = 11'h006;
+    run_rom[714] = 11'h005;
+    run_rom[715] = 11'h02a;
+    run_rom[716] = 11'h412;
+    run_rom[717] = 11'h080;
+    run_rom[718] = 11'h006;
+    run_rom[719] = 11'h009;
+    run_rom[720] = 11'h00a;
+    run_rom[721] = 11'h009;
+    run_rom[722] = 11'h02c;
+    run_rom[723] = 11'h012;
+    run_rom[724] = 11'h00f;
+    run_rom[725] = 11'h012;
+    run_rom[726] = 11'h010;
+    run_rom[727] = 11'h032;
+    run_rom[728] = 11'h017;
+    run_rom[729] = 11'h032;
+    run_rom[730] = 11'h009;
+    run_rom[731] = 11'h02c;
+    run_rom[732] = 11'h012;
+    run_rom[733] = 11'h049;
+    run_rom[734] = 11'h012;
+    run_rom[735] = 11'h415;
+    run_rom[736] = 11'h080;
+    run_rom[737] = 11'h005;
+    run_rom[738] = 11'h00a;
+    run_rom[739] = 11'h009;
+    run_rom[740] = 11'h00c;
+    run_rom[741] = 11'h009;
+    run_rom[742] = 11'h00f;
+    run_rom[743] = 11'h010;
+    run_rom[744] = 11'h012;
+    run_rom[745] = 11'h010;
+    run_rom[746] = 11'h012;
+    run_rom[747] = 11'h010;
+    run_rom[748] = 11'h012;
+    run_rom[749] = 11'h010;
+    run_rom[750] = 11'h012;
+    run_rom[751] = 11'h010;
+    run_rom[752] = 11'h012;
+    run_rom[753] = 11'h00c;
+    run_rom[754] = 11'h010;
+    run_rom[755] = 11'h00c;
+    run_rom[756] = 11'h029;
+    run_rom[757] = 11'h430;
+    run_rom[758] = 11'h080;
+    run_rom[759] = 11'h00c;
+    run_rom[760] = 11'h009;
+    run_rom[761] = 11'h00a;
+    run_rom[762] = 11'h009;
+    run_rom[763] = 11'h02c;
+    run_rom[764] = 11'h030;
+    run_rom[765] = 11'h012;
+    run_rom[766] = 11'h010;
+    run_rom[767] = 11'h032;
+    run_rom[768] = 11'h017;
+    run_rom[769] = 11'h010;
+    run_rom[770] = 11'h012;
+    run_rom[771] = 11'h010;
+    run_rom[772] = 11'h012;
+    run_rom[773] = 11'h010;
+    run_rom[774] = 11'h012;
+    run_rom[775] = 11'h00c;
+    run_rom[776] = 11'h030;
+    run_rom[777] = 11'h41a;
+    run_rom[778] = 11'h0a0;
+    run_rom[779] = 11'h010;
+    run_rom[780] = 11'h009;
+    run_rom[781] = 11'h00c;
+    run_rom[782] = 11'h009;
+    run_rom[783] = 11'h02c;
+    run_rom[784] = 11'h012;
+    run_rom[785] = 11'h010;
+    run_rom[786] = 11'h032;
+    run_rom[787] = 11'h017;
+    run_rom[788] = 11'h012;
+    run_rom[789] = 11'h017;
+    run_rom[790] = 11'h010;
+    run_rom[791] = 11'h012;
+    run_rom[792] = 11'h010;
+    run_rom[793] = 11'h012;
+    run_rom[794] = 11'h010;
+    run_rom[795] = 11'h012;
+    run_rom[796] = 11'h010;
+    run_rom[797] = 11'h012;
+    run_rom[798] = 11'h41e;
+    run_rom[799] = 11'h0c0;
+    run_rom[800] = 11'h015;
+    run_rom[801] = 11'h009;
+    run_rom[802] = 11'h00c;
+    run_rom[803] = 11'h009;
+    run_rom[804] = 11'h02c;
+    run_rom[805] = 11'h032;
+    run_rom[806] = 11'h017;
+    run_rom[807] = 11'h012;
+    run_rom[808] = 11'h017;
+    run_rom[809] = 11'h032;
+    run_rom[810] = 11'h010;
+    run_rom[811] = 11'h012;
+    run_rom[812] = 11'h010;
+    run_rom[813] = 11'h012;
+    run_rom[814] = 11'h010;
+    run_rom[815] = 11'h012;
+    run_rom[816] = 11'h41a;
+    run_rom[817] = 11'h0e0;
+    run_rom[818] = 11'h01a;
+    run_rom[819] = 11'h009;
+    run_rom[820] = 11'h00c;
+    run_rom[821] = 11'h009;
+    run_rom[822] = 11'h00c;
+    run_rom[823] = 11'h010;
+    run_rom[824] = 11'h032;
+    run_rom[825] = 11'h017;
+    run_rom[826] = 11'h012;
+    run_rom[827] = 11'h017;
+    run_rom[828] = 11'h012;
+    run_rom[829] = 11'h017;
+    run_rom[830] = 11'h012;
+    run_rom[831] = 11'h017;
+    run_rom[832] = 11'h032;
+    run_rom[833] = 11'h410;
+    run_rom[834] = 11'h120;
+    run_rom[835] = 11'h018;
+    run_rom[836] = 11'h00c;
+    run_rom[837] = 11'h009;
+    run_rom[838] = 11'h030;
+    run_rom[839] = 11'h032;
+    run_rom[840] = 11'h017;
+    run_rom[841] = 11'h012;
+    run_rom[842] = 11'h017;
+    run_rom[843] = 11'h012;
+    run_rom[844] = 11'h017;
+    run_rom[845] = 11'h012;
+    run_rom[846] = 11'h017;
+    run_rom[847] = 11'h410;
+    run_rom[848] = 11'h160;
+    run_rom[849] = 11'h010;
+    run_rom[850] = 11'h009;
+    run_rom[851] = 11'h030;
+    run_rom[852] = 11'h032;
+    run_rom[853] = 11'h017;
+    run_rom[854] = 11'h012;
+    run_rom[855] = 11'h017;
+    run_rom[856] = 11'h012;
+    run_rom[857] = 11'h017;
+    run_rom[858] = 11'h418;
+    run_rom[859] = 11'h180;
+    run_rom[860] = 11'h018;
+    run_rom[861] = 11'h00c;
+    run_rom[862] = 11'h030;
+    run_rom[863] = 11'h012;
+    run_rom[864] = 11'h010;
+    run_rom[865] = 11'h017;
+    run_rom[866] = 11'h012;
+    run_rom[867] = 11'h017;
+    run_rom[868] = 11'h41a;
+  end
+  assign \$memory_r_data  = run_rom[\$memory_r_addr ];
+  assign \$7  = \$8  ? 12'h000 : \$5 ;
+  always @(posedge pix_clk)
+    row_active <= \row_active$next ;
+  always @(posedge pix_clk)
+    row <= \row$next ;
+  always @(posedge pix_clk)
+    active <= \active$next ;
+  always @(posedge pix_clk)
+    \$memory_r_addr  <= \$memory_r_addr$next ;
+  always @(posedge pix_clk)
+    run_count <= \run_count$next ;
+  assign \$11  = \$7  == i_location[19:10];
+  assign \$13  = i_clock[21:11] == 10'h20c;
+  assign \$15  = row == 6'h27;
+  assign \$17  = \$13  | \$15 ;
+  assign \$19  = i_clock[10:0] == 10'h31f;
+  assign \$21  = i_clock[21:11] + 1'h1;
+  assign \$24  = i_clock[21:11] == 10'h20c;
+  assign \$23  = \$24  ? 12'h000 : \$21 ;
+  assign \$27  = \$23  == i_location[19:10];
+  assign \$29  = i_clock[21:11] == 10'h20c;
+  assign \$31  = row == 6'h27;
+  assign \$33  = \$29  | \$31 ;
+  assign \$36  = row + 1'h1;
+  assign \$38  = i_clock[10:0] == 10'h31f;
+  assign \$3  = i_clock[10:0] == 10'h31f;
+  assign \$40  = i_enable | \$38 ;
+  assign \$42  = i_clock[10:0] + 1'h1;
+  assign \$45  = i_clock[10:0] == 10'h31f;
+  assign \$44  = \$45  ? 12'h000 : \$42 ;
+  assign \$48  = \$44  == i_location[9:0];
+  assign \$50  = next_row_active & \$48 ;
+  assign \$52  = i_clock[10:0] == 10'h31f;
+  assign \$54  = run_count == \$memory_r_data [9:5];
+  assign \$56  = i_clock[10:0] == 10'h31f;
+  assign \$58  = i_enable | \$56 ;
+  assign \$5  = i_clock[21:11] + 1'h1;
+  assign \$60  = i_clock[10:0] + 1'h1;
+  assign \$63  = i_clock[10:0] == 10'h31f;
+  assign \$62  = \$63  ? 12'h000 : \$60 ;
+  assign \$66  = \$62  == i_location[9:0];
+  assign \$68  = next_row_active & \$66 ;
+  assign \$70  = i_clock[10:0] == 10'h31f;
+  assign \$72  = run_count == \$memory_r_data [9:5];
+  assign \$75  = \$memory_r_addr  + 1'h1;
+  assign \$77  = i_clock[10:0] == 10'h31f;
+  assign \$79  = i_enable | \$77 ;
+  assign \$81  = i_clock[10:0] + 1'h1;
+  assign \$84  = i_clock[10:0] == 10'h31f;
+  assign \$83  = \$84  ? 12'h000 : \$81 ;
+  assign \$87  = \$83  == i_location[9:0];
+  assign \$8  = i_clock[21:11] == 10'h20c;
+  assign \$89  = next_row_active & \$87 ;
+  assign \$91  = i_clock[10:0] == 10'h31f;
+  assign \$93  = run_count == \$memory_r_data [9:5];
+  assign \$96  = run_count + 1'h1;
+  assign \$98  = active ? \$memory_r_data [4:0] : 5'h00;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    next_row_active = row_active;
+    if (\$3 ) begin
+      if (\$11 ) begin
+        next_row_active = 1'h1;
+      end else if (\$17 ) begin
+        next_row_active = 1'h0;
+      end
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    next_row = row;
+    if (\$19 ) begin
+      (* full_case = 32'd1 *)
+      if (\$27 ) begin
+        next_row = 6'h00;
+      end else if (\$33 ) begin
+      end else begin
+        next_row = \$36 [5:0];
+      end
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    \row_active$next  = next_row_active;
+    if (pix_rst) begin
+      \row_active$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    \row$next  = next_row;
+    if (pix_rst) begin
+      \row$next  = 6'h00;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    \active$next  = active;
+    if (\$40 ) begin
+      if (\$50 ) begin
+        \active$next  = 1'h1;
+      end else if (\$52 ) begin
+        \active$next  = 1'h0;
+      end else if (active) begin
+        if (\$54 ) begin
+          if (\$memory_r_data [10]) begin
+            \active$next  = 1'h0;
+          end
+        end
+      end
+    end
+    if (pix_rst) begin
+      \active$next  = 1'h0;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    \$memory_r_addr$next  = \$memory_r_addr ;
+    if (\$58 ) begin
+      if (\$68 ) begin
+        \$memory_r_addr$next  = \$memory_r_data$2 ;
+      end else if (\$70 ) begin
+      end else if (active) begin
+        if (\$72 ) begin
+          \$memory_r_addr$next  = \$75 [9:0];
+        end
+      end
+    end
+    if (pix_rst) begin
+      \$memory_r_addr$next  = 10'h000;
+    end
+  end
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$12 ) begin end
+    \run_count$next  = run_count;
+    if (\$79 ) begin
+      if (\$89 ) begin
+        \run_count$next  = 5'h00;
+      end else if (\$91 ) begin
+      end else if (active) begin
+        (* full_case = 32'd1 *)
+        if (\$93 ) begin
+          \run_count$next  = 5'h00;
+        end else begin
+          \run_count$next  = \$96 [4:0];
+        end
+      end
+    end
+    if (pix_rst) begin
+      \run_count$next  = 5'h00;
+    end
+  end
+  assign \$35  = \$36 ;
+  assign \$74  = \$75 ;
+  assign \$95  = \$96 ;
+  assign o_index = \$98 ;
+  assign \$memory_r_addr$1  = next_row;
+endmodule
+
+module \sphn_vga_top.vga.timer_x (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$13  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 8'hdc;
+  assign \$5  = i_next == 9'h1a4;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$13 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.timer_y (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$14  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 7'h64;
+  assign \$5  = i_next == 8'hc8;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$14 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.visible_x (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$15  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h1;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = ! i_next;
+  assign \$5  = i_next == 10'h280;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$15 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h1;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.visible_y (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$16  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h1;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = ! i_next;
+  assign \$5  = i_next == 9'h1e0;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$16 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h1;
+    end
+  end
+endmodule
+
+module \sphn_vga_top.vga.vsync (pix_clk, i_next, o_inside, pix_rst);
+  reg \$auto$verilog_backend.cc:2352:dump_module$17  = 0;
+  wire \$1 ;
+  wire \$3 ;
+  wire \$5 ;
+  input [10:0] i_next;
+  wire [10:0] i_next;
+  output o_inside;
+  reg o_inside = 1'h0;
+  reg \o_inside$next ;
+  input pix_clk;
+  wire pix_clk;
+  input pix_rst;
+  wire pix_rst;
+  assign \$1  = ! i_next;
+  assign \$3  = i_next == 9'h1ea;
+  assign \$5  = i_next == 9'h1ec;
+  always @(posedge pix_clk)
+    o_inside <= \o_inside$next ;
+  always @* begin
+    if (\$auto$verilog_backend.cc:2352:dump_module$17 ) begin end
+    \o_inside$next  = o_inside;
+    if (\$1 ) begin
+      \o_inside$next  = 1'h0;
+    end else if (\$3 ) begin
+      \o_inside$next  = 1'h1;
+    end else if (\$5 ) begin
+      \o_inside$next  = 1'h0;
+    end
+    if (pix_rst) begin
+      \o_inside$next  = 1'h0;
+    end
   end
-  assign \$1  = \$2 ;
-  assign \$6  = \$7 ;
 endmodule
@@ -0,0 +1,84 @@
+"""
+runs the designs through yosys and reports how many cells they use
+
+    python synth.py                 # cell counts of main.Top with each sprite engine
+    python synth.py --noabc         # skip abc, for yosys builds that can't run it
+
+yosys is taken from $YOSYS, or from the path if that isn't set
+"""
+import argparse
+import os
+import re
+import subprocess
+import tempfile
+
+from amaranth.back.verilog import convert
+
+import main
+
+
+def main_top_verilog(**kwargs):
+    mod = main.Top(**kwargs)
+    return convert(mod, name="sphn_vga_top", ports=[mod.o_r, mod.o_g, mod.o_b, mod.o_hsync, mod.o_vsync, mod.i_move_up, mod.i_move_down, mod.i_player_two_up, mod.i_player_two_down, mod.i_player_two_active],
+        emit_src=False, strip_internal_attrs=True)
+
+
+def run_in_build_dir(command, files, outputs=()):
+    """
+    run a tool in a temporary directory that holds files (a dict of name to contents), returns its
+    stdout and the contents of the output files it was asked to write
+    """
+    with tempfile.TemporaryDirectory() as build_dir:
+        for name, contents in files.items():
+            with open(os.path.join(build_dir, name), "w") as file:
+                file.write(contents)
+        # run from inside the build dir with relative paths, some yosys builds can't see the rest of the filesystem
+        result = subprocess.run(command, cwd=build_dir, capture_output=True, text=True, check=True)
+        contents = []
+        for name in outputs:
+            with open(os.path.join(build_dir, name)) as file:
+                contents.append(file.read())
+    return result.stdout, contents
+
+
+def parse_stat(output):
+    """the cell counts from the last stat in some yosys output, a dict of cell type to count with the total under "cells" """
+    stats = output[output.rindex("Printing statistics"):]
+    counts = {"cells": int(re.search(r"Number of cells:\s+(\d+)", stats).group(1))}
+    for cell, count in re.findall(r"^\s+(\$?[A-Za-z_][\w$]*)\s+(\d+)$", stats, re.MULTILINE):
+        counts[cell] = int(count)
+    return counts
+
+
+def cell_counts(verilog, top, noabc=False):
+    """
+    synthesise some verilog with the generic yosys flow and return a dict of cell type to count,
+    the total is under "cells"
+    """
+    yosys = os.environ.get("YOSYS", "yosys")
+    synth = f"synth -flatten -top {top}" + (" -noabc" if noabc else "")
+    output, _ = run_in_build_dir([yosys, "-p", f"read_verilog design.v; {synth}; stat"], {"design.v": verilog})
+    return parse_stat(output)
+
+
+def print_comparison(results):
+    names = list(results)
+    cells = sorted({cell for counts in results.values() for cell in counts if cell != "cells"})
+    print(f"{'':<16}" + "".join(f"{name:>10}" for name in names))
+    for cell in cells + ["cells"]:
+        print(f"{cell:<16}" + "".join(f"{results[name].get(cell, 0):>10}" for name in names))
+    if len(names) > 1:
+        before = results[names[0]]["cells"]
+        after = results[names[-1]]["cells"]
+        print(f"{names[0]} -> {names[-1]}: {after - before:+} cells ({(after - before) / before:+.1%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--noabc", action="store_true", help="count generic gates without running abc")
+    args = parser.parse_args()
+
+    results = {}
+    for sprite in ("switch", "rle"):
+        results[sprite] = cell_counts(main_top_verilog(sprite=sprite), "sphn_vga_top", noabc=args.noabc)
+    print_comparison(results)
@@ -0,0 +1,236 @@
+"""
+the link between the glasgow build and the host: a record of the game state after every update
+goes to the host, and the host can send the inputs for every update back
+
+    python telemetry.py game.log                # count the records and the frames that were dropped
+    python telemetry.py game.log --check        # replay every update through the model
+
+every record is RECORD.size bytes, little endian, in the order of RECORD_FIELDS. the frame counts
+updates and wraps at 16 bits, a gap in it is a record that was dropped because the host didn't
+keep up. the inputs are the ones the update used, and the lfsr is its value on the clock vsync
+began on, like model.Game.lfsr, so a log can be replayed through the model. stale is set when
+the inputs came from the host and the host hadn't sent new ones in time for the update
+
+the host sends one byte per update, with the inputs in the bits given by pack_inputs()
+"""
+import struct
+
+from amaranth import *
+from amaranth.lib.fifo import AsyncFIFO
+
+try:
+    from .model import Game, INPUT_NAMES
+except ImportError:
+    from model import Game, INPUT_NAMES
+
+RECORD = struct.Struct("<HHHbBHHBBH")
+RECORD_FIELDS = ("frame", "pope_x", "pope_y_fixed", "pope_v_velocity", "flags", "paddle_location",
+    "enemy_paddle_location", "time_until_start", "scores", "lfsr")
+
+
+class Recorder(Elaboratable):
+    """
+    packs the state of a main.Top into a record on every update and queues its bytes, read them
+    from the fifo in the r_domain. a record is only started when all of it fits in the fifo,
+    otherwise it is dropped whole and the frame counter skips it
+    """
+    def __init__(self, top, stale=None, depth=64, r_domain="sync"):
+        self.top = top
+        self.stale = C(0, 1) if stale is None else stale
+        self.fifo = AsyncFIFO(width=8, depth=depth, r_domain=r_domain, w_domain="pix")
+
+        self.r_data = self.fifo.r_data
+        self.r_rdy = self.fifo.r_rdy
+        self.r_en = self.fifo.r_en
+
+    def elaborate(self, platform):
+        m = Module()
+        m.submodules.fifo = fifo = self.fifo
+        top = self.top
+
+        frame = Signal(16)
+        pope_v_velocity = top.pope_v_velocity
+        record = Cat(
+            frame,
+            top.pope_location[0:10], C(0, 6),
+            top.pope_location[10:22], C(0, 4),
+            pope_v_velocity, pope_v_velocity[-1],
+            top.pope_h_velocity, top.taken, self.stale, C(0, 1),
+            top.paddle_location, C(0, 6),
+            top.enemy_paddle_location, C(0, 6),
+            top.time_until_start,
+            top.player_score, C(0, 1), top.enemy_score, C(0, 1),
+            top.random,
+        )
+        assert len(record) == RECORD.size * 8
+
+        shift = Signal(len(record))
+        left = Signal(range(RECORD.size + 1))
+        m.d.comb += [
+            fifo.w_data.eq(shift[0:8]),
+            fifo.w_en.eq(left != 0),
+        ]
+        with m.If(fifo.w_en & fifo.w_rdy):
+            m.d.pix += [
+                shift.eq(shift[8:]),
+                left.eq(left - 1),
+            ]
+
+        with m.If(top.o_updated):
+            m.d.pix += frame.eq(frame + 1)
+            # the last record is long gone by the next update, unless the fifo is full
+            with m.If((left == 0) & (fifo.w_level <= fifo.depth - RECORD.size)):
+                m.d.pix += [
+                    shift.eq(record),
+                    left.eq(RECORD.size),
+                ]
+        return m
+
+
+class HostInputs(Elaboratable):
+    """
+    plays main.Top with inputs from the host instead of the buttons. the host writes one byte per
+    update into the fifo in the w_domain, and a byte is taken after every update. its buttons are
+    pushed for half a frame and then let go, so that only the next update sees them, and
+    player_two_active is held until the next byte. o_stale is set when there was no byte to take,
+    then the last inputs are pushed again
+    """
+    def __init__(self, top, depth=16, w_domain="sync"):
+        self.top = top
+        self.fifo = AsyncFIFO(width=8, depth=depth, r_domain="pix", w_domain=w_domain)
+
+        self.w_data = self.fifo.w_data
+        self.w_rdy = self.fifo.w_rdy
+        self.w_en = self.fifo.w_en
+
+        self.o_buttons = Signal(len(INPUT_NAMES))
+        # nothing has come from the host before the first update
+        self.o_stale = Signal(reset=1)
+
+    def elaborate(self, platform):
+        m = Module()
+        m.submodules.fifo = fifo = self.fifo
+
+        # half a frame is long past the debouncing, and long before the next update
+        press_clocks = self.top.mode.frame_clocks // 2
+        inputs = Signal(len(INPUT_NAMES))
+        pushed = Signal(range(press_clocks + 1))
+        m.d.comb += self.o_buttons.eq(Mux(pushed != 0, inputs, inputs & (1 << INPUT_NAMES.index("player_two_active"))))
+        with m.If(pushed != 0):
+            m.d.pix += pushed.eq(pushed - 1)
+
+        m.d.comb += fifo.r_en.eq(self.top.o_updated)
+        with m.If(self.top.o_updated):
+            m.d.pix += [
+                self.o_stale.eq(~fifo.r_rdy),
+                pushed.eq(press_clocks),
+            ]
+            with m.If(fifo.r_rdy):
+                m.d.pix += inputs.eq(fifo.r_data)
+        return m
+
+
+def pack_inputs(inputs):
+    """the byte for a dict of inputs, in the same bits as the inputs are on ui_in"""
+    return sum(bool(inputs.get(name)) << bit for bit, name in enumerate(INPUT_NAMES))
+
+
+def script_inputs(events):
+    """
+    returns a function of update number to inputs for (frame, name, value) events like sim.read_script
+    gives, every input keeps its value until it is changed again
+    """
+    events = sorted(events, key=lambda event: event[0])
+
+    def inputs(frame):
+        values = {}
+        for at, name, value in events:
+            if at > frame:
+                break
+            values[name] = bool(value)
+        return values
+    return inputs
+
+
+def bot_inputs(record):
+    """moves the player paddle towards the pope, from the last record the device sent"""
+    if record is None:
+        return {}
+    middle = record["paddle_location"] + 75 - 20
+    pope_y = record["pope_location"] >> 12
+    return {"move_up": pope_y < middle - 8, "move_down": pope_y > middle + 8}
+
+
+def decode(data):
+    """turns bytes made of whole records into a list of dicts, in the form of model.Game.registers() with the frame and the inputs"""
+    records = []
+    for values in RECORD.iter_unpack(data):
+        fields = dict(zip(RECORD_FIELDS, values))
+        flags = fields.pop("flags")
+        scores = fields.pop("scores")
+        record = {
+            "frame": fields.pop("frame"),
+            "pope_location": fields.pop("pope_x") | fields.pop("pope_y_fixed") << 10,
+            "pope_h_velocity": flags & 1,
+            **fields,
+            "player_score": scores & 0xf,
+            "enemy_score": scores >> 4,
+        }
+        record.update({name: bool(flags >> (1 + bit) & 1) for bit, name in enumerate(INPUT_NAMES)})
+        record["stale"] = bool(flags >> 6 & 1)
+        records.append(record)
+    return records
+
+
+def dropped(records, last_frame=None):
+    """the number of records missing from the frame counter, optionally counting from the record before the first one"""
+    missing = 0
+    for record in records:
+        if last_frame is not None:
+            missing += (record["frame"] - last_frame - 1) & 0xffff
+        last_frame = record["frame"]
+    return missing
+
+
+def check(records, mode):
+    """steps the model from every record with the inputs of the next one, returns the (record, expected) pairs that differ"""
+    mismatches = []
+    for previous, record in zip(records, records[1:]):
+        if (record["frame"] - previous["frame"]) & 0xffff != 1:
+            continue
+        game = Game(mode)
+        game.pope_x = previous["pope_location"] & 0x3ff
+        game.pope_y_fixed = previous["pope_location"] >> 10
+        for name in ("pope_h_velocity", "pope_v_velocity", "paddle_location", "enemy_paddle_location",
+                "time_until_start", "player_score", "enemy_score", "lfsr"):
+            setattr(game, name, previous[name])
+        # past the first update the lfsr always jumps by a whole frame
+        game.frame = 1
+        game.step(**{name: record[name] for name in INPUT_NAMES})
+        expected = game.registers()
+        if any(record[name] != value for name, value in expected.items()):
+            mismatches.append((record, expected))
+    return mismatches
+
+
+if __name__ == "__main__":
+    import argparse
+    from modes import MODES, add_mode_argument
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("log", help="a log of records written by the glasgow applet")
+    parser.add_argument("--check", action="store_true", help="replay the updates through the model")
+    add_mode_argument(parser)
+    args = parser.parse_args()
+
+    with open(args.log, "rb") as file:
+        data = file.read()
+    records = decode(data[:len(data) - len(data) % RECORD.size])
+    print(f"{len(records)} records ({len(records) / MODES[args.mode].refresh / 60:.1f} minutes), {dropped(records)} dropped")
+    if args.check:
+        mismatches = check(records, MODES[args.mode])
+        for record, expected in mismatches[:10]:
+            print(f"frame {record['frame']}: expected {expected}, got {record}")
+        print(f"{len(records) - 1} updates replayed, {len(mismatches)} mismatches")
+        if mismatches:
+            raise SystemExit(1)
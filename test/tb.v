@@ -6,12 +6,15 @@
 */
 module tb ();
 
-  // Dump the signals to a VCD file. You can view it with gtkwave.
+  // Dump the signals to a VCD file when built with VCD=yes. You can view it with gtkwave.
+  // A frame is 420000 clocks, so leave it off for long runs.
+`ifdef VCD
   initial begin
     $dumpfile("tb.vcd");
     $dumpvars(0, tb);
     #1;
   end
+`endif
 
   // Wire up the inputs and outputs:
   reg clk;
@@ -23,6 +26,10 @@ module tb ();
   wire [7:0] uio_out;
   wire [7:0] uio_oe;
 
+  // The VGA syncs, for the monitor in vga_monitor.py to wait on
+  wire hsync = uo_out[6];
+  wire vsync = uo_out[7];
+
   // Replace tt_um_example with your module name:
   tt_um_spacecat_chan_john_pong_the_second user_project (
 
@@ -1,21 +1,61 @@
 # SPDX-FileCopyrightText: © 2024 Tiny Tapeout
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import sys
+
+import numpy as np
+
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import ClockCycles
 
+from vga_monitor import CHECK_COLUMNS, HEIGHT, VgaMonitor
+
+# the bit exact game model and the golden renderer live next to the design
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import model
+import render
+
+GATES = os.environ.get("GATES") == "yes"
+# gate level outputs take a while to settle, so the clock is slower there
+PERIOD_NS = 100 if GATES else 40
+# the countdown alone takes 180 frames, the game only starts moving after it
+FRAMES = int(os.environ.get("FRAMES", 4 if GATES else 240))
+
+
+def ui_in(inputs):
+    # the inputs are on ui_in in the same order as model.INPUT_NAMES
+    return sum(bool(inputs.get(name)) << bit for bit, name in enumerate(model.INPUT_NAMES))
+
+
+def scripted_inputs(frame):
+    """moves both paddles around in turns of 16 frames, with and without player two"""
+    return [
+        {"move_up": True},
+        {"move_down": True},
+        {"player_two_active": True, "player_two_up": True},
+        {"player_two_active": True, "player_two_down": True},
+        {"move_up": True, "move_down": True, "player_two_up": True},
+        {},
+    ][frame // 16 % 6]
 
-@cocotb.test()
-async def test_project(dut):
-    dut._log.info("Start")
 
-    # Set the clock period to 10 us (100 KHz)
-    clock = Clock(dut.clk, 10, units="us")
+def describe(samples):
+    """the paddle tops, scores and countdown colour in a frame of samples from CHECK_COLUMNS"""
+    def top(column):
+        white = np.flatnonzero(np.all(samples[:, column] == 7, axis=-1))
+        return int(white[0]) if len(white) else None
+    player_score = int(~samples[60, 1, 1] & 7)
+    enemy_score = int(~samples[60, 3, 1] & 7)
+    return (f"paddles at {top(0)} and {top(4)}, score {player_score}:{enemy_score}, "
+        f"countdown {tuple(int(channel) for channel in samples[150, 2])}")
+
+
+async def start(dut):
+    clock = Clock(dut.clk, PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
 
-    # Reset
-    dut._log.info("Reset")
     dut.ena.value = 1
     dut.ui_in.value = 0
     dut.uio_in.value = 0
@@ -23,17 +63,46 @@ async def test_project(dut):
     await ClockCycles(dut.clk, 10)
     dut.rst_n.value = 1
 
-    dut._log.info("Test project behavior")
 
-    # Set the input values you want to test
-    dut.ui_in.value = 20
-    dut.uio_in.value = 30
+async def check_frames(dut, frames, inputs):
+    """
+    play frames with inputs (a function of the frame number), and compare every frame with what
+    the model says the game looks like. the model and the design both start from reset
+    """
+    monitor = VgaMonitor(dut, PERIOD_NS)
+    game = model.Game()
+    columns = list(CHECK_COLUMNS)
+
+    def set_inputs(inputs):
+        dut.ui_in.value = ui_in(inputs)
+
+    # nothing is pressed for the first update, it happens before the monitor has seen a whole frame
+    game.step()
+    for frame in range(1, frames + 1):
+        # the buttons for the next update are pushed at the top of the frame and let go halfway down,
+        # the design remembers them until the update. player_two_active is a switch and stays put
+        frame_inputs = inputs(frame)
+        held = {"player_two_active": frame_inputs.get("player_two_active")}
+        samples = await monitor.frame({
+            0: lambda: set_inputs(frame_inputs),
+            HEIGHT // 2: lambda: set_inputs(held),
+        })
 
-    # Wait for one clock cycle to see the output values
-    await ClockCycles(dut.clk, 1)
+        expected = render.render(game.vga_inputs())[:, columns]
+        mismatches = np.count_nonzero(np.any(samples != expected, axis=-1))
+        assert mismatches == 0, (f"frame {frame}: {mismatches} pixels differ, "
+            f"expected {describe(expected)}, got {describe(samples)}")
+        dut._log.debug(f"frame {frame}: {describe(samples)}")
+        game.step(**frame_inputs)
 
-    # The following assersion is just an example of how to check the output values.
-    # Change it to match the actual expected output of your module:
 
-    # Keep testing the module by changing the input values, waiting for
-    # one or more clock cycles, and asserting the expected output values.
+@cocotb.test()
+async def test_countdown(dut):
+    await start(dut)
+    await check_frames(dut, 4, lambda frame: {})
+
+
+@cocotb.test()
+async def test_game(dut):
+    await start(dut)
+    await check_frames(dut, FRAMES, scripted_inputs)
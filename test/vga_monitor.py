@@ -0,0 +1,84 @@
+import numpy as np
+
+from cocotb.triggers import FallingEdge, RisingEdge, Timer
+
+WIDTH = 640
+HEIGHT = 480
+
+# a column through each paddle, each score box and the countdown box
+CHECK_COLUMNS = (37, 112, 320, 527, 602)
+
+
+class VgaMonitor:
+    """
+    follows the vga output of tb (uo_out[6] is hsync, uo_out[7] is vsync) and samples some columns
+    of every visible line into a preallocated (480, columns, 3) array of 3 bit (r, g, b) values.
+
+    the monitor locks onto the first falling edge of vsync, from then on it knows where the beam is
+    and only wakes up for the pixels it samples, in the middle of their clock. the syncs are checked
+    once a frame to make sure the timing still holds
+    """
+    def __init__(self, dut, period_ns, columns=CHECK_COLUMNS, hfront=16, hsync=96, hback=48, vfront=10, vsync=2, vback=33):
+        self.dut = dut
+        self.period_ns = period_ns
+        self.columns = tuple(columns)
+        self.line_length = WIDTH + hfront + hsync + hback
+        self.screen_length = HEIGHT + vfront + vsync + vback
+        self.hsync_start = WIDTH + hfront
+        self.vsync_start = HEIGHT + vfront
+
+        self.pixels = np.zeros((HEIGHT, len(self.columns), 3), dtype=np.uint8)
+        # the pixel clock of the frame that the beam is on at the current sample, None until locked
+        self._clock = None
+
+    async def lock(self):
+        await FallingEdge(self.dut.vsync)
+        await RisingEdge(self.dut.clk)
+        # gate level outputs settle some time after the edge, so samples are taken in the middle of the clock
+        await Timer(self.period_ns // 2, "ns")
+        # vsync fell when the beam got to the start of line vsync_start, it's one clock further now
+        self._clock = self.vsync_start * self.line_length + 1
+
+    async def _goto(self, clock):
+        """wait until the beam is at a pixel clock of the frame, returns (uo_out, uio_out) there"""
+        steps = (clock - self._clock) % (self.line_length * self.screen_length)
+        if steps:
+            await Timer(steps * self.period_ns, "ns")
+        self._clock = clock
+        return self.dut.uo_out.value.integer, self.dut.uio_out.value.integer
+
+    async def _check_syncs(self):
+        """
+        check that hsync falls at the start of hsync on the last line before vsync, and that vsync
+        falls at the start of vsync. this leaves the beam on the clock the game updates on, so that
+        inputs set right after still make it into the update
+        """
+        line = (self.vsync_start - 1) * self.line_length
+        before, _ = await self._goto(line + self.hsync_start - 1)
+        during, _ = await self._goto(line + self.hsync_start)
+        if not (before >> 6 & 1 and not during >> 6 & 1 and during >> 7 & 1):
+            raise AssertionError(f"lost the vga timing, uo_out went from {before:08b} to {during:08b} at the start of hsync")
+        before, _ = await self._goto(line + self.line_length - 1)
+        during, _ = await self._goto(line + self.line_length)
+        if not (before >> 7 & 1 and not during >> 7 & 1):
+            raise AssertionError(f"lost the vga timing, uo_out went from {before:08b} to {during:08b} at the start of vsync")
+
+    async def frame(self, events=None):
+        """
+        sample the next frame that starts and return on the first clock of vsync after it, just before
+        the game update. returns the array of samples, which is reused by the next frame. events maps
+        line numbers to functions that are called when the beam gets to the start of that line
+        """
+        if self._clock is None:
+            await self.lock()
+        events = events or {}
+        pixels = self.pixels
+        for y in range(HEIGHT):
+            if y in events:
+                await self._goto(y * self.line_length)
+                events[y]()
+            for index, x in enumerate(self.columns):
+                uo_out, uio_out = await self._goto(y * self.line_length + x)
+                pixels[y, index] = (uo_out & 7, uo_out >> 3 & 7, uio_out & 7)
+        await self._check_syncs()
+        return pixels
@@ -0,0 +1,28 @@
+"""
+the constants the trig units in ray_march.py are built from, kept apart from amaranth and numpy so
+that the gateware and the bit exact model in cordic_model.py both use these and can't drift apart
+"""
+from math import atan2, radians, sin
+
+# the 3.16 angles the fold into the first quadrant works with
+TWO_PI = int(radians(360) * 2**16)
+PI = int(radians(180) * 2**16)
+HALF_PI = int(radians(90) * 2**16)
+
+
+def cordic_gain(iterations):
+    """the output scale that undoes the gain of the rotations, in 1/256ths, so 155 for 19 iterations"""
+    gain = 1.0
+    for i in range(iterations):
+        gain *= (1 + 4.0**-i) ** 0.5
+    return round(2**8 / gain)
+
+
+def atan_table(count, fraction):
+    """atan(2**-i) for the first count rotations, with fraction fractional bits"""
+    return [int(atan2(1, 2**i) * 2**fraction) for i in range(count)]
+
+
+def sine_table(shift):
+    """the quarter wave of a SineTable, entries 2**shift apart from 0 to past pi/2 so that the last one interpolates to something"""
+    return [round(sin(index * 2**shift / 2**16) * 2**16) for index in range((HALF_PI >> shift) + 2)]
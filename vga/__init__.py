@@ -7,18 +7,29 @@ from ....gateware.pll import *
 from ... import *
 
 from ..main import Top
+from ..modes import MODES, add_mode_argument
+from ..model import random_inputs
+from ..sim import read_script
+from ..telemetry import RECORD, Recorder, HostInputs, decode, dropped, pack_inputs, script_inputs, bot_inputs
 
 class BoilerplateSubtarget(Elaboratable):
-    def __init__(self, pads, in_fifo, out_fifo):
+    def __init__(self, pads, in_fifo, out_fifo, mode, host_inputs=False):
         self.pads     = pads
         self.in_fifo  = in_fifo
         self.out_fifo = out_fifo
+        self.mode     = mode
+        self.host_inputs = host_inputs
 
     def elaborate(self, platform):
         m = Module()
         m.domains.pix = cd_pix = ClockDomain(reset_less=True)
-        m.submodules += PLL(f_in=platform.default_clk_frequency, f_out=25175000, odomain="pix")
-        m.submodules.vga = self.vga = Top()
+        m.submodules += PLL(f_in=platform.default_clk_frequency, f_out=self.mode.pixel_clock, odomain="pix")
+        m.submodules.vga = self.vga = Top(mode=self.mode)
+        if self.host_inputs:
+            m.submodules.inputs = inputs = HostInputs(self.vga)
+            m.submodules.recorder = recorder = Recorder(self.vga, stale=inputs.o_stale)
+        else:
+            m.submodules.recorder = recorder = Recorder(self.vga)
 
         m.d.comb += [
             self.pads.r0_t.o.eq(self.vga.o_r[0]),
@@ -43,11 +54,31 @@ class BoilerplateSubtarget(Elaboratable):
             self.pads.hsync_t.oe.eq(1),
             self.pads.vsync_t.o.eq(self.vga.o_vsync),
             self.pads.vsync_t.oe.eq(1),
-            self.vga.i_move_down.eq(self.pads.down_t.i),
-            self.vga.i_move_up.eq(self.pads.up_t.i),
-            self.vga.i_player_two_down.eq(self.pads.p2_down_t.i),
-            self.vga.i_player_two_up.eq(self.pads.p2_up_t.i),
-            self.vga.i_player_two_active.eq(self.pads.p2_active_t.i),
+        ]
+
+        if self.host_inputs:
+            # the host plays instead of the buttons, one byte per update
+            m.d.comb += [
+                inputs.w_data.eq(self.out_fifo.r_data),
+                inputs.w_en.eq(self.out_fifo.r_rdy),
+                self.out_fifo.r_en.eq(inputs.w_rdy),
+                Cat(self.vga.i_move_up, self.vga.i_move_down, self.vga.i_player_two_up, self.vga.i_player_two_down,
+                    self.vga.i_player_two_active).eq(inputs.o_buttons),
+            ]
+        else:
+            m.d.comb += [
+                self.vga.i_move_down.eq(self.pads.down_t.i),
+                self.vga.i_move_up.eq(self.pads.up_t.i),
+                self.vga.i_player_two_down.eq(self.pads.p2_down_t.i),
+                self.vga.i_player_two_up.eq(self.pads.p2_up_t.i),
+                self.vga.i_player_two_active.eq(self.pads.p2_active_t.i),
+            ]
+
+        # a record of the game state goes to the host after every update
+        m.d.comb += [
+            self.in_fifo.w_data.eq(recorder.r_data),
+            self.in_fifo.w_en.eq(recorder.r_rdy),
+            recorder.r_en.eq(self.in_fifo.w_rdy),
         ]
 
         return m
@@ -77,6 +108,8 @@ class VgaApplet(GlasgowApplet):
 
         for pin in cls.__pins:
             access.add_pin_argument(parser, pin, default=True)
+        add_mode_argument(parser)
+        parser.add_argument("--host-inputs", action="store_true", help="play with inputs sent by the host instead of the buttons")
 
     def build(self, target, args):
         self.mux_interface = iface = target.multiplexer.claim_interface(self, args)
@@ -84,6 +117,8 @@ class VgaApplet(GlasgowApplet):
             pads=iface.get_pads(args, pins=self.__pins),
             in_fifo=iface.get_in_fifo(),
             out_fifo=iface.get_out_fifo(),
+            mode=MODES[args.mode],
+            host_inputs=args.host_inputs,
         ))
 
     @classmethod
@@ -95,10 +130,88 @@ class VgaApplet(GlasgowApplet):
 
     @classmethod
     def add_interact_arguments(cls, parser):
-        pass
+        parser.add_argument("--log", metavar="FILE", help="append the game state after every update to FILE, see telemetry.py")
+        parser.add_argument("--batch", type=int, default=60, metavar="RECORDS", help="records to read from the device at once, use 1 with --bot")
+        # with --host-inputs
+        parser.add_argument("--script", metavar="FILE", help="play the inputs from a script, one \"FRAME NAME=VALUE\" per line like sim.py takes")
+        parser.add_argument("--bot", action="store_true", help="play by following the pope with the player paddle")
+        parser.add_argument("--seed", type=int, default=0, help="seed for the random inputs that are played otherwise")
+        parser.add_argument("--lead", type=int, default=4, metavar="UPDATES", help="inputs to keep queued ahead of the device")
+        parser.add_argument("--frames", type=int, metavar="UPDATES", help="stop after playing this many updates")
 
     async def interact(self, device, args, iface):
-        pass
+        if args.log is None and not args.host_inputs:
+            return
+        stats = {"records": 0, "dropped": 0, "stale": 0}
+        latest = {"record": None}
+        reported = asyncio.Event()
+
+        async def read_records(file):
+            # glasgow keeps reading from the device in the background, so a batch only has to be
+            # written out before the next one is ready
+            last_frame = None
+            while True:
+                data = await iface.read(RECORD.size * args.batch)
+                if file is not None:
+                    file.write(data)
+                    file.flush()
+                batch = decode(data)
+                batch_missing = dropped(batch, last_frame)
+                last_frame = batch[-1]["frame"]
+                stats["records"] += len(batch)
+                stats["dropped"] += batch_missing
+                stats["stale"] += sum(record["stale"] for record in batch)
+                latest["record"] = batch[-1]
+                reported.set()
+                if batch_missing:
+                    self.logger.warning("%d records dropped, %d out of %d so far",
+                        batch_missing, stats["dropped"], stats["records"] + stats["dropped"])
+                else:
+                    self.logger.debug("%d records logged", stats["records"])
+
+        async def write_inputs():
+            if args.bot:
+                inputs = lambda frame: bot_inputs(latest["record"])
+            elif args.script:
+                inputs = script_inputs(read_script(args.script))
+            else:
+                inputs = random_inputs(args.seed)
+            sent = 0
+            while args.frames is None or sent < args.frames:
+                # the device takes a byte on every update that isn't stale, the writes stay --lead
+                # updates ahead of that so usb never holds it up
+                taken = stats["records"] + stats["dropped"] - stats["stale"]
+                count = taken + args.lead - sent
+                if args.frames is not None:
+                    count = min(count, args.frames - sent)
+                if count <= 0:
+                    reported.clear()
+                    await reported.wait()
+                    continue
+                await iface.write(bytes(pack_inputs(inputs(frame)) for frame in range(sent, sent + count)))
+                await iface.flush()
+                sent += count
+            # wait for the last inputs to be played
+            while stats["records"] + stats["dropped"] - stats["stale"] < sent:
+                reported.clear()
+                await reported.wait()
+
+        file = open(args.log, "ab") if args.log else None
+        reader = asyncio.ensure_future(read_records(file))
+        try:
+            if args.host_inputs:
+                await write_inputs()
+            else:
+                await reader
+        finally:
+            reader.cancel()
+            if file is not None:
+                file.close()
+            updates = stats["records"] + stats["dropped"]
+            self.logger.info("%d updates, %d records dropped", updates, stats["dropped"])
+            if args.host_inputs:
+                self.logger.info("%d updates without fresh inputs (%.2f%%)",
+                    stats["stale"], 100 * stats["stale"] / max(stats["records"], 1))
 
 # -------------------------------------------------------------------------------------------------
 